@@ -0,0 +1,331 @@
+"""
+Benchmark every generator and the CSV writer at several scales.
+
+Every case runs in a fresh interpreter, so peak memory is not skewed by
+earlier cases. The results are printed, optionally written as JSON, and
+compared against a stored baseline, in which case the exit status is 1
+when a case got slower or used more memory than the tolerance allows.
+
+    python benchmarks/generators.py [--scales 1000 100000 1000000]
+        [--cases cars bids ...] [--output results.json]
+        [--baseline benchmarks/baseline.json] [--tolerance 0.25]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_SCALES = [1_000, 100_000, 1_000_000]
+
+# Rows of the parent tables that fact table cases refer to
+PARENT_ROWS = 10_000
+
+# Baseline cases faster than this are too noisy to compare speeds
+MIN_COMPARE_SECONDS = 0.05
+
+CASES = [
+    "body_types",
+    "manufactures",
+    "car_models",
+    "locations",
+    "cars",
+    "name",
+    "customer",
+    "advertisement",
+    "bids",
+    "list_to_csv",
+]
+
+
+def synthetic_car_data(n_models: int, n_body_types: int = None) -> dict:
+    """
+    Build a car data dictionary with `n_models` models.
+
+    Args:
+        n_models (int): The number of models.
+        n_body_types (int, optional): The number of body types. Defaults
+                                      to the body types of
+                                      PASSENGER_CAPACITY.
+
+    Returns:
+        dict: Car data in the shape of `main.car_data`.
+    """
+    from create_dummy import PASSENGER_CAPACITY
+
+    if n_body_types is None:
+        body_types = list(PASSENGER_CAPACITY)
+    else:
+        body_types = [f"Body {i}" for i in range(n_body_types)]
+    data = {}
+    for i in range(n_models):
+        data.setdefault(body_types[i % len(body_types)], {})[f"Model {i}"] = {
+            "pabrikan": f"Brand {i % 97}",
+            "tahun": [2015, 2018, 2021],
+            "harga": [150_000_000, 200_000_000, 250_000_000],
+            "kapasitas_mesin": 1.5,
+        }
+    return data
+
+
+def synthetic_cities(n_cities: int) -> dict:
+    """
+    Build a city dictionary in the shape returned by `xlsx_to_dict`.
+
+    Args:
+        n_cities (int): The number of cities.
+
+    Returns:
+        dict: City ID -> city details.
+    """
+    return {
+        i: {"nama_kota": f"Kota {i}", "latitude": -6.2, "longitude": 106.8}
+        for i in range(1, n_cities + 1)
+    }
+
+
+def prepare(case: str, n_rows: int):
+    """
+    Set up a case outside of the measurement.
+
+    Args:
+        case (str): One of CASES.
+        n_rows (int): The number of rows to generate.
+
+    Returns:
+        function: Runs the measured work when called.
+    """
+    import create_dummy as cd
+    import main
+
+    if case == "body_types":
+        data = synthetic_car_data(n_rows, n_body_types=n_rows)
+        return lambda: cd.generate_body_types(data, is_printed=False)
+    if case == "manufactures":
+        data = synthetic_car_data(n_rows)
+        return lambda: cd.generate_manufactures(data, is_printed=False)
+    if case == "car_models":
+        data = synthetic_car_data(n_rows)
+        manufactures = cd.generate_manufactures(data, is_printed=False)
+        return lambda: cd.generate_car_models(data, manufactures, is_printed=False)
+    if case == "locations":
+        cities = synthetic_cities(n_rows)
+        return lambda: cd.generate_locations(cities, is_printed=False)
+    if case == "name":
+        return lambda: cd.generate_name(n_rows)
+
+    locations = cd.generate_locations(synthetic_cities(100), is_printed=False)
+    if case == "customer":
+        return lambda: cd.generate_customer(locations, n_rows, is_printed=False)
+
+    data = main.car_data
+    body_types = cd.generate_body_types(data, is_printed=False)
+    manufactures = cd.generate_manufactures(data, is_printed=False)
+    car_models = cd.generate_car_models(data, manufactures, is_printed=False)
+    catalog = cd.build_catalog(data, manufactures, body_types, car_models)
+    text_pool = cd.build_text_pool()
+
+    def cars(n_data):
+        return cd.generate_cars(
+            data,
+            manufactures,
+            body_types,
+            car_models,
+            n_data,
+            is_printed=False,
+            catalog=catalog,
+            text_pool=text_pool,
+        )
+
+    if case == "cars":
+        return lambda: cars(n_rows)
+
+    customers = cd.generate_customer(locations, PARENT_ROWS, is_printed=False)
+
+    def advertisement(n_data, cars_table):
+        return cd.generate_advertisement(
+            data,
+            customers,
+            cars_table,
+            car_models,
+            n_data,
+            is_printed=False,
+            catalog=catalog,
+            text_pool=text_pool,
+        )
+
+    cars_table = cars(PARENT_ROWS)
+    if case == "advertisement":
+        return lambda: advertisement(n_rows, cars_table)
+
+    ads = advertisement(PARENT_ROWS, cars_table)
+    if case == "bids":
+        return lambda: cd.generate_bids(ads, customers, n_rows, is_printed=False)
+
+    if case == "list_to_csv":
+        bids = cd.generate_bids(ads, customers, n_rows, is_printed=False)
+        folder = tempfile.mkdtemp()
+
+        def write():
+            cd.list_to_csv(bids, folder, "bid.csv", ["a", "b", "c", "d", "e"])
+            os.remove(os.path.join(folder, "bid.csv"))
+
+        return write
+
+    raise ValueError(f"Unknown case '{case}'.")
+
+
+def child(case: str, n_rows: int):
+    """
+    Measure one case and print the result as JSON.
+
+    Args:
+        case (str): One of CASES.
+        n_rows (int): The number of rows to generate.
+    """
+    import random
+
+    import create_dummy
+    from profiling import peak_rss, reset_peak_rss
+
+    random.seed(0)
+    run = prepare(case, n_rows)
+    create_dummy.get_fake()  # Leave the one-off Faker start-up out
+
+    reset_peak_rss()
+    baseline_rss = peak_rss()
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+
+    print(
+        json.dumps(
+            {
+                "case": case,
+                "rows": n_rows,
+                "seconds": seconds,
+                "rows_per_sec": n_rows / seconds if seconds else None,
+                "peak_memory_mb": (peak_rss() - baseline_rss) / 2**20,
+            }
+        )
+    )
+
+
+def run(case: str, n_rows: int) -> dict:
+    """
+    Run one case in a fresh interpreter.
+
+    Args:
+        case (str): One of CASES.
+        n_rows (int): The number of rows to generate.
+
+    Returns:
+        dict: The measurement.
+    """
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", case, str(n_rows)],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def compare(results: list, baseline: dict, tolerance: float) -> list:
+    """
+    Find the cases that regressed against a baseline.
+
+    Args:
+        results (list): The current measurements.
+        baseline (dict): A results document written by `--output`.
+        tolerance (float): The allowed relative slowdown or memory growth.
+
+    Returns:
+        list: One message per regression.
+    """
+    previous = {(r["case"], r["rows"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = previous.get((result["case"], result["rows"]))
+        if old is None:
+            continue
+        label = f"{result['case']} @ {result['rows']:,}"
+        if old["seconds"] >= MIN_COMPARE_SECONDS and result["rows_per_sec"] < old[
+            "rows_per_sec"
+        ] * (1 - tolerance):
+            regressions.append(
+                f"{label}: {result['rows_per_sec']:,.0f} rows/sec, "
+                f"baseline {old['rows_per_sec']:,.0f}"
+            )
+        # Allow a few MiB of noise on small cases
+        if result["peak_memory_mb"] > old["peak_memory_mb"] * (1 + tolerance) + 4:
+            regressions.append(
+                f"{label}: {result['peak_memory_mb']:.1f} MiB peak, "
+                f"baseline {old['peak_memory_mb']:.1f} MiB"
+            )
+    return regressions
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", nargs="+", type=int, default=DEFAULT_SCALES)
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=CASES)
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare against this JSON file.")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, ROOT)
+    if args.child:
+        child(args.child[0], int(args.child[1]))
+        return 0
+
+    results = []
+    print(f"{'case':<14} {'rows':>10} {'seconds':>9} {'rows/sec':>12} {'peak MiB':>9}")
+    for case in args.cases:
+        for n_rows in args.scales:
+            result = run(case, n_rows)
+            results.append(result)
+            print(
+                f"{case:<14} {n_rows:>10,} {result['seconds']:>9.3f} "
+                f"{result['rows_per_sec']:>12,.0f} {result['peak_memory_mb']:>9.1f}"
+            )
+
+    if args.output:
+        with open(args.output, mode="w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "created": datetime.now().isoformat(timespec="seconds"),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "processor": platform.processor() or platform.machine(),
+                    "cpus": os.cpu_count(),
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline}.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
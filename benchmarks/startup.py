@@ -0,0 +1,145 @@
+"""
+Measure the import-to-first-row latency of a fresh interpreter.
+
+Every run starts a new Python process, imports `main` (and with it
+`create_dummy`, `parallel` and `sinks`) and generates a single row of one
+table, as a worker process or a short seeding job would.
+
+    python benchmarks/startup.py [--repeat N] [--tables cars user bid]
+"""
+
+import argparse
+import importlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that create_dummy imports on first use only
+LAZY_MODULES = ["faker", "openpyxl", "tabulate"]
+
+STARTUP_TABLES = ["cars", "user", "bid"]
+
+
+def first_row(table: str):
+    """
+    Generate the first row of a table with as little setup as possible.
+
+    Args:
+        table (str): "cars", "user" or "bid".
+
+    Returns:
+        tuple: The first row.
+    """
+    import main
+    from create_dummy import (
+        build_ad_view,
+        build_catalog,
+        generate_locations,
+        generate_manufactures,
+        iter_bids,
+        iter_cars,
+        iter_customer,
+        xlsx_to_dict,
+    )
+
+    if table == "cars":
+        manufactures = generate_manufactures(main.car_data, is_printed=False)
+        catalog = build_catalog(main.car_data, manufactures)
+        chunks = iter_cars(main.car_data, None, None, None, 1, 1, catalog=catalog)
+    elif table == "user":
+        locations = generate_locations(
+            xlsx_to_dict(os.path.join(ROOT, "city.xlsx"), "city"), is_printed=False
+        )
+        chunks = iter_customer(locations, 1, 1)
+    else:
+        ads = [(1, 1, "", 100_000_000, "", 1, datetime.now())]
+        chunks = iter_bids(None, [(1,), (2,)], 1, 1, ad_view=build_ad_view(ads))
+    return next(chunks)[0]
+
+
+def child(table: str):
+    """
+    Time one import and first row, and print the result as JSON.
+
+    Args:
+        table (str): The table to generate.
+    """
+    start = time.perf_counter()
+    importlib.import_module("main")
+
+    imported = time.perf_counter()
+    lazy_loaded = [module for module in LAZY_MODULES if module in sys.modules]
+
+    first_row(table)
+    done = time.perf_counter()
+
+    print(
+        json.dumps(
+            {
+                "import": imported - start,
+                "first_row": done - start,
+                "loaded_at_import": lazy_loaded,
+            }
+        )
+    )
+
+
+def run(table: str) -> dict:
+    """
+    Run one measurement in a fresh interpreter.
+
+    Args:
+        table (str): The table to generate.
+
+    Returns:
+        dict: The child's timings plus the process wall time in "process".
+    """
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", table],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    result["process"] = time.perf_counter() - start
+    return result
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--tables", nargs="+", choices=STARTUP_TABLES, default=STARTUP_TABLES
+    )
+    parser.add_argument("--child", choices=STARTUP_TABLES, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, ROOT)
+    if args.child:
+        child(args.child)
+        return
+
+    print(f"{'table':<6} {'import':>10} {'first row':>10} {'process':>10}  lazy")
+    for table in args.tables:
+        results = [run(table) for _ in range(args.repeat)]
+        median = {
+            key: statistics.median(result[key] for result in results) * 1000
+            for key in ("import", "first_row", "process")
+        }
+        loaded = ", ".join(results[0]["loaded_at_import"]) or "-"
+        print(
+            f"{table:<6} {median['import']:>8.1f}ms {median['first_row']:>8.1f}ms "
+            f"{median['process']:>8.1f}ms  loaded at import: {loaded}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+import sys
+
+import numpy as np
+
+# Rows decoded at a time when a table is iterated row by row
+ROW_CHUNK_SIZE = 10_000
+
+
+def _code_dtype(n_categories: int) -> np.dtype:
+    """
+    Pick the smallest unsigned integer type for dictionary codes.
+
+    Args:
+        n_categories (int): The number of distinct values.
+
+    Returns:
+        numpy.dtype: uint8, uint16, uint32 or uint64.
+    """
+    return np.min_scalar_type(max(n_categories - 1, 0))
+
+
+class ColumnTable:
+    """
+    A table stored column by column in compact buffers.
+
+    Columns with a NumPy dtype (IDs, counts, timestamps) are kept as they
+    are. All other columns, whose values are Python objects such as
+    strings or nullable numbers, are dictionary-encoded: the table stores
+    one small unsigned code per row plus the array of distinct values.
+    Repeated strings like "automatic" then cost one or two bytes per row
+    instead of a pointer plus a boxed value in every row tuple.
+
+    Rows are only assembled into tuples when the table is iterated, one
+    chunk at a time, so writers that take chunks of rows consume it as
+    they consume the `iter_*` generators.
+    """
+
+    def __init__(self, columns: dict, categories: dict = None):
+        """
+        Args:
+            columns (dict): Column name -> NumPy array, in row order. For
+                            dictionary-encoded columns, the array holds
+                            the codes.
+            categories (dict, optional): Column name -> object array of
+                                         the distinct values of each
+                                         dictionary-encoded column.
+        """
+        self.columns = columns
+        self.categories = categories or {}
+
+    @classmethod
+    def from_column_chunks(cls, chunks, names: list = None) -> "ColumnTable":
+        """
+        Build a table from chunks of columns, encoding them as they arrive.
+
+        Args:
+            chunks (iterable): Dictionaries mapping column names to NumPy
+                               arrays or lists, e.g. from `iter_car_columns`.
+            names (list, optional): The column names, so that a table
+                                    without chunks still has its columns.
+
+        Returns:
+            ColumnTable: The table.
+        """
+        pieces = {name: [] for name in names or []}
+        encoders = {}
+        for chunk in chunks:
+            for name, values in chunk.items():
+                if isinstance(values, np.ndarray) and values.dtype != object:
+                    pieces.setdefault(name, []).append(values)
+                    continue
+                index = encoders.setdefault(name, {})
+                codes = [index.setdefault(value, len(index)) for value in values]
+                pieces.setdefault(name, []).append(np.array(codes, dtype=np.int64))
+
+        columns = {}
+        categories = {}
+        for name, arrays in pieces.items():
+            if name in encoders:
+                values = np.empty(len(encoders[name]), dtype=object)
+                values[:] = list(encoders[name])
+                categories[name] = values
+                dtype = _code_dtype(len(values))
+                columns[name] = np.concatenate(arrays).astype(dtype)
+            else:
+                columns[name] = (
+                    np.concatenate(arrays) if arrays else np.empty(0, dtype=np.int64)
+                )
+        return cls(columns, categories)
+
+    @classmethod
+    def from_rows(cls, rows: list, names: list) -> "ColumnTable":
+        """
+        Build a table from row tuples.
+
+        Args:
+            rows (list): A list of tuples.
+            names (list): The column names, in row order.
+
+        Returns:
+            ColumnTable: The table.
+        """
+        chunks = []
+        for start in range(0, len(rows), ROW_CHUNK_SIZE):
+            values = zip(*rows[start : start + ROW_CHUNK_SIZE])
+            chunks.append(dict(zip(names, values)))
+        return cls.from_column_chunks(chunks, names)
+
+    @classmethod
+    def concat(cls, tables: list) -> "ColumnTable":
+        """
+        Concatenate tables with the same columns, merging their dictionaries.
+
+        A column that is dictionary-encoded in some tables but not in
+        others is decoded to the NumPy dtype of the others when its values
+        allow, and dictionary-encoded everywhere otherwise.
+
+        Args:
+            tables (list): ColumnTable objects, e.g. one per shard.
+
+        Returns:
+            ColumnTable: The rows of all tables, in order.
+        """
+        if not tables:
+            return cls({})
+        # Empty tables carry no values, and maybe not the right dtypes
+        tables = [table for table in tables if len(table)] or tables[:1]
+
+        columns = {}
+        categories = {}
+        for name in tables[0].names:
+            plain = [table for table in tables if name not in table.categories]
+            if plain:
+                dtype = plain[0].columns[name].dtype
+                try:
+                    columns[name] = np.concatenate(
+                        [table.column(name).astype(dtype) for table in tables]
+                    )
+                    continue
+                except (TypeError, ValueError):
+                    pass  # E.g. None values in an integer column
+
+            # Map the codes of every table onto one merged dictionary
+            index = {}
+            arrays = []
+            for table in tables:
+                if name in table.categories:
+                    values = table.categories[name].tolist()
+                    codes = table.columns[name]
+                else:
+                    unique, codes = np.unique(table.columns[name], return_inverse=True)
+                    values = unique.tolist()
+                mapping = np.array(
+                    [index.setdefault(value, len(index)) for value in values],
+                    dtype=np.int64,
+                )
+                arrays.append(mapping[codes])
+            values = np.empty(len(index), dtype=object)
+            values[:] = list(index)
+            categories[name] = values
+            columns[name] = np.concatenate(arrays).astype(_code_dtype(len(values)))
+        return cls(columns, categories)
+
+    @property
+    def names(self) -> list:
+        """list: The column names, in row order."""
+        return list(self.columns)
+
+    @property
+    def nbytes(self) -> int:
+        """int: The approximate memory used by the table, in bytes."""
+        n_bytes = sum(array.nbytes for array in self.columns.values())
+        for values in self.categories.values():
+            n_bytes += values.nbytes + sum(map(sys.getsizeof, values.tolist()))
+        return n_bytes
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def column(self, name: str, index=None) -> np.ndarray:
+        """
+        Get the decoded values of a column.
+
+        Args:
+            name (str): The column name.
+            index (optional): Row positions or a slice to take. Defaults
+                              to the whole column.
+
+        Returns:
+            numpy.ndarray: The values; an object array for
+                           dictionary-encoded columns.
+        """
+        values = self.columns[name]
+        if index is not None:
+            values = values[index]
+        if name in self.categories:
+            return self.categories[name][values]
+        return values
+
+    def __getitem__(self, position: int) -> tuple:
+        """Assemble a single row, e.g. `table[0]` or `table[-1]`."""
+        values = (self.column(name, position) for name in self.columns)
+        return tuple(
+            value.item() if isinstance(value, np.generic) else value for value in values
+        )
+
+    def chunks(self, chunk_size: int = ROW_CHUNK_SIZE):
+        """
+        Assemble the rows in chunks, like the `iter_*` generators yield them.
+
+        Args:
+            chunk_size (int, optional): The maximum number of rows per
+                                        chunk. Defaults to ROW_CHUNK_SIZE.
+
+        Yields:
+            list: A list of tuples of Python values.
+        """
+        for start in range(0, len(self), chunk_size):
+            window = slice(start, start + chunk_size)
+            yield list(
+                zip(*(self.column(name, window).tolist() for name in self.columns))
+            )
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from chunk
+
+
+def table_column(table, position: int) -> np.ndarray:
+    """
+    Get one column of a list of row tuples or of a ColumnTable.
+
+    Args:
+        table (list or ColumnTable): The table.
+        position (int): The position of the column in a row.
+
+    Returns:
+        numpy.ndarray: The values of the column. For a list of rows, an
+                       object array of the very same values, so that rows
+                       built from it share them instead of copying them.
+    """
+    if isinstance(table, ColumnTable):
+        return table.column(table.names[position])
+    values = np.empty(len(table), dtype=object)
+    values[:] = [row[position] for row in table]
+    return values
+
+
+def table_codes(table, position: int) -> tuple:
+    """
+    Get one column of a list of row tuples or of a ColumnTable,
+    dictionary-encoded.
+
+    Args:
+        table (list or ColumnTable): The table.
+        position (int): The position of the column in a row.
+
+    Returns:
+        tuple: (codes, values), NumPy arrays such that `values[codes]` are
+               the values of the column. The codes of a dictionary-encoded
+               ColumnTable column are returned as they are.
+    """
+    if isinstance(table, ColumnTable):
+        name = table.names[position]
+        if name in table.categories:
+            return table.columns[name], table.categories[name]
+        column = table.column(name).tolist()
+    else:
+        column = (row[position] for row in table)
+    index = {}
+    codes = np.array([index.setdefault(value, len(index)) for value in column])
+    values = np.empty(len(index), dtype=object)
+    values[:] = list(index)
+    return codes.astype(np.int64), values
+
+
+def take(values, positions: np.ndarray) -> np.ndarray:
+    """
+    Index an array, or a range of dense IDs, by position.
+
+    Args:
+        values (numpy.ndarray or range): The values, e.g. a column from
+                                         `table_column` or the IDs of a
+                                         sidecar view.
+        positions (numpy.ndarray): The positions to take.
+
+    Returns:
+        numpy.ndarray: The values at the positions.
+    """
+    if isinstance(values, range):
+        return values.start + values.step * positions.astype(np.int64)
+    return values[positions]
@@ -1,13 +1,151 @@
 import csv
+import gzip
+import hashlib
+import io
+import itertools
+import json
 import os
+import pickle
 import random
-import openpyxl
+import threading
+import numpy as np
 
-from faker import Faker
-from tabulate import tabulate
-from datetime import datetime, timedelta
+from collections import deque
+from datetime import datetime
 
-fake = Faker("id_ID")
+from columnar import ColumnTable, table_codes, table_column, take
+
+# openpyxl, tabulate and faker are imported on first use, which keeps
+# importing this module cheap for worker processes and small runs
+
+# The Faker instance, created by get_fake(), and the seed to give it
+_fake = None
+_fake_seed = None
+_fake_lock = threading.Lock()
+
+
+def get_fake():
+    """
+    Get the shared Faker instance, creating it on first use.
+
+    The instance is also available as `create_dummy.fake`.
+
+    Returns:
+        faker.Faker: A Faker instance for the id_ID locale.
+    """
+    global _fake
+    if _fake is None:
+        with _fake_lock:
+            if _fake is None:
+                from faker import Faker
+
+                fake = Faker("id_ID")
+                if _fake_seed is not None:
+                    fake.seed_instance(_fake_seed)
+                _fake = fake
+    return _fake
+
+
+def seed_fake(seed):
+    """
+    Seed the shared Faker instance without creating it before it is used.
+
+    Args:
+        seed: The seed, as accepted by `Faker.seed_instance`.
+    """
+    global _fake_seed
+    _fake_seed = seed
+    if _fake is not None:
+        _fake.seed_instance(seed)
+
+
+def __getattr__(name):
+    # Serve the module attribute `fake` lazily
+    if name == "fake":
+        return get_fake()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Number of rows yielded per chunk by the iter_* generators
+DEFAULT_CHUNK_SIZE = 10_000
+
+# Passenger capacity per body type, None for unlisted body types
+PASSENGER_CAPACITY = {
+    "MPV": 7,
+    "LCGC": 5,
+    "Hybrid": 5,
+    "Elektrik": 5,
+    "Double Cabin": 5,
+    "Station Wagon": 5,
+    "Sedan": 5,
+    "Hatchback": 5,
+    "SUV": 5,
+    "Crossover": 5,
+    "Offroad": 4,
+    "Sport": 4,
+    "Convertible": 2,
+}
+
+# Allowed transmission, fuel and drive system values per body type, with
+# the default choices used for every body type that is not listed
+TRANSMISSION_TYPES = {"Hybrid": ["automatic"], "Elektrik": ["automatic"]}
+DEFAULT_TRANSMISSION_TYPES = ["manual", "automatic"]
+FUEL_TYPES = {"Hybrid": ["hybrid"], "Elektrik": ["electric"]}
+DEFAULT_FUEL_TYPES = ["gasoline", "diesel"]
+DRIVE_SYSTEMS = {"Offroad": ["FWD"]}
+DEFAULT_DRIVE_SYSTEMS = ["RWD", "AWD"]
+
+# Keywords that random advertisement titles are made of
+AD_TITLE_KEYWORDS = [
+    "Bekas",
+    "Tahun",
+    "Km",
+    "Kondisi",
+    "Mulus",
+    "Service",
+    "Baru",
+    "Jarang",
+    "Terawat",
+    "Mesin",
+    "Interior",
+    "Eksterior",
+    "Full",
+    "Original",
+    "Pajak",
+    "Surat",
+    "Siap",
+    "Oli",
+    "Ban",
+    "Velg",
+    "Warna",
+    "Cat",
+    "Jual",
+    "Murah",
+    "Harga",
+    "Cash",
+    "Kredit",
+    "DP",
+    "Cicilan",
+    "Negotiable",
+    "Nego",
+    "Asli",
+    "Mobil",
+    "Berkualitas",
+    "Pakai",
+    "Langsung",
+    "Terjamin",
+    "Dokumen",
+    "Tangan",
+    "Jarak",
+    "Kendaraan",
+    "Pemakaian",
+    "Pribadi",
+    "Bukan Rental",
+    "Nopol",
+    "Kilometer",
+    "STNK",
+]
+_CAPITALIZED_AD_TITLE_KEYWORDS = [keyword.capitalize() for keyword in AD_TITLE_KEYWORDS]
 
 
 # Function to display a table using tabulate
@@ -19,72 +157,614 @@ def show_table(data_list: list, headers: list):
         data_list (list): The list of data to be displayed.
         headers (list): The list of header names for the table.
     """
+    from tabulate import tabulate
+
     table = tabulate(data_list, headers=headers, tablefmt="pretty")
     print(table)
 
 
+# Rows shown at each end of a table preview
+PREVIEW_ROWS = 10
+
+# Distinct values counted per column before only a lower bound is shown
+DISTINCT_LIMIT = 1_000
+
+# Characters of a value shown in the column statistics
+PREVIEW_VALUE_WIDTH = 40
+
+
+def new_preview(headers: list, n_rows: int = PREVIEW_ROWS, stats: bool = False):
+    """
+    Create an empty preview for `update_preview` to record chunks into.
+
+    A preview keeps the first and last `n_rows` rows and the row count,
+    and optionally per-column statistics, so its memory does not grow
+    with the table.
+
+    Args:
+        headers (list): The column names.
+        n_rows (int, optional): The rows to keep at each end.
+                                Defaults to PREVIEW_ROWS.
+        stats (bool, optional): Whether to compute the null count, the
+                                distinct count, the minimum, maximum and
+                                mean of every column. Defaults to False.
+
+    Returns:
+        dict: The preview.
+    """
+    return {
+        "headers": headers,
+        "n_rows": n_rows,
+        "rows": 0,
+        "head": [],
+        "tail": deque(maxlen=n_rows),
+        "columns": (
+            [
+                {"nulls": 0, "distinct": set(), "min": None, "max": None, "sum": 0}
+                for _ in headers
+            ]
+            if stats
+            else None
+        ),
+    }
+
+
+def _update_column_stats(column: dict, values: tuple):
+    """
+    Add the values of one column of a chunk to its statistics.
+
+    Args:
+        column (dict): The statistics of the column, from `new_preview`.
+        values (tuple): The values of the column in the chunk.
+    """
+    present = [value for value in values if value is not None]
+    column["nulls"] += len(values) - len(present)
+    if not present:
+        return
+
+    if column["distinct"] is not None:
+        column["distinct"].update(present)
+        if len(column["distinct"]) > DISTINCT_LIMIT:
+            column["distinct"] = None  # Too many to keep counting
+
+    if column["min"] is not False:
+        try:
+            low, high = min(present), max(present)
+            if column["min"] is not None:
+                low = min(column["min"], low)
+                high = max(column["max"], high)
+            column["min"], column["max"] = low, high
+        except TypeError:
+            column["min"] = column["max"] = False  # Values are not comparable
+
+    if column["sum"] is not None:
+        if isinstance(present[0], (int, float)) and not isinstance(present[0], bool):
+            try:
+                column["sum"] += sum(present)
+                return
+            except TypeError:
+                pass
+        column["sum"] = None  # Not a numeric column
+
+
+def update_preview(preview: dict, chunk: list):
+    """
+    Record a chunk of rows into a preview.
+
+    Only the ends of the chunk are looked at unless the preview computes
+    column statistics.
+
+    Args:
+        preview (dict): A preview from `new_preview`.
+        chunk (list): A list of rows.
+    """
+    n_rows = preview["n_rows"]
+    missing = n_rows - len(preview["head"])
+    if missing > 0:
+        preview["head"].extend(chunk[:missing])
+    if n_rows:
+        preview["tail"].extend(chunk[-n_rows:])
+    preview["rows"] += len(chunk)
+
+    if preview["columns"] is not None and len(chunk):
+        for column, values in zip(preview["columns"], zip(*chunk)):
+            _update_column_stats(column, values)
+
+
+def previewed_chunks(preview: dict, chunks):
+    """
+    Record chunks into a preview while passing them on unchanged.
+
+    Args:
+        preview (dict): A preview from `new_preview`.
+        chunks (iterable): An iterable of lists of rows.
+
+    Yields:
+        list: The chunks.
+    """
+    for chunk in chunks:
+        update_preview(preview, chunk)
+        yield chunk
+
+
+def _short(value) -> str:
+    """Shorten a value for the statistics table."""
+    text = str(value)
+    if len(text) > PREVIEW_VALUE_WIDTH:
+        text = text[: PREVIEW_VALUE_WIDTH - 3] + "..."
+    return text
+
+
+def show_preview(preview: dict):
+    """
+    Display the rows, the row count and the statistics of a preview.
+
+    Args:
+        preview (dict): A preview from `new_preview`.
+    """
+    n_rows, total = preview["n_rows"], preview["rows"]
+    rows = list(preview["head"])
+    if total > 2 * n_rows:
+        rows.append(["..."] * len(preview["headers"]))
+        rows.extend(preview["tail"])
+    elif total > len(rows):
+        rows.extend(list(preview["tail"])[len(rows) - total :])
+    if rows:
+        show_table(rows, preview["headers"])
+    print(f"{total:,} rows.")
+
+    if preview["columns"] is None:
+        return
+
+    stats = []
+    for name, column in zip(preview["headers"], preview["columns"]):
+        n_values = total - column["nulls"]
+        distinct = column["distinct"]
+        comparable = column["min"] is not None and column["min"] is not False
+        stats.append(
+            [
+                name,
+                column["nulls"],
+                len(distinct) if distinct is not None else f">{DISTINCT_LIMIT:,}",
+                _short(column["min"]) if comparable else "",
+                _short(column["max"]) if comparable else "",
+                (
+                    f"{column['sum'] / n_values:,.2f}"
+                    if column["sum"] is not None and n_values
+                    else ""
+                ),
+            ]
+        )
+    show_table(stats, ["column", "nulls", "distinct", "min", "max", "mean"])
+
+
+def preview_rows(preview: dict, rows):
+    """
+    Record a whole table into an empty preview.
+
+    Args:
+        preview (dict): A preview from `new_preview`.
+        rows: A list of rows, a ColumnTable or any iterable of rows. A
+              list or ColumnTable is only read at both ends when the
+              preview computes no statistics.
+    """
+    n_rows = preview["n_rows"]
+    if isinstance(rows, (list, ColumnTable)) and preview["columns"] is None:
+        total = len(rows)
+        preview["rows"] = total
+        preview["head"] = [rows[i] for i in range(min(n_rows, total))]
+        preview["tail"].extend(rows[i] for i in range(max(total - n_rows, 0), total))
+    elif isinstance(rows, list):
+        update_preview(preview, rows)
+    elif isinstance(rows, ColumnTable):
+        for chunk in rows.chunks():
+            update_preview(preview, chunk)
+    else:
+        rows = iter(rows)
+        while True:
+            chunk = list(itertools.islice(rows, DEFAULT_CHUNK_SIZE))
+            if not chunk:
+                break
+            update_preview(preview, chunk)
+
+
+def preview_table(
+    rows, headers: list, n_rows: int = PREVIEW_ROWS, stats: bool = False
+) -> dict:
+    """
+    Display the first and last rows of a table and its row count.
+
+    Unlike `show_table`, the cost of rendering does not depend on the
+    size of the table: rows are read in a single streaming pass, or, for
+    a list or ColumnTable without statistics, only at both ends.
+
+    Args:
+        rows: A list of rows, a ColumnTable or any iterable of rows, such
+              as `itertools.chain.from_iterable(iter_bids(...))`.
+        headers (list): The column names.
+        n_rows (int, optional): The rows to show at each end.
+                                Defaults to PREVIEW_ROWS.
+        stats (bool, optional): Whether to also show per-column
+                                statistics. Defaults to False.
+
+    Returns:
+        dict: The preview, see `new_preview`.
+    """
+    preview = new_preview(headers, n_rows, stats)
+    preview_rows(preview, rows)
+    show_preview(preview)
+    return preview
+
+
 # Function to export list to a CSV file
-def list_to_csv(data_list: list, folder_path: str, filename: str, headers: list):
+def list_to_csv(
+    data_list: list,
+    folder_path: str,
+    filename: str,
+    headers: list,
+    compression: str = None,
+):
     """
     Export data from a list to a CSV file.
 
     Args:
-        data_list (list): The list containing data to be exported.
+        data_list (list): The list containing data to be exported, or a
+                          ColumnTable.
         folder_path (str): The path to the folder where the CSV file will
                            be saved.
         filename (str): The name of the CSV file.
         headers (list): A list of header names for the CSV file.
+        compression (str, optional): "gzip", "zstd" or "none". Inferred
+                                     from the file extension when not given.
+    """
+    chunks = data_list if isinstance(data_list, ColumnTable) else [data_list]
+    chunks_to_csv(chunks, folder_path, filename, headers, compression)
+
+
+# Write buffer size of exported files, in bytes
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+# File extensions of the supported CSV compressions
+COMPRESSION_EXTENSIONS = {".gz": "gzip", ".zst": "zstd", ".zstd": "zstd"}
+
+
+def open_text_output(
+    file_path: str, compression: str = None, level: int = None, append: bool = False
+):
+    """
+    Open a text file for writing, optionally through a compressor.
+
+    zstd compresses on all cores through the optional `zstandard`
+    package; gzip uses the standard library and a single core. Appending
+    to a compressed file adds a new gzip member or zstd frame, which
+    readers decompress as one stream.
+
+    Args:
+        file_path (str): The path of the file.
+        compression (str, optional): "gzip", "zstd" or "none". Inferred
+                                     from the file extension when not given.
+        level (int, optional): The compression level. Defaults to 6 for
+                               gzip and 3 for zstd.
+        append (bool, optional): Whether to append to an existing file.
+                                 Defaults to False.
+
+    Returns:
+        io.TextIOBase: A text file object; closing it closes the file.
+    """
+    if compression is None:
+        extension = os.path.splitext(file_path)[1].lower()
+        compression = COMPRESSION_EXTENSIONS.get(extension, "none")
+    mode = "a" if append else "w"
+
+    if compression == "none":
+        return open(
+            file_path,
+            mode=mode,
+            newline="",
+            encoding="utf-8",
+            buffering=DEFAULT_BUFFER_SIZE,
+        )
+
+    if compression == "gzip":
+        return gzip.open(
+            file_path,
+            mode=f"{mode}t",
+            newline="",
+            encoding="utf-8",
+            compresslevel=level or 6,
+        )
+
+    if compression == "zstd":
+        zstandard = _import_zstandard()
+        compressor = zstandard.ZstdCompressor(level=level or 3, threads=-1)
+        return io.TextIOWrapper(
+            compressor.stream_writer(
+                open(file_path, mode=f"{mode}b", buffering=DEFAULT_BUFFER_SIZE)
+            ),
+            encoding="utf-8",
+            newline="",
+        )
+
+    raise ValueError(f"Unknown compression '{compression}'.")
+
+
+def open_text_input(file_path: str, compression: str = None):
+    """
+    Open a text file written by `open_text_output` for reading.
+
+    Args:
+        file_path (str): The path of the file.
+        compression (str, optional): "gzip", "zstd" or "none". Inferred
+                                     from the file extension when not given.
+
+    Returns:
+        io.TextIOBase: A text file object; closing it closes the file.
+    """
+    if compression is None:
+        extension = os.path.splitext(file_path)[1].lower()
+        compression = COMPRESSION_EXTENSIONS.get(extension, "none")
+
+    if compression == "none":
+        return open(file_path, mode="r", newline="", encoding="utf-8")
+
+    if compression == "gzip":
+        return gzip.open(file_path, mode="rt", newline="", encoding="utf-8")
+
+    if compression == "zstd":
+        zstandard = _import_zstandard()
+        return io.TextIOWrapper(
+            zstandard.ZstdDecompressor().stream_reader(
+                open(file_path, mode="rb"), read_across_frames=True
+            ),
+            encoding="utf-8",
+            newline="",
+        )
+
+    raise ValueError(f"Unknown compression '{compression}'.")
+
+
+def _import_zstandard():
+    """
+    Import the optional `zstandard` package.
+
+    Returns:
+        module: The zstandard module.
+    """
+    try:
+        import zstandard
+    except ImportError as error:
+        raise ImportError(
+            "zstd compression needs zstandard: pip install zstandard"
+        ) from error
+    return zstandard
+
+
+# Function to export chunks of rows to a CSV file
+def chunks_to_csv(
+    chunks,
+    folder_path: str,
+    filename: str,
+    headers: list,
+    compression: str = None,
+    append: bool = False,
+) -> int:
+    """
+    Export chunks of rows, such as the ones yielded by the `iter_*`
+    generators, to a CSV file without holding the whole table in memory.
+
+    Args:
+        chunks (iterable): An iterable of lists of rows, or a ColumnTable.
+        folder_path (str): The path to the folder where the CSV file will
+                           be saved.
+        filename (str): The name of the CSV file, e.g. "cars.csv" or
+                        "cars.csv.gz".
+        headers (list): A list of header names for the CSV file, or None
+                        to leave out the header row.
+        compression (str, optional): "gzip", "zstd" or "none". Inferred
+                                     from the file extension when not given.
+        append (bool, optional): Whether to append to an existing file,
+                                 whose header row is kept. Defaults to False.
+
+    Returns:
+        int: The number of rows written.
     """
     # Create the folder if it doesn't exist
     if not os.path.exists(folder_path):
-        os.makedirs(folder_path)
+        os.makedirs(folder_path, exist_ok=True)
 
     file_path = os.path.join(folder_path, filename)
 
-    with open(file_path, mode="w", newline="") as file:
-        writer = csv.writer(file)
+    if append and os.path.exists(file_path) and os.path.getsize(file_path):
+        headers = None  # The file already starts with them
+    if isinstance(chunks, ColumnTable):
+        chunks = chunks.chunks()
+
+    n_rows = 0
+    with open_text_output(file_path, compression, append=append) as file:
+        # Format each chunk in memory and hand it to the file in one write
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
 
         # Write headers
-        writer.writerow(headers)
+        if headers is not None:
+            writer.writerow(headers)
 
-        # Write data
-        for row in data_list:
-            writer.writerow(row)
+        # Write data one chunk at a time
+        for chunk in chunks:
+            writer.writerows(chunk)
+            file.write(buffer.getvalue())
+            buffer.seek(0)
+            buffer.truncate()
+            n_rows += len(chunk)
 
+        file.write(buffer.getvalue())
 
-def xlsx_to_dict(file_path, sheet_name):
+    return n_rows
+
+
+def show_export_report(report: dict):
+    """
+    Display the report of a CSV export as a table.
+
+    Args:
+        report (dict): Filename -> {"rows", "bytes", "seconds"} for every
+                       file, plus a "total" entry whose "seconds" is the
+                       wall time, as `main.py` builds it from its write
+                       stages.
+    """
+    show_table(
+        [
+            (
+                filename,
+                stats["rows"],
+                stats["bytes"],
+                f"{stats['seconds']:.3f}",
+                f"{stats['rows'] / stats['seconds']:,.0f}" if stats["seconds"] else "",
+            )
+            for filename, stats in report.items()
+        ],
+        ["file", "rows", "bytes", "seconds", "rows/sec"],
+    )
+
+
+# Version of the sidecar cache format, bump it when parsed data changes
+CACHE_VERSION = 1
+
+
+def _file_digest(file_path: str) -> str:
+    """
+    Compute the SHA-256 digest of a file.
+
+    Args:
+        file_path (str): Path to the file.
+
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, mode="rb") as file:
+        for block in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_cached(file_path: str, key: str, parse):
+    """
+    Parse a file once and reuse the result from a binary sidecar cache.
+
+    The cache `<file_path>.<key>.cache` is reused when the file's mtime
+    and size are unchanged. When they changed, the file's SHA-256 decides:
+    same content refreshes the recorded mtime, new content is parsed again.
+
+    Args:
+        file_path (str): Path to the source file.
+        key (str): Distinguishes several caches of one file, e.g. the
+                   sheet name.
+        parse (function): Called as `parse()` to parse the file. A result
+                          of None is returned but not cached.
+
+    Returns:
+        The parsed data.
+    """
+    cache_path = f"{file_path}.{key}.cache"
+    stat = os.stat(file_path)
+
+    cached = None
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, mode="rb") as file:
+                cached = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            cached = None  # A broken cache is simply rebuilt
+        if not isinstance(cached, dict) or cached.get("version") != CACHE_VERSION:
+            cached = None
+
+    if (
+        cached is not None
+        and cached["mtime_ns"] == stat.st_mtime_ns
+        and cached["size"] == stat.st_size
+    ):
+        return cached["data"]
+
+    digest = _file_digest(file_path)
+    if cached is not None and cached["sha256"] == digest:
+        data = cached["data"]  # Touched but unchanged, only refresh the mtime
+    else:
+        data = parse()
+        if data is None:
+            return None
+
+    try:
+        with open(cache_path, mode="wb") as file:
+            pickle.dump(
+                {
+                    "version": CACHE_VERSION,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "sha256": digest,
+                    "data": data,
+                },
+                file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+    except OSError:
+        pass  # The cache is an optimization, a read-only folder is fine
+
+    return data
+
+
+def xlsx_to_dict(file_path, sheet_name, use_cache: bool = True):
     """
     Convert an XLSX file to a dictionary using openpyxl.
 
+    The sheet is streamed in read-only mode, and the result is kept in a
+    sidecar cache (see `load_cached`) that later runs load instead.
+
     Args:
         file_path (str): Path to the XLSX file.
         sheet_name (str): Name of the sheet in the XLSX file.
+        use_cache (bool, optional): Whether to use the sidecar cache.
+                                    Defaults to True.
 
     Returns:
         dict: A dictionary containing the data from the specified sheet.
     """
-    data_dict = {}
 
-    # Load the workbook
-    workbook = openpyxl.load_workbook(file_path)
+    def parse():
+        data_dict = {}
 
-    try:
-        # Get the specified sheet
-        sheet = workbook[sheet_name]
-
-        # Iterate through rows, excluding the header row
-        for row in sheet.iter_rows(min_row=2, values_only=True):
-            kota_id, nama_kota, latitude, longitude = row
-            kota_id = int(kota_id)
-            data_dict[kota_id] = {
-                "nama_kota": nama_kota,
-                "latitude": latitude,
-                "longitude": longitude,
-            }
-    except KeyError:
-        print(f"Sheet '{sheet_name}' not found in the workbook.")
+        import openpyxl
 
-    return data_dict
+        # Load the workbook in streaming mode
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+
+        try:
+            # Get the specified sheet
+            sheet = workbook[sheet_name]
+
+            # Iterate through rows, excluding the header row
+            for row in sheet.iter_rows(min_row=2, values_only=True):
+                kota_id, nama_kota, latitude, longitude = row[:4]
+                if kota_id is None:
+                    continue  # Skip trailing empty rows
+                kota_id = int(kota_id)
+                data_dict[kota_id] = {
+                    "nama_kota": nama_kota,
+                    "latitude": latitude,
+                    "longitude": longitude,
+                }
+        except KeyError:
+            print(f"Sheet '{sheet_name}' not found in the workbook.")
+            return None
+        finally:
+            workbook.close()
+
+        return data_dict
+
+    if not use_cache:
+        return parse() or {}
+
+    return load_cached(file_path, f"{sheet_name}", parse) or {}
 
 
 # Function to generate body types with optional printing
@@ -109,7 +789,7 @@ def generate_body_types(data: dict, is_printed: bool = True) -> list:
         )  # Add (body_type_id, body) pair to the list
 
     if is_printed:
-        show_table(body_types, ["body_type_id", "body_type_name"])
+        preview_table(body_types, ["body_type_id", "body_type_name"])
 
     return body_types
 
@@ -142,14 +822,17 @@ def generate_manufactures(data: dict, is_printed: bool = True) -> list:
         )  # Add (manufacture_id, manufacture) to the list
 
     if is_printed:
-        show_table(manufactures, ["manufacture_id", "manufacture_name"])
+        preview_table(manufactures, ["manufacture_id", "manufacture_name"])
 
     return manufactures
 
 
 # Function to generate car models with optional printing
 def generate_car_models(
-    data: dict, manufactures_table: list, is_printed: bool = True
+    data: dict,
+    manufactures_table: list,
+    is_printed: bool = True,
+    catalog: dict = None,
 ) -> list:
     """Generate a table of car models with formatted IDs.
 
@@ -158,22 +841,24 @@ def generate_car_models(
         manufactures_table (list): A list of manufacturers' data.
         is_printed (bool, optional): Whether to print the table.
                                      Defaults to True.
+        catalog (dict, optional): A catalog index from `build_catalog`.
+                                  Built from the tables when not given.
 
     Returns:
         list: A list of tuples containing formatted car model IDs,
               manufacturing IDs, and model names.
     """
+    if catalog is None:
+        catalog = build_catalog(data, manufactures_table)
+
+    manufacture_ids = catalog["manufacture_ids"]
+
     car_models = []  # Initialize a list to store the result tuples
     car_model_count = 0  # Initialize a counter for car models
 
     for body_type in data.keys():
         for model, details in data[body_type].items():
-            manufacture_name = details["pabrikan"]
-            manufacture_id = next(
-                manufacture[0]
-                for manufacture in manufactures_table
-                if manufacture[1] == manufacture_name
-            )
+            manufacture_id = manufacture_ids[details["pabrikan"]]
 
             car_model_count += 1
             car_model_id = f"CM{car_model_count:04}"
@@ -183,157 +868,538 @@ def generate_car_models(
     sorted_car_models = sorted(car_models, key=lambda x: x[0])  # Sort car models by ID
 
     if is_printed:
-        show_table(sorted_car_models, ["model_id", "manufacture_id", "model_name"])
+        preview_table(sorted_car_models, ["model_id", "manufacture_id", "model_name"])
 
     return sorted_car_models
 
 
-def generate_cars(
+# Build lookup indexes over the car data and the dimension tables
+def build_catalog(
     data: dict,
     manufactures_table: list,
-    body_types_table: list,
-    car_models_table: list,
-    n_data: int,
-    is_printed: bool = True,
-) -> list:
+    body_types_table: list = None,
+    car_models_table: list = None,
+) -> dict:
     """
-    Generate dummy car data based on specified parameters.
+    Build a catalog index for O(1) lookups during row generation.
 
     Args:
         data (dict): A dictionary containing car data
                      with body types as keys.
         manufactures_table (list): A list of manufacturers' data.
-        body_types_table (list): A list of body types data.
-        car_models_table (list): A list of car models data.
-        n_data (int): The number of dummy data to generate.
-        is_printed (bool, optional): Whether to print the generated data.
-                                     Defaults to True.
+        body_types_table (list, optional): A list of body types data.
+        car_models_table (list, optional): A list of car models data.
 
     Returns:
-        list: A list of tuples containing generated car data.
+        dict: A dictionary with the following keys:
+              - "body_types": body type names in `data` order.
+              - "manufacture_ids": manufacturer name -> manufacture_id.
+              - "body_type_ids": body type name -> body_type_id.
+              - "model_ids": model name -> model_id.
+              - "models_by_body_type": body type name -> list of model
+                records.
+              - "models": model_id -> model record.
+              Model records are dicts holding the model name, the
+              body type, the resolved IDs and the "tahun", "harga" and
+              "kapasitas_mesin" details.
     """
-    dummy_data = []
+    # Keep the first match per name, like the former next() scans did
+    manufacture_ids = {}
+    for manufacture_id, manufacture_name in manufactures_table:
+        manufacture_ids.setdefault(manufacture_name, manufacture_id)
+
+    body_type_ids = {}
+    for body_type_id, body_type_name in body_types_table or []:
+        body_type_ids.setdefault(body_type_name, body_type_id)
+
+    model_ids = {}
+    for model_id, _, model_name in car_models_table or []:
+        model_ids.setdefault(model_name, model_id)
+
+    models_by_body_type = {}
+    models = {}
+    for body_type, body_models in data.items():
+        records = []
+        for model_name, details in body_models.items():
+            record = {
+                "model_name": model_name,
+                "body_type": body_type,
+                "manufacture_id": manufacture_ids.get(details["pabrikan"]),
+                "model_id": model_ids.get(model_name),
+                "body_type_id": body_type_ids.get(body_type),
+                "tahun": details["tahun"],
+                "harga": details["harga"],
+                "kapasitas_mesin": details["kapasitas_mesin"],
+            }
+            records.append(record)
+            if record["model_id"] is not None:
+                models.setdefault(record["model_id"], record)
+        models_by_body_type[body_type] = records
 
-    body_types = [body_type for body_type in data.keys()]
+    return {
+        "body_types": list(data.keys()),
+        "manufacture_ids": manufacture_ids,
+        "body_type_ids": body_type_ids,
+        "model_ids": model_ids,
+        "models_by_body_type": models_by_body_type,
+        "models": models,
+    }
 
-    car_id_counter = 1  # Initialize the car_id counter
 
-    for _ in range(n_data):
-        car_id = car_id_counter  # Set the car_id using the counter value
-        car_id_counter += 1  # Increment the car_id counter
+# Column names of a catalog workbook; engine_capacity is optional
+CATALOG_COLUMNS = ["brand", "model", "body_type", "year", "price"]
 
-        # Select a random body type and model name
-        body_type = random.choice(body_types)
-        model_name = random.choice(list(data[body_type].keys()))
 
-        # Extract necessary information from car data
-        manufacture_name = data[body_type][model_name]["pabrikan"]
-        manufacture_id = next(
-            manufacture[0]
-            for manufacture in manufactures_table
-            if manufacture[1] == manufacture_name
-        )
+def load_catalog(
+    file_path: str, sheet_name: str = "car_product", use_cache: bool = True
+) -> dict:
+    """
+    Load the car catalog from an XLSX workbook such as `car_product.xlsx`.
 
-        year_data = data[body_type][model_name]["tahun"]
-        if year_data:  # Make sure there are valid years for the model
-            year_index = random.randint(0, len(year_data) - 1)
-            year_manufactured = year_data[year_index]
-        else:
-            year_manufactured = None  # Set a default year if no year data
-
-        engine_capacity = data[body_type][model_name]["kapasitas_mesin"]
-
-        # Determine passenger capacity based on body type
-        passenger_capacity = None  # Initialize passenger_capacity
-        if body_type == "MPV":
-            passenger_capacity = 7
-        elif body_type in [
-            "LCGC",
-            "Hybrid",
-            "Elektrik",
-            "Double Cabin",
-            "Station Wagon",
-            "Sedan",
-            "Hatchback",
-            "SUV",
-            "Crossover",
-        ]:
-            passenger_capacity = 5
-        elif body_type in ["Offroad", "Sport"]:
-            passenger_capacity = 4
-        elif body_type == "Convertible":
-            passenger_capacity = 2
-
-        # Determine transmission type based on body type
-        transmission_types = ["manual", "automatic"]
-        if body_type in ["Hybrid", "Elektrik"]:
-            transmission_type = "automatic"
-        else:
-            transmission_type = random.choice(transmission_types)
-
-        # Determine fuel type based on body type
-        fuel_types = ["gasoline", "diesel"]
-        if body_type == "Hybrid":
-            fuel_type = "hybrid"
-        elif body_type == "Elektrik":
-            fuel_type = "electric"
-        else:
-            fuel_type = random.choice(fuel_types)
+    The sheet is streamed in read-only mode. Every row is one model year
+    with its price and is grouped into the same shape as the `car_data`
+    literal of `main.py`. The dimension tables and the catalog index are
+    built from it, and everything is kept in a sidecar cache (see
+    `load_cached`) so repeat runs skip the parsing.
 
-        # Determine drive system based on body type
-        drive_systems = ["RWD", "AWD"]
-        if body_type == "Offroad":
-            drive_system = "FWD"
-        else:
-            drive_system = random.choice(drive_systems)
+    Args:
+        file_path (str): Path to the XLSX file.
+        sheet_name (str, optional): Name of the sheet in the XLSX file.
+                                    Defaults to "car_product".
+        use_cache (bool, optional): Whether to use the sidecar cache.
+                                    Defaults to True.
+
+    Returns:
+        dict: A dictionary with the following keys, or None when the sheet
+              or one of its columns is missing:
+              - "data": body type -> model name -> details.
+              - "body_types": the body types table.
+              - "manufactures": the manufacturers table.
+              - "car_models": the car models table.
+              - "catalog": the catalog index from `build_catalog`.
+    """
+
+    def parse():
+        data = {}
 
-        # Generate random odometer and additional details
-        odometer = fake.random_int(min=100, max=150000)
-        additional_details = fake.paragraph()
+        import openpyxl
 
-        # Retrieve model and body type IDs from the respective data lists
-        model_id = next(
-            model[0] for model in car_models_table if model[2] == model_name
+        # Load the workbook in streaming mode
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+
+        try:
+            rows = workbook[sheet_name].iter_rows(values_only=True)
+
+            # Locate the columns by their header names
+            header = [str(name).strip().lower() for name in next(rows, ())]
+            missing = [name for name in CATALOG_COLUMNS if name not in header]
+            if missing:
+                print(f"Sheet '{sheet_name}' is missing columns: {missing}.")
+                return None
+            brand, model, body_type, year, price = (
+                header.index(name) for name in CATALOG_COLUMNS
+            )
+            engine = (
+                header.index("engine_capacity") if "engine_capacity" in header else None
+            )
+
+            for row in rows:
+                if row[model] is None:
+                    continue  # Skip trailing empty rows
+                details = data.setdefault(row[body_type], {}).setdefault(
+                    row[model],
+                    {
+                        "pabrikan": row[brand],
+                        "tahun": [],
+                        "harga": [],
+                        "kapasitas_mesin": (None if engine is None else row[engine]),
+                    },
+                )
+                details["tahun"].append(int(row[year]))
+                details["harga"].append(int(row[price]))
+        except KeyError:
+            print(f"Sheet '{sheet_name}' not found in the workbook.")
+            return None
+        finally:
+            workbook.close()
+
+        body_types_table = generate_body_types(data, is_printed=False)
+        manufactures_table = generate_manufactures(data, is_printed=False)
+        car_models_table = generate_car_models(
+            data, manufactures_table, is_printed=False
         )
-        body_type_id = next(
-            body[0] for body in body_types_table if body[1] == body_type
+        catalog = build_catalog(
+            data, manufactures_table, body_types_table, car_models_table
         )
 
-        # Append generated car data to dummy_data list
-        dummy_data.append(
-            (
-                car_id,
-                manufacture_id,
-                model_id,
-                body_type_id,
-                year_manufactured,
-                engine_capacity,
-                passenger_capacity,
-                transmission_type,
-                fuel_type,
-                drive_system,
-                odometer,
-                additional_details,
+        return {
+            "data": data,
+            "body_types": body_types_table,
+            "manufactures": manufactures_table,
+            "car_models": car_models_table,
+            "catalog": catalog,
+        }
+
+    if not use_cache:
+        return parse()
+
+    return load_cached(file_path, f"{sheet_name}.catalog", parse)
+
+
+def _flatten_groups(groups: list) -> tuple:
+    """
+    Flatten a list of value lists into offset, count and value arrays.
+
+    Args:
+        groups (list): A list of lists of values.
+
+    Returns:
+        tuple: (offsets, counts, values) where group `i` is
+               `values[offsets[i]:offsets[i] + counts[i]]`.
+    """
+    counts = np.array([len(group) for group in groups], dtype=np.int64)
+    offsets = np.zeros(len(groups), dtype=np.int64)
+    np.cumsum(counts[:-1], out=offsets[1:])
+    values = np.empty(int(counts.sum()), dtype=object)
+    values[:] = [value for group in groups for value in group]
+    return offsets, counts, values
+
+
+def _draw_from_groups(
+    rng, group_idx: np.ndarray, offsets: np.ndarray, counts: np.ndarray
+) -> np.ndarray:
+    """
+    Draw one index per row uniformly from the group selected for that row.
+
+    Args:
+        rng (numpy.random.Generator): The random generator to draw from.
+        group_idx (numpy.ndarray): The group index of each row.
+        offsets (numpy.ndarray): The start of each group in the value array.
+        counts (numpy.ndarray): The size of each group.
+
+    Returns:
+        numpy.ndarray: Indexes into the flattened value array.
+    """
+    group_counts = counts[group_idx]
+    picks = (rng.random(len(group_idx)) * group_counts).astype(np.int64)
+    return offsets[group_idx] + np.minimum(picks, np.maximum(group_counts - 1, 0))
+
+
+def build_car_arrays(catalog: dict) -> dict:
+    """
+    Build the lookup arrays used by `generate_car_columns`.
+
+    Every per-model attribute is stored in an array indexed by the flat
+    model position, and every rule-derived column is stored as a group
+    of allowed values per body type.
+
+    Args:
+        catalog (dict): A catalog index from `build_catalog`.
+
+    Returns:
+        dict: A dictionary of NumPy lookup arrays.
+    """
+    body_types = catalog["body_types"]
+    models_by_body_type = catalog["models_by_body_type"]
+
+    model_offsets, model_counts, models = _flatten_groups(
+        [models_by_body_type[body_type] for body_type in body_types]
+    )
+    year_offsets, year_counts, years = _flatten_groups(
+        [model["tahun"] or [] for model in models]
+    )
+
+    def attribute(key):
+        values = np.empty(len(models), dtype=object)
+        values[:] = [model[key] for model in models]
+        return values
+
+    def rule_groups(rules, default):
+        return _flatten_groups(
+            [rules.get(body_type, default) for body_type in body_types]
+        )
+
+    passenger_capacity = np.empty(len(body_types), dtype=object)
+    passenger_capacity[:] = [PASSENGER_CAPACITY.get(b) for b in body_types]
+
+    return {
+        "n_body_types": len(body_types),
+        "model_offsets": model_offsets,
+        "model_counts": model_counts,
+        "manufacture_id": attribute("manufacture_id"),
+        "model_id": attribute("model_id"),
+        "body_type_id": attribute("body_type_id"),
+        "engine_capacity": attribute("kapasitas_mesin"),
+        "year_offsets": year_offsets,
+        "year_counts": year_counts,
+        "years": years,
+        "passenger_capacity": passenger_capacity,
+        "transmission_type": rule_groups(
+            TRANSMISSION_TYPES, DEFAULT_TRANSMISSION_TYPES
+        ),
+        "fuel_type": rule_groups(FUEL_TYPES, DEFAULT_FUEL_TYPES),
+        "drive_system": rule_groups(DRIVE_SYSTEMS, DEFAULT_DRIVE_SYSTEMS),
+    }
+
+
+def generate_car_columns(
+    car_arrays: dict,
+    n_data: int,
+    start_id: int = 1,
+    rng=None,
+    text_pool: dict = None,
+) -> dict:
+    """
+    Generate dummy car data as whole columns at once.
+
+    Args:
+        car_arrays (dict): Lookup arrays from `build_car_arrays`.
+        n_data (int): The number of dummy data to generate.
+        start_id (int, optional): The car_id of the first row.
+                                  Defaults to 1.
+        rng (numpy.random.Generator, optional): The random generator to
+            draw from. Seeded from the `random` module when not given.
+        text_pool (dict, optional): A pool from `build_text_pool` to sample
+                                    additional_details from. Faker writes
+                                    a new paragraph per row when not given.
+
+    Returns:
+        dict: A dictionary mapping each car column name to a NumPy array,
+              except "additional_details" which is a list of strings.
+    """
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+
+    # Categorical indices: body type first, then a model of that body type
+    body_idx = rng.integers(0, car_arrays["n_body_types"], size=n_data)
+    model_idx = _draw_from_groups(
+        rng, body_idx, car_arrays["model_offsets"], car_arrays["model_counts"]
+    )
+
+    # One year per row out of the years listed for its model
+    year_counts = car_arrays["year_counts"][model_idx]
+    year_idx = _draw_from_groups(
+        rng, model_idx, car_arrays["year_offsets"], car_arrays["year_counts"]
+    )
+    years = car_arrays["years"]
+    year_manufactured = np.empty(n_data, dtype=object)
+    if len(years):
+        year_manufactured[:] = years[np.minimum(year_idx, len(years) - 1)]
+    year_manufactured[year_counts == 0] = None  # No year data for the model
+
+    # Rule-derived columns are drawn from the groups of their body type
+    rule_columns = {}
+    for column in ("transmission_type", "fuel_type", "drive_system"):
+        offsets, counts, values = car_arrays[column]
+        rule_columns[column] = values[_draw_from_groups(rng, body_idx, offsets, counts)]
+
+    if text_pool is not None:
+        additional_details = sample_texts(text_pool["paragraphs"], n_data, rng)
+    else:
+        paragraph = get_fake().paragraph  # Resolve the Faker proxy lookup once
+        additional_details = [paragraph() for _ in range(n_data)]
+
+    return {
+        "car_id": np.arange(start_id, start_id + n_data, dtype=np.int64),
+        "manufacture_id": car_arrays["manufacture_id"][model_idx],
+        "model_id": car_arrays["model_id"][model_idx],
+        "body_type_id": car_arrays["body_type_id"][model_idx],
+        "year_manufactured": year_manufactured,
+        "engine_capacity": car_arrays["engine_capacity"][model_idx],
+        "passenger_capacity": car_arrays["passenger_capacity"][body_idx],
+        "transmission_type": rule_columns["transmission_type"],
+        "fuel_type": rule_columns["fuel_type"],
+        "drive_system": rule_columns["drive_system"],
+        "odometer": rng.integers(100, 150_000, size=n_data, endpoint=True),
+        "additional_details": additional_details,
+    }
+
+
+# Column names of the generated fact tables, in row order
+CAR_COLUMNS = [
+    "car_id",
+    "manufacture_id",
+    "model_id",
+    "body_type_id",
+    "year_manufactured",
+    "engine_capacity",
+    "passenger_capacity",
+    "transmission_type",
+    "fuel_type",
+    "drive_system",
+    "odometer",
+    "additional_details",
+]
+AD_COLUMNS = [
+    "ad_id",
+    "user_id",
+    "title",
+    "price",
+    "description",
+    "car_id",
+    "date_posted",
+]
+BID_COLUMNS = ["ad_id", "user_id", "bid_price", "bid_status", "datetime_bid"]
+
+
+def column_rows(columns: dict) -> list:
+    """
+    Assemble a chunk of columns into row tuples of Python values.
+
+    Args:
+        columns (dict): Column name -> NumPy array or list, in row order.
+
+    Returns:
+        list: A list of tuples.
+    """
+    return list(
+        zip(
+            *(
+                column.tolist() if isinstance(column, np.ndarray) else column
+                for column in columns.values()
             )
         )
+    )
+
+
+def iter_car_columns(
+    data: dict,
+    manufactures_table: list,
+    body_types_table: list,
+    car_models_table: list,
+    n_data: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    catalog: dict = None,
+    text_pool: dict = None,
+    start_id: int = 1,
+):
+    """
+    Generate dummy car data in chunks of columns, see `iter_cars`.
+
+    Yields:
+        dict: Column name -> values, from `generate_car_columns`.
+    """
+    if catalog is None:
+        catalog = build_catalog(
+            data, manufactures_table, body_types_table, car_models_table
+        )
+
+    car_arrays = build_car_arrays(catalog)
+    rng = np.random.default_rng(random.getrandbits(64))
+
+    for start in range(0, n_data, chunk_size):
+        n_rows = min(chunk_size, n_data - start)
+        yield generate_car_columns(car_arrays, n_rows, start_id + start, rng, text_pool)
+
+
+def iter_cars(
+    data: dict,
+    manufactures_table: list,
+    body_types_table: list,
+    car_models_table: list,
+    n_data: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    catalog: dict = None,
+    text_pool: dict = None,
+    start_id: int = 1,
+):
+    """
+    Generate dummy car data in chunks of at most `chunk_size` rows.
+
+    Each chunk is drawn column by column with `generate_car_columns` and
+    only assembled into row tuples when it is yielded.
+
+    Args:
+        data (dict): A dictionary containing car data
+                     with body types as keys.
+        manufactures_table (list): A list of manufacturers' data.
+        body_types_table (list): A list of body types data.
+        car_models_table (list): A list of car models data.
+        n_data (int): The number of dummy data to generate.
+        chunk_size (int, optional): The maximum number of rows per chunk.
+                                    Defaults to DEFAULT_CHUNK_SIZE.
+        catalog (dict, optional): A catalog index from `build_catalog`.
+                                  Built from the tables when not given.
+        text_pool (dict, optional): A pool from `build_text_pool` to sample
+                                    text fields from. Faker writes new
+                                    text per row when not given.
+        start_id (int, optional): The ID of the first row, so that
+                                  several calls can cover disjoint ID
+                                  ranges. Defaults to 1.
+
+    Yields:
+        list: A list of tuples containing generated car data.
+    """
+    columns = iter_car_columns(
+        data,
+        manufactures_table,
+        body_types_table,
+        car_models_table,
+        n_data,
+        chunk_size,
+        catalog,
+        text_pool,
+        start_id,
+    )
+    # Assemble rows only at output time
+    for chunk in columns:
+        yield column_rows(chunk)
+
+
+def generate_cars(
+    data: dict,
+    manufactures_table: list,
+    body_types_table: list,
+    car_models_table: list,
+    n_data: int,
+    is_printed: bool = True,
+    catalog: dict = None,
+    text_pool: dict = None,
+    columnar: bool = False,
+) -> list:
+    """
+    Generate dummy car data based on specified parameters.
+
+    Args:
+        data (dict): A dictionary containing car data
+                     with body types as keys.
+        manufactures_table (list): A list of manufacturers' data.
+        body_types_table (list): A list of body types data.
+        car_models_table (list): A list of car models data.
+        n_data (int): The number of dummy data to generate.
+        is_printed (bool, optional): Whether to print the generated data.
+                                     Defaults to True.
+        catalog (dict, optional): A catalog index from `build_catalog`.
+                                  Built from the tables when not given.
+        text_pool (dict, optional): A pool from `build_text_pool` to sample
+                                    text fields from. Faker writes new
+                                    text per row when not given.
+        columnar (bool, optional): Whether to return a compact
+                                   `ColumnTable` instead of a list.
+                                   Defaults to False.
+
+    Returns:
+        list: A list of tuples containing generated car data, or a
+              ColumnTable of it when `columnar` is True.
+    """
+    generate = iter_car_columns if columnar else iter_cars
+    chunks = generate(
+        data,
+        manufactures_table,
+        body_types_table,
+        car_models_table,
+        n_data,
+        catalog=catalog,
+        text_pool=text_pool,
+    )
+    if columnar:
+        dummy_data = ColumnTable.from_column_chunks(chunks, CAR_COLUMNS)
+    else:
+        dummy_data = [row for chunk in chunks for row in chunk]
 
     # Display the generated data if is_printed is True
     if is_printed:
-        header = [
-            "car_id",
-            "manufacture_id",
-            "model_id",
-            "body_type_id",
-            "year_manufactured",
-            "engine_capacity",
-            "passenger_capacity",
-            "transmission_type",
-            "fuel_type",
-            "drive_system",
-            "odometer",
-            "additional_details",
-        ]
-        show_table(dummy_data, header)
+        preview_table(dummy_data, CAR_COLUMNS)
 
     return dummy_data
 
@@ -370,43 +1436,231 @@ def generate_locations(data: dict, is_printed: bool = True) -> list:
     # Check if 'is_printed' is True
     if is_printed:
         # If True, display the location data in a table using
-        # the 'show_table' function
-        show_table(location_list, ["location_id", "city_name", "location"])
+        # the 'preview_table' function
+        preview_table(location_list, ["location_id", "city_name", "location"])
 
     # Return the list of location data
     return location_list
 
 
-def generate_name(n_names):
+def name_pools() -> tuple:
+    """
+    Get the first and last name pools of the Faker person provider.
+
+    Returns:
+        tuple: (first_names, last_names), each a list of unique names.
+    """
+    provider = next(p for p in get_fake().providers if hasattr(p, "first_names"))
+    first_names = list(dict.fromkeys(provider.first_names))
+    last_names = list(dict.fromkeys(provider.last_names))
+    return first_names, last_names
+
+
+def name_capacity() -> int:
     """
-    Generate dummy names.
+    Count the unique "first last" combinations the name pools can produce.
+
+    Returns:
+        int: The number of unique names available without suffixes.
+    """
+    first_names, last_names = name_pools()
+    return len(first_names) * len(last_names)
+
+
+def _permute_indices(indices: np.ndarray, domain: int, key: int) -> np.ndarray:
+    """
+    Map indices in [0, domain) to a keyed pseudo-random permutation of it.
+
+    A balanced Feistel network shuffles the indices over the smallest
+    power-of-four range covering `domain`, and results outside `domain`
+    are fed back in (cycle walking) until they land inside it.
+
+    Args:
+        indices (numpy.ndarray): Indices in [0, domain).
+        domain (int): The size of the permuted range.
+        key (int): The permutation key.
+
+    Returns:
+        numpy.ndarray: The permuted indices, unique for unique inputs.
+    """
+    half_bits = max(1, ((domain - 1).bit_length() + 1) // 2)
+    mask = np.uint64((1 << half_bits) - 1)
+    shift = np.uint64(half_bits)
+    round_keys = [
+        np.uint64((key * (2 * i + 1) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF)
+        for i in range(4)
+    ]
+
+    def feistel(values):
+        left, right = values >> shift, values & mask
+        for round_key in round_keys:
+            mixed = (right ^ round_key) * np.uint64(0xBF58476D1CE4E5B9)
+            mixed ^= mixed >> np.uint64(31)
+            left, right = right, left ^ (mixed & mask)
+        return (left << shift) | right
+
+    result = feistel(indices.astype(np.uint64))
+    outside = result >= domain
+    while outside.any():
+        result[outside] = feistel(result[outside])
+        outside = result >= domain
+    return result.astype(np.int64)
+
+
+def generate_name(n_names, start=0, key=None):
+    """
+    Generate unique dummy names.
+
+    Name number `i` is drawn from a keyed permutation of every first/last
+    name combination, so names never repeat within one key. Past the
+    capacity reported by `name_capacity`, last names get a numeric suffix.
+    Only the call whose names cross the capacity reports it, so a
+    sequence generated in chunks or shards reports it once.
 
     Args:
         n_names (int): The number of dummy names to generate.
+        start (int, optional): The index of the first name, which lets
+                               several calls with the same key continue
+                               one sequence. Defaults to 0.
+        key (int, optional): The permutation key. Drawn from the
+                             `random` module when not given.
 
     Returns:
         list: A list of generated names.
     """
-    names = []  # Initialize an empty list to store generated names
+    if key is None:
+        key = random.getrandbits(64)
 
-    # Loop until the desired number of names is generated
-    while len(names) < n_names:
-        # Generate a random first name and last name using Faker library
-        first_name = fake.first_name()
-        last_name = fake.last_name()
+    first_names, last_names = name_pools()
+    capacity = len(first_names) * len(last_names)
 
-        # Combine the first name and last name to create a full name
-        full_name = f"{first_name} {last_name}"
+    if start <= capacity < start + n_names:
+        print(
+            f"Requested more than the {capacity} unique first/last name "
+            "combinations; adding numeric suffixes."
+        )
+
+    indices = np.arange(start, start + n_names, dtype=np.int64)
+    rounds = (indices // capacity).tolist()
+    permuted = _permute_indices(indices % capacity, capacity, key)
+    first_idx, last_idx = np.divmod(permuted, len(last_names))
 
-        # Check if the full name is not already in the list of names
-        if full_name not in names:
-            # If not, add the full name to the list
-            names.append(full_name)
+    names = []  # Initialize an empty list to store generated names
+    for first, last, round_ in zip(first_idx.tolist(), last_idx.tolist(), rounds):
+        suffix = str(round_ + 1) if round_ else ""
+        names.append(f"{first_names[first]} {last_names[last]}{suffix}")
 
     # Return the list of generated names
     return names
 
 
+def _contact_details(n_data: int, rng) -> tuple:
+    """
+    Draw free email domains and phone numbers for a batch of customers.
+
+    Phone numbers fill the `#` placeholders of the Faker phone formats
+    from one block of random digits instead of one Faker call per row.
+    Locales whose formats use other placeholders fall back to Faker.
+
+    Args:
+        n_data (int): The number of customers.
+        rng (numpy.random.Generator): The random generator to draw from.
+
+    Returns:
+        tuple: (email_domains, phone_numbers), two lists of strings.
+    """
+    fake = get_fake()
+    domain_provider = next(
+        p for p in fake.providers if hasattr(p, "free_email_domains")
+    )
+    domains = list(domain_provider.free_email_domains)
+    email_domains = [
+        domains[i] for i in rng.integers(0, len(domains), size=n_data).tolist()
+    ]
+
+    phone_provider = next(
+        p
+        for p in fake.providers
+        if hasattr(p, "phone_number") and hasattr(p, "formats")
+    )
+    formats = list(phone_provider.formats)
+    if any(c in f for f in formats for c in "%!@{}"):
+        return email_domains, [fake.phone_number() for _ in range(n_data)]
+
+    templates = [f.replace("#", "{}") for f in formats]
+    width = max(f.count("#") for f in formats)
+    digits = "".join(map(str, rng.integers(0, 10, size=n_data * width).tolist()))
+    template_idx = rng.integers(0, len(templates), size=n_data).tolist()
+    phone_numbers = [
+        templates[t].format(*digits[i * width : (i + 1) * width])
+        for i, t in enumerate(template_idx)
+    ]
+    return email_domains, phone_numbers
+
+
+# Generate customer data in chunks
+def iter_customer(
+    location_table: list,
+    n_data: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    start_id: int = 1,
+    name_key: int = None,
+):
+    """Generate dummy customer data in chunks of at most `chunk_size` rows.
+
+    Args:
+        location_table (list): A list of location data.
+        n_data (int): The number of dummy data to generate.
+        chunk_size (int, optional): The maximum number of rows per chunk.
+                                    Defaults to DEFAULT_CHUNK_SIZE.
+        start_id (int, optional): The ID of the first row, so that
+                                  several calls can cover disjoint ID
+                                  ranges. Defaults to 1.
+        name_key (int, optional): The `generate_name` permutation key.
+                                  Calls sharing a key get unique names
+                                  across their ID ranges. Drawn from the
+                                  `random` module when not given.
+
+    Yields:
+        list: A list of tuples containing generated customer data.
+    """
+    chunk = []  # Initialize an empty list to store the current chunk
+
+    user_id = start_id - 1
+
+    # Names of every chunk come from one permutation so they stay unique
+    if name_key is None:
+        name_key = random.getrandbits(64)
+    rng = np.random.default_rng(random.getrandbits(64))
+
+    # Collect the location IDs once instead of once per customer
+    location_ids = [id[0] for id in location_table]
+
+    for start in range(0, n_data, chunk_size):
+        n_rows = min(chunk_size, n_data - start)
+        names = generate_name(n_rows, start_id - 1 + start, name_key)
+        email_domains, contacts = _contact_details(n_rows, rng)
+        location_idx = rng.integers(0, len(location_ids), size=n_rows).tolist()
+
+        for name, email_domain, contact, loc in zip(
+            names, email_domains, contacts, location_idx
+        ):
+            user_id += 1
+            # Split the full name into first name and last name
+            first_name, last_name = name.split(" ", 1)
+
+            # Generate email using the full name and a free email domain
+            email = f"{name.lower().replace(' ','.')}@{email_domain}"
+
+            # Create a tuple containing customer data and add it to the chunk
+            chunk.append(
+                (user_id, first_name, last_name, email, contact, location_ids[loc])
+            )
+
+        yield chunk
+        chunk = []
+
+
 # Generate customer data
 def generate_customer(
     location_table: list, n_data: int, is_printed: bool = True
@@ -421,37 +1675,14 @@ def generate_customer(
     Returns:
     list: A list of tuples containing generated customer data.
     """
-    customer_data = []  # Initialize an empty list to store customer data
-
-    user_id = 0
-
-    data = generate_name(n_data)  # Generate a list of dummy names
-
-    # Iterate through the list of generated names
-    for name in data:
-        user_id += 1
-        # Split the full name into first name and last name
-        first_name = name.split(" ")[0]
-        last_name = name.split(" ")[1]
-
-        # Generate email using the full name and Faker's free email domain
-        email = f"{name.lower().replace(' ','.')}@{fake.free_email_domain()}"
-
-        # Generate a fake phone number
-        contact = fake.phone_number()
-
-        # Choose a random location ID from the list of location data
-        location_id = random.choice([id[0] for id in location_table])
-
-        # Create a tuple containing customer data and append it to the list
-        customer_data.append(
-            (user_id, first_name, last_name, email, contact, location_id)
-        )
+    customer_data = [
+        row for chunk in iter_customer(location_table, n_data) for row in chunk
+    ]
 
     # Check if 'is_printed' is True
     if is_printed:
         # If True, display the customer data in a table using
-        # the 'show_table' function
+        # the 'preview_table' function
         header = [
             "user_id",
             "first_name",
@@ -460,7 +1691,7 @@ def generate_customer(
             "contact",
             "location_id",
         ]
-        show_table(customer_data, header)
+        preview_table(customer_data, header)
 
     # Return the list of customer data
     return customer_data
@@ -473,67 +1704,285 @@ def generate_ad_title():
     Returns:
         str: A randomly generated advertisement title.
     """
-    # List of keywords
-    keywords = [
-        "Bekas",
-        "Tahun",
-        "Km",
-        "Kondisi",
-        "Mulus",
-        "Service",
-        "Baru",
-        "Jarang",
-        "Terawat",
-        "Mesin",
-        "Interior",
-        "Eksterior",
-        "Full",
-        "Original",
-        "Pajak",
-        "Surat",
-        "Siap",
-        "Oli",
-        "Ban",
-        "Velg",
-        "Warna",
-        "Cat",
-        "Jual",
-        "Murah",
-        "Harga",
-        "Cash",
-        "Kredit",
-        "DP",
-        "Cicilan",
-        "Negotiable",
-        "Nego",
-        "Asli",
-        "Mobil",
-        "Berkualitas",
-        "Pakai",
-        "Langsung",
-        "Terjamin",
-        "Dokumen",
-        "Tangan",
-        "Jarak",
-        "Kendaraan",
-        "Pemakaian",
-        "Pribadi",
-        "Bukan Rental",
-        "Nopol",
-        "Kilometer",
-        "STNK",
-    ]
-
     # Randomly choose keywords to create a title
     num_keywords = random.randint(5, 10)  # Choose 5 to 10 keywords
-    selected_keywords = random.sample(keywords, num_keywords)
+    selected_keywords = random.sample(_CAPITALIZED_AD_TITLE_KEYWORDS, num_keywords)
 
-    # Capitalize the first letter of each keyword and join them to form a title
-    title = " ".join([keyword.capitalize() for keyword in selected_keywords])
+    # Join the capitalized keywords to form a title
+    title = " ".join(selected_keywords)
 
     return title
 
 
+# Number of distinct paragraphs and titles in a default text pool
+DEFAULT_TEXT_POOL_SIZE = 1_000
+
+
+def build_text_pool(
+    n_paragraphs: int = DEFAULT_TEXT_POOL_SIZE,
+    n_titles: int = DEFAULT_TEXT_POOL_SIZE,
+    file_path: str = None,
+) -> dict:
+    """
+    Build a pool of paragraphs and ad titles to sample text fields from.
+
+    Args:
+        n_paragraphs (int, optional): The number of distinct paragraphs.
+                                      Defaults to DEFAULT_TEXT_POOL_SIZE.
+        n_titles (int, optional): The number of distinct ad titles.
+                                  Defaults to DEFAULT_TEXT_POOL_SIZE.
+        file_path (str, optional): A JSON file to persist the pool in. An
+                                   existing file with the requested sizes
+                                   is loaded instead of building the pool.
+
+    Returns:
+        dict: A dictionary with "paragraphs" and "titles" lists.
+    """
+    if file_path is not None and os.path.exists(file_path):
+        with open(file_path, encoding="utf-8") as file:
+            text_pool = json.load(file)
+        if (
+            len(text_pool.get("paragraphs", [])) == n_paragraphs
+            and len(text_pool.get("titles", [])) == n_titles
+        ):
+            return text_pool
+
+    paragraph = get_fake().paragraph  # Resolve the Faker proxy lookup once
+    text_pool = {
+        "paragraphs": [paragraph() for _ in range(n_paragraphs)],
+        "titles": [generate_ad_title() for _ in range(n_titles)],
+    }
+
+    if file_path is not None:
+        folder_path = os.path.dirname(file_path)
+        if folder_path and not os.path.exists(folder_path):
+            os.makedirs(folder_path, exist_ok=True)
+        with open(file_path, mode="w", encoding="utf-8") as file:
+            json.dump(text_pool, file, ensure_ascii=False)
+
+    return text_pool
+
+
+def sample_texts(texts: list, n_data: int, rng=None) -> list:
+    """
+    Sample texts from a pool with replacement.
+
+    Args:
+        texts (list): The pool of texts, e.g. `text_pool["paragraphs"]`.
+        n_data (int): The number of texts to sample.
+        rng (numpy.random.Generator, optional): The random generator to
+            draw from. Seeded from the `random` module when not given.
+
+    Returns:
+        list: A list of `n_data` texts.
+    """
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+    return [texts[i] for i in rng.integers(0, len(texts), size=n_data).tolist()]
+
+
+def build_price_index(catalog: dict) -> dict:
+    """
+    Build a model_id -> list of prices index from a catalog.
+
+    Args:
+        catalog (dict): A catalog index from `build_catalog`.
+
+    Returns:
+        dict: A dictionary mapping each model_id to its list of prices.
+              Models without a price map to an empty list.
+    """
+    price_index = {}
+    for model_id, model in catalog["models"].items():
+        price = model["harga"]
+        if isinstance(price, list):
+            price_index[model_id] = list(price)
+        else:
+            price_index[model_id] = [] if price is None else [price]
+    return price_index
+
+
+def _datetimes_this_year(rng, n_data: int) -> np.ndarray:
+    """
+    Draw datetimes between the start of the current year and now, like
+    Faker's `date_time_this_year`.
+
+    Args:
+        rng (numpy.random.Generator): The random generator to draw from.
+        n_data (int): The number of datetimes to draw.
+
+    Returns:
+        numpy.ndarray: An array of `datetime64[us]` values.
+    """
+    now = np.datetime64(datetime.now(), "us")
+    start_of_year = now.astype("datetime64[Y]").astype("datetime64[us]")
+    span = int((now - start_of_year) / np.timedelta64(1, "us"))
+    # Scaled floats use one draw per value whatever the span, so that the
+    # draws after them do not depend on the time of the run
+    offsets = np.minimum((rng.random(n_data) * (span + 1)).astype(np.int64), span)
+    return start_of_year + offsets.astype("timedelta64[us]")
+
+
+def iter_advertisement_columns(
+    data: dict,
+    customer_table: list,
+    cars_table: list,
+    car_models_table: list,
+    n_data: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    catalog: dict = None,
+    text_pool: dict = None,
+    start_id: int = 1,
+):
+    """
+    Generate dummy advertisement data in chunks of columns, see
+    `iter_advertisement`.
+
+    Yields:
+        dict: Column name -> NumPy array or list of the ads in the chunk.
+    """
+    if catalog is None:
+        catalog = build_catalog(data, [], car_models_table=car_models_table)
+
+    # Prebuilt arrays so that every ad only samples positions
+    price_index = build_price_index(catalog)
+    model_ids = list(price_index)
+    model_pos = {model_id: pos for pos, model_id in enumerate(model_ids)}
+    price_offsets, price_counts, prices = _flatten_groups(
+        [price_index[model_id] for model_id in model_ids]
+    )
+
+    # Sidecar views hold the IDs as a range and the models as codes
+    if isinstance(customer_table, dict):
+        customer_ids = customer_table["user_id"]
+    else:
+        customer_ids = table_column(customer_table, 0)
+    if isinstance(cars_table, dict):
+        car_ids = cars_table["car_id"]
+        car_model_codes = cars_table["model_id"]
+        car_model_ids = cars_table["categories"]["model_id"]
+    else:
+        car_ids = table_column(cars_table, 0)
+        car_model_codes, car_model_ids = table_codes(cars_table, 2)
+    code_pos = np.array(
+        [model_pos.get(model_id, -1) for model_id in car_model_ids.tolist()],
+        dtype=np.int64,
+    )
+
+    # Only cars whose model has a price can be advertised. Drawing among
+    # them, instead of skipping rows, keeps exactly n_data dense IDs.
+    car_pos = code_pos[car_model_codes]
+    priced = car_pos >= 0
+    priced[priced] = price_counts[car_pos[priced]] > 0
+    for code in np.unique(car_model_codes[~priced]).tolist():
+        if code_pos[code] < 0:
+            print(f"Car model ID {car_model_ids[code]} not found in the list")
+        else:
+            model_name = catalog["models"][model_ids[code_pos[code]]]["model_name"]
+            print(f"Price not found for model: {model_name}")
+    priced_idx = np.flatnonzero(priced)
+    if n_data and not len(priced_idx):
+        raise ValueError("Ads need at least one car whose model has a price.")
+
+    rng = np.random.default_rng(random.getrandbits(64))
+
+    ad_id_counter = start_id
+
+    for start in range(0, n_data, chunk_size):
+        n_rows = min(chunk_size, n_data - start)
+
+        # Randomly select users and cars by position
+        user_idx = rng.integers(0, len(customer_ids), size=n_rows)
+        car_idx = priced_idx[rng.integers(0, len(priced_idx), size=n_rows)]
+
+        # Pick one price of the model of every selected car
+        pos = code_pos[car_model_codes[car_idx]]
+        price_idx = _draw_from_groups(rng, pos, price_offsets, price_counts)
+        row_prices = prices[price_idx]
+
+        # Generate random dates within the current year for date_posted
+        date_posted = _datetimes_this_year(rng, n_rows) - (
+            rng.integers(0, 150, size=n_rows, endpoint=True).astype("timedelta64[D]")
+        )
+
+        # Titles and descriptions come from the pool or from Faker
+        if text_pool is not None:
+            titles = sample_texts(text_pool["titles"], n_rows, rng)
+            descriptions = sample_texts(text_pool["paragraphs"], n_rows, rng)
+        else:
+            paragraph = get_fake().paragraph
+            texts = [(generate_ad_title(), paragraph()) for _ in range(n_rows)]
+            titles = [title for title, _ in texts]
+            descriptions = [description for _, description in texts]
+
+        yield {
+            "ad_id": np.arange(ad_id_counter, ad_id_counter + n_rows, dtype=np.int64),
+            "user_id": take(customer_ids, user_idx),
+            "title": titles,
+            "price": row_prices,
+            "description": descriptions,
+            "car_id": take(car_ids, car_idx),
+            "date_posted": date_posted,
+        }
+        ad_id_counter += n_rows
+
+
+def iter_advertisement(
+    data: dict,
+    customer_table: list,
+    cars_table: list,
+    car_models_table: list,
+    n_data: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    catalog: dict = None,
+    text_pool: dict = None,
+    start_id: int = 1,
+):
+    """
+    Generate dummy advertisement data in chunks of at most `chunk_size` rows.
+
+    Only cars whose model has a known price are advertised; the others
+    are reported once and never drawn, so that exactly `n_data` ads with
+    dense IDs are generated.
+
+    Args:
+        data (dict) : A dictionary containing car data
+                      with body types as keys.
+        customer_table (list): A list of customer data, a ColumnTable, or
+                               a sidecar view from `open_sidecar`.
+        cars_table (list): A list of cars data, a ColumnTable, or a
+                           sidecar view from `open_sidecar`.
+        car_models_table (list): A list of car models data.
+        n_data (int): The number of dummy advertisement data to generate.
+        chunk_size (int, optional): The maximum number of rows per chunk.
+                                    Defaults to DEFAULT_CHUNK_SIZE.
+        catalog (dict, optional): A catalog index from `build_catalog`.
+                                  Built from the tables when not given.
+        text_pool (dict, optional): A pool from `build_text_pool` to sample
+                                    text fields from. Faker writes new
+                                    text per row when not given.
+        start_id (int, optional): The ID of the first row, so that
+                                  several calls can cover disjoint ID
+                                  ranges. Defaults to 1.
+
+    Yields:
+        list: A list of tuples containing generated advertisement data.
+    """
+    columns = iter_advertisement_columns(
+        data,
+        customer_table,
+        cars_table,
+        car_models_table,
+        n_data,
+        chunk_size,
+        catalog,
+        text_pool,
+        start_id,
+    )
+    for chunk in columns:
+        yield column_rows(chunk)
+
+
 def generate_advertisement(
     data: dict,
     customer_table: list,
@@ -541,6 +1990,9 @@ def generate_advertisement(
     car_models_table: list,
     n_data: int,
     is_printed: bool = True,
+    catalog: dict = None,
+    text_pool: dict = None,
+    columnar: bool = False,
 ) -> list:
     """
     Generate dummy advertisement data based on specified parameters.
@@ -548,106 +2000,180 @@ def generate_advertisement(
     Args:
         data (dict) : A dictionary containing car data
                       with body types as keys.
-        customer_table (list): A list of customer data.
-        cars_table (list): A list of cars data.
+        customer_table (list): A list of customer data, a ColumnTable, or
+                               a sidecar view from `open_sidecar`.
+        cars_table (list): A list of cars data, a ColumnTable, or a
+                           sidecar view from `open_sidecar`.
         car_models_table (list): A list of car models data.
         n_data (int): The number of dummy advertisement data to generate.
         is_printed (bool, optional): Whether to print the generated data.
                                      Defaults to True.
+        catalog (dict, optional): A catalog index from `build_catalog`.
+                                  Built from the tables when not given.
+        text_pool (dict, optional): A pool from `build_text_pool` to sample
+                                    text fields from. Faker writes new
+                                    text per row when not given.
+        columnar (bool, optional): Whether to return a compact
+                                   `ColumnTable` instead of a list.
+                                   Defaults to False.
 
     Returns:
-        list: A list of tuples containing generated advertisement data.
+        list: A list of tuples containing generated advertisement data, or
+              a ColumnTable of it when `columnar` is True.
     """
-    ad_list = []
+    generate = iter_advertisement_columns if columnar else iter_advertisement
+    chunks = generate(
+        data,
+        customer_table,
+        cars_table,
+        car_models_table,
+        n_data,
+        catalog=catalog,
+        text_pool=text_pool,
+    )
+    if columnar:
+        ad_list = ColumnTable.from_column_chunks(chunks, AD_COLUMNS)
+    else:
+        ad_list = [row for chunk in chunks for row in chunk]
 
-    ad_id_counter = 1
+    if is_printed:
+        # Display the generated ad data in a table
+        preview_table(ad_list, AD_COLUMNS)
 
-    for _ in range(n_data):
-        # Randomly select user_id from customer_data
-        user_id = random.choice([id[0] for id in customer_table])
+    return ad_list
 
-        # Generate a random ad title using the generate_ad_title function
-        title = generate_ad_title()
 
-        # Generate a random ad description using faker's paragraph function
-        description = fake.paragraph()
+def build_ad_view(advertisement_table: list) -> dict:
+    """
+    Build a columnar view of the advertisement columns bids depend on.
 
-        # Randomly select car_id and car_model_id from cars_data
-        car_id, car_model_id = random.choice([(id[0], id[2]) for id in cars_table])
+    Args:
+        advertisement_table (list): A list of advertisement data, or a
+                                    ColumnTable, whose columns are then
+                                    taken without assembling any rows.
 
-        try:
-            # Find the index of the car model in car_models_data
-            # based on car_model_id
-            index = next(
-                index
-                for index, tuple_value in enumerate(car_models_table)
-                if car_model_id in tuple_value
-            )
-            model_name = car_models_table[index][2]
-
-            price = None  # Initialize price variable
-
-            # Iterate through car_data to find matching model name and
-            # retrieve price
-            for body_type in data.keys():
-                for model, details in data[body_type].items():
-                    if model == model_name:
-                        # If price is a list, randomly choose a price from the list
-                        if isinstance(details["harga"], list):
-                            price = random.choice(details["harga"])
-                        else:
-                            # If price is an integer, set the price directly
-                            price = details["harga"]
-                        break  # Exit the loop after finding the price
-
-            if price is None:
-                print(f"Price not found for model: {model_name}")
-                continue
-
-        except StopIteration:
-            print(f"Car model ID {car_model_id} not found in the list")
-            continue
-
-        # Generate a random date within the current year for date_posted
-        date_posted = fake.date_time_this_year() - timedelta(
-            days=random.randint(0, 150)
+    Returns:
+        dict: A dictionary with "ad_id", "user_id", "price" and
+              "date_posted" NumPy arrays, one entry per advertisement.
+    """
+    return {
+        "ad_id": table_column(advertisement_table, 0).astype(np.int64),
+        "user_id": table_column(advertisement_table, 1).astype(np.int64),
+        "price": table_column(advertisement_table, 3).astype(np.int64),
+        "date_posted": table_column(advertisement_table, 6).astype("datetime64[us]"),
+    }
+
+
+def iter_bid_columns(
+    advertisement_table: list,
+    customer_table: list,
+    n_data: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ad_view: dict = None,
+):
+    """
+    Generate dummy bid data in chunks of columns, see `iter_bids`.
+
+    Yields:
+        dict: Column name -> NumPy array of the bids in the chunk.
+    """
+    if ad_view is None:
+        ad_view = build_ad_view(advertisement_table)
+
+    if isinstance(customer_table, dict):
+        customer_ids = customer_table["user_id"]
+        n_customers = len(customer_ids)
+    else:
+        customer_ids = table_column(customer_table, 0).astype(np.int64)
+        n_customers = len(np.unique(customer_ids))
+    if n_customers < 2:
+        raise ValueError(
+            "Bids need at least two distinct customers, so that every ad has "
+            "a bidder besides its owner."
         )
 
-        if isinstance(price, list):
-            selected_price = random.choice(price)
-        else:
-            selected_price = price
+    n_ads = len(ad_view["ad_id"])
+    bid_statuses = np.array(["approved", "rejected"], dtype=object)
+    rng = np.random.default_rng(random.getrandbits(64))
 
-        # Append the generated ad data to ad_list
-        ad_list.append(
-            (
-                ad_id_counter,
-                user_id,
-                title,
-                selected_price,
-                description,
-                car_id,
-                date_posted,
+    for start in range(0, n_data, chunk_size):
+        n_rows = min(chunk_size, n_data - start)
+
+        # Randomly select advertisements
+        ad_idx = rng.integers(0, n_ads, size=n_rows)
+        owners = ad_view["user_id"][ad_idx]
+
+        # Randomly select bidders, redrawing the ones that own the ad
+        user_ids = take(customer_ids, rng.integers(0, len(customer_ids), size=n_rows))
+        own_ad = user_ids == owners
+        while own_ad.any():
+            user_ids[own_ad] = take(
+                customer_ids,
+                rng.integers(0, len(customer_ids), size=int(own_ad.sum())),
             )
+            own_ad = user_ids == owners
+
+        # Bid prices between 80% and 95% of the ad price in 1.5M steps
+        price = ad_view["price"][ad_idx]
+        low_price = (0.8 * price).astype(np.int64)
+        high_price = (0.95 * price).astype(np.int64)
+        n_steps = (high_price - low_price) // 1_500_000 + 1
+        bid_price = low_price + 1_500_000 * (rng.random(n_rows) * n_steps).astype(
+            np.int64
         )
-        ad_id_counter += 1
 
-    if is_printed:
-        # Display the generated ad data in a table
-        show_table(
-            ad_list,
-            [
-                "ad_id",
-                "user_id",
-                "title",
-                "price",
-                "description",
-                "car_id",
-                "date_posted",
-            ],
-        )
+        # 30% 'approved' and 70% 'rejected'
+        bid_status = bid_statuses[(rng.random(n_rows) >= 0.3).astype(np.int64)]
 
-    return ad_list
+        # Bid one to seven days after the ad's date_posted
+        datetime_bid = ad_view["date_posted"][ad_idx] + rng.integers(
+            1, 7, size=n_rows, endpoint=True
+        ).astype("timedelta64[D]")
+
+        yield {
+            "ad_id": take(ad_view["ad_id"], ad_idx),
+            "user_id": user_ids,
+            "bid_price": bid_price,
+            "bid_status": bid_status,
+            "datetime_bid": datetime_bid,
+        }
+
+
+def iter_bids(
+    advertisement_table: list,
+    customer_table: list,
+    n_data: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ad_view: dict = None,
+):
+    """
+    Generate dummy bid data in chunks of at most `chunk_size` rows.
+
+    Ads are sampled by position from a columnar view, bidders are drawn
+    by rejection sampling against the ad owner, and the price, status and
+    datetime columns are drawn for the whole chunk at once.
+
+    Args:
+        advertisement_table (list): A list of advertisement data, or a
+                                    ColumnTable.
+        customer_table (list): A list of customer data, a ColumnTable, or
+                               a sidecar view from `open_sidecar`.
+        n_data (int): The number of dummy bid data to generate.
+        chunk_size (int, optional): The maximum number of rows per chunk.
+                                    Defaults to DEFAULT_CHUNK_SIZE.
+        ad_view (dict, optional): A columnar view from `build_ad_view`,
+                                  or a sidecar view of "ads" from
+                                  `open_sidecar`. Built from
+                                  `advertisement_table` when not given.
+
+    Yields:
+        list: A list of tuples containing generated bid data.
+    """
+    columns = iter_bid_columns(
+        advertisement_table, customer_table, n_data, chunk_size, ad_view
+    )
+    for chunk in columns:
+        yield column_rows(chunk)
 
 
 def generate_bids(
@@ -655,52 +2181,36 @@ def generate_bids(
     customer_table: list,
     n_data: int,
     is_printed: bool = True,
+    columnar: bool = False,
 ) -> list:
     """
     Generate dummy bid data based on specified parameters.
 
     Args:
-        advertisement_table (list): A list of advertisement data.
-        customer_table (list): A list of customer data.
+        advertisement_table (list): A list of advertisement data, or a
+                                    ColumnTable.
+        customer_table (list): A list of customer data, a ColumnTable, or
+                               a sidecar view from `open_sidecar`.
         n_data (int): The number of dummy bid data to generate.
         is_printed (bool, optional): Whether to print the generated data.
                                      Defaults to True.
+        columnar (bool, optional): Whether to return a compact
+                                   `ColumnTable` instead of a list.
+                                   Defaults to False.
 
     Returns:
-        list: A list of tuples containing generated bid data.
+        list: A list of tuples containing generated bid data, or a
+              ColumnTable of it when `columnar` is True.
     """
-    bid_list = []
-
-    for _ in range(n_data):
-        # Randomly select an advertisement
-        ad_id, user, price, date_posted = random.choice(
-            [(id[0], id[1], id[3], id[6]) for id in advertisement_table]
-        )
-
-        # Randomly select a user_id for bidding (excluding the original ad
-        user_id = random.choice([id[0] for id in customer_table if id[0] != user])
-
-        # Calculate low and high bid prices based on the ad price
-        low_price = int(0.8 * price)
-        high_price = int(0.95 * price)
-
-        # Generate a random bid price within the calculated range
-        bid_price = fake.random_int(low_price, high_price, 1_500_000)
-
-        # Randomly choose bid_status with weights
-        # (70% for 'rejected', 30% for 'approved')
-        bid_status = random.choices(["approved", "rejected"], weights=(0.3, 0.7))[0]
-
-        # Generate a random datetime for bidding  after ad's date_posted
-        datetime_bid = date_posted + timedelta(days=random.randint(1, 7))
-
-        # Append the generated bid data to bid_list
-        bid_list.append((ad_id, user_id, bid_price, bid_status, datetime_bid))
+    generate = iter_bid_columns if columnar else iter_bids
+    chunks = generate(advertisement_table, customer_table, n_data)
+    if columnar:
+        bid_list = ColumnTable.from_column_chunks(chunks, BID_COLUMNS)
+    else:
+        bid_list = [row for chunk in chunks for row in chunk]
 
     if is_printed:
         # Display the generated bid data in a table
-        show_table(
-            bid_list, ["ad_id", "user_id", "bid_price", "bid_status", "datetime_bid"]
-        )
+        preview_table(bid_list, BID_COLUMNS)
 
     return bid_list
@@ -0,0 +1,170 @@
+import csv
+import json
+import os
+import random
+from collections import deque
+from datetime import datetime
+
+from create_dummy import COMPRESSION_EXTENSIONS, open_text_input
+from sinks import TABLE_SCHEMAS
+
+# Rows of each existing parent table that appended rows may refer to
+DEFAULT_REFERENCE_ROWS = 100_000
+
+# File that records the name key and max IDs of a CSV output folder
+MANIFEST_FILENAME = "manifest.json"
+
+# Fact tables with a sequential ID in their first column
+ID_TABLES = ("cars", "user", "ads")
+
+
+def read_csv_tail(file_path: str, n_rows: int) -> list:
+    """
+    Read the last rows of a CSV file, without its header row.
+
+    Plain files are read backwards from the end, so the cost does not
+    depend on the size of the file. Compressed files cannot be read
+    backwards and are decompressed in one streaming pass.
+
+    Args:
+        file_path (str): The CSV file, optionally ".gz" or ".zst".
+        n_rows (int): The number of rows to read.
+
+    Returns:
+        list: Up to `n_rows` rows, as lists of strings, in file order.
+    """
+    if n_rows <= 0:
+        return []
+
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in COMPRESSION_EXTENSIONS:
+        with open_text_input(file_path) as file:
+            reader = csv.reader(file)
+            next(reader, None)  # Skip the header row
+            return list(deque(reader, maxlen=n_rows))
+
+    block_size = 1024 * 1024
+    with open(file_path, mode="rb") as file:
+        position = file.seek(0, os.SEEK_END)
+        data = b""
+        # One more line than needed, since the first one may be partial
+        while position > 0 and data.count(b"\n") <= n_rows + 1:
+            step = min(block_size, position)
+            position -= step
+            file.seek(position)
+            data = file.read(step) + data
+
+    lines = data.decode("utf-8").splitlines()
+    # Drop the partial first line, or the header row at the file start
+    lines = lines[1:]
+    return list(csv.reader(lines[-n_rows:]))
+
+
+def parse_rows(table: str, rows: list) -> list:
+    """
+    Convert CSV rows back into the tuples the generators produce.
+
+    Args:
+        table (str): The table name, one of TABLE_SCHEMAS.
+        rows (list): Rows as lists of strings.
+
+    Returns:
+        list: Rows as tuples of typed values; empty fields become None.
+    """
+    parsers = {
+        "integer": int,
+        "real": float,
+        "timestamp": datetime.fromisoformat,
+        "text": str,
+        "point": str,
+    }
+    types = [parsers[column_type] for _, column_type in TABLE_SCHEMAS[table]["columns"]]
+    return [
+        tuple(None if value == "" else parse(value) for parse, value in zip(types, row))
+        for row in rows
+    ]
+
+
+def existing_state(
+    folder_path: str,
+    extension: str,
+    tables: list,
+    references: list,
+    reference_rows: int = DEFAULT_REFERENCE_ROWS,
+) -> dict:
+    """
+    Recover what appended rows need from the existing CSV outputs.
+
+    Only the tails of the files are read. User IDs are sequential, so
+    the referenced users are drawn from the whole ID range instead.
+
+    Args:
+        folder_path (str): The output folder.
+        extension (str): The file extension, e.g. "csv" or "csv.gz".
+        tables (list): The tables that rows are appended to.
+        references (list): The existing tables that appended rows refer
+                           to: "cars", "user" or "ads".
+        reference_rows (int, optional): The maximum number of existing
+                                        rows to refer to per table.
+
+    Returns:
+        dict: Table name -> {"max_id": the last ID (0 when the file does
+              not exist), "rows": the referenced rows as tuples}. For
+              "user", only the first value of each row is set.
+    """
+    state = {}
+    for table in set(tables) | set(references):
+        file_path = os.path.join(folder_path, f"{table}.{extension}")
+        if not os.path.exists(file_path):
+            state[table] = {"max_id": 0, "rows": []}
+            continue
+
+        n_rows = 1
+        if table in references and table != "user":
+            n_rows = reference_rows
+        rows = parse_rows(table, read_csv_tail(file_path, n_rows))
+
+        max_id = rows[-1][0] if rows and table in ID_TABLES else 0
+        if table == "user" and "user" in references:
+            user_ids = range(1, max_id + 1)
+            if len(user_ids) > reference_rows:
+                user_ids = sorted(random.sample(user_ids, reference_rows))
+            rows = [(user_id,) for user_id in user_ids]
+        elif table not in references:
+            rows = []
+
+        state[table] = {"max_id": max_id, "rows": rows}
+    return state
+
+
+def read_manifest(folder_path: str) -> dict:
+    """
+    Read the manifest of an output folder.
+
+    Args:
+        folder_path (str): The output folder.
+
+    Returns:
+        dict: The manifest, or None when there is none.
+    """
+    file_path = os.path.join(folder_path, MANIFEST_FILENAME)
+    if not os.path.exists(file_path):
+        return None
+    with open(file_path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def write_manifest(folder_path: str, name_key: int, max_ids: dict):
+    """
+    Write the manifest of an output folder.
+
+    Args:
+        folder_path (str): The output folder.
+        name_key (int): The `generate_name` key of the user table, which
+                        appended users need to keep names unique.
+        max_ids (dict): Table name -> last ID written.
+    """
+    with open(
+        os.path.join(folder_path, MANIFEST_FILENAME), mode="w", encoding="utf-8"
+    ) as file:
+        json.dump({"name_key": name_key, "max_ids": max_ids}, file, indent=2)
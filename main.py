@@ -1,14 +1,67 @@
+import argparse
+import itertools
+import operator
+import os
+import random
+import threading
+import time
+
+import create_dummy
 from create_dummy import (
-    list_to_csv,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_TEXT_POOL_SIZE,
+    chunks_to_csv,
+    show_export_report,
+    show_table,
     xlsx_to_dict,
+    load_catalog,
+    new_preview,
+    preview_rows,
+    previewed_chunks,
+    show_preview,
+    build_catalog,
+    build_text_pool,
+    build_ad_view,
     generate_body_types,
     generate_manufactures,
     generate_car_models,
-    generate_cars,
     generate_locations,
-    generate_customer,
-    generate_advertisement,
-    generate_bids,
+)
+from columnar import ColumnTable
+from parallel import COLUMNAR_TABLES, generate_sharded, iter_shards
+from incremental import (
+    DEFAULT_REFERENCE_ROWS,
+    ID_TABLES,
+    MANIFEST_FILENAME,
+    existing_state,
+    read_manifest,
+    write_manifest,
+)
+from pipeline import run_pipeline
+from streams import stream, stream_tables
+from sidecars import (
+    SIDECAR_COLUMNS,
+    SIDECAR_FOLDER,
+    open_sidecar,
+    sidecar_chunks,
+    write_sidecar,
+)
+from profiling import (
+    count_faker_calls,
+    new_trace,
+    show_trace,
+    stage,
+    timed_chunks,
+    write_trace,
+)
+from sinks import (
+    TABLE_ORDER,
+    table_headers,
+    chunks_to_arrow,
+    chunks_to_parquet,
+    chunks_to_pg_copy,
+    export_to_sqlite,
+    pg_load_script,
 )
 
 car_data = {
@@ -328,102 +381,859 @@ car_data = {
     },
 }
 
-# Call the function and store the result
-body_type_data = generate_body_types(data=car_data, is_printed=False)
+# Row counts of the fact tables at scale factor 1
+BASE_COUNTS = {"cars": 200, "user": 400, "ads": 500, "bid": 1000}
 
-# Generate manufacturers data
-manufactures_data = generate_manufactures(data=car_data, is_printed=False)
+# Tables that the rows of each table refer to
+TABLE_DEPENDENCIES = {
+    "user": ["locations"],
+    "ads": ["user", "cars"],
+    "bid": ["ads", "user"],
+}
 
-# Generate and sort car models data
-car_models_data = generate_car_models(
-    data=car_data, manufactures_table=manufactures_data, is_printed=False
-)
+# Command-line flags that set the row count of each fact table
+COUNT_FLAGS = {"cars": "--cars", "user": "--users", "ads": "--ads", "bid": "--bids"}
 
-# Generate cars data
-cars_table_data = generate_cars(
-    data=car_data,
-    manufactures_table=manufactures_data,
-    body_types_table=body_type_data,
-    car_models_table=car_models_data,
-    n_data=200,
-    is_printed=False,
-)
+# Supported output formats; the CSV ones double as file extensions
+OUTPUT_FORMATS = ["csv", "csv.gz", "csv.zst", "sqlite", "postgres", "parquet", "arrow"]
 
-# Load data from XLSX file and generate location data
-xlsx_file_path = "city.xlsx"
-sheet_name = "city"
-location_data = generate_locations(
-    data=xlsx_to_dict(xlsx_file_path, sheet_name=sheet_name), is_printed=False
-)
+# File name of the SQLite database in the output folder
+SQLITE_FILENAME = "dummy.db"
 
-# Generate customer data
-customer_data = generate_customer(
-    location_table=location_data, n_data=400, is_printed=False
-)
 
-# generate_advertisement function with the required parameters
-advertisement_data = generate_advertisement(
-    data=car_data,
-    customer_table=customer_data,
-    cars_table=cars_table_data,
-    car_models_table=car_models_data,
-    n_data=500,
-    is_printed=False,
-)
+def parse_args(argv: list = None) -> argparse.Namespace:
+    """
+    Parse the command-line arguments.
+
+    Args:
+        argv (list, optional): The arguments. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Generate dummy data for the car advertisement database."
+    )
+    parser.add_argument(
+        "-s",
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Scale factor of all fact table counts; 1 gives 200 cars, "
+        "400 users, 500 ads and 1000 bids (default: 1).",
+    )
+    for table, flag in COUNT_FLAGS.items():
+        parser.add_argument(
+            flag,
+            dest=table,
+            type=int,
+            metavar="N",
+            help=f"Number of {table} rows, overriding --scale.",
+        )
+    parser.add_argument(
+        "-t",
+        "--tables",
+        nargs="+",
+        choices=TABLE_ORDER,
+        default=TABLE_ORDER,
+        metavar="TABLE",
+        help="Tables to export (default: all). Parent tables that are not "
+        "listed are still generated but not written.",
+    )
+    parser.add_argument(
+        "-o", "--output", default="outputs", help="Output folder (default: outputs)."
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="csv",
+        help="Output format (default: csv).",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for the fact tables (default: 1).",
+    )
+    parser.add_argument("--seed", type=int, help="Seed for a reproducible run.")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Rows per generated chunk (default: {DEFAULT_CHUNK_SIZE}).",
+    )
+    parser.add_argument(
+        "--catalog",
+        help="XLSX car catalog such as car_product.xlsx "
+        "(default: the built-in car data).",
+    )
+    parser.add_argument(
+        "--locations",
+        default="city.xlsx",
+        help="XLSX file with a 'city' sheet (default: city.xlsx).",
+    )
+    parser.add_argument(
+        "-a",
+        "--append",
+        action="store_true",
+        help="Append the selected fact tables to the CSV files in the output "
+        "folder, continuing their IDs. The counts are the rows to add.",
+    )
+    parser.add_argument(
+        "--reference-rows",
+        type=int,
+        default=DEFAULT_REFERENCE_ROWS,
+        metavar="N",
+        help="Existing rows per parent table that appended rows may refer to "
+        f"(default: {DEFAULT_REFERENCE_ROWS}).",
+    )
+    parser.add_argument(
+        "--text-pool",
+        type=int,
+        default=DEFAULT_TEXT_POOL_SIZE,
+        metavar="N",
+        help="Distinct paragraphs and ad titles that car details, ad titles "
+        "and ad descriptions are sampled from, which caps their distinct "
+        f"values at N (default: {DEFAULT_TEXT_POOL_SIZE}). 0 writes every "
+        "value with Faker, which is much slower.",
+    )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Hold the cars, ads and bid tables in memory as compact "
+        "dictionary-encoded columns instead of row tuples.",
+    )
+    parser.add_argument(
+        "--out-of-core",
+        action="store_true",
+        help="Stream the parent tables like the others and let their child "
+        "tables read memory-mapped sidecars of the few columns they refer "
+        "to, so memory does not grow with the parent tables.",
+    )
+    parser.add_argument(
+        "--queue-depth",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Generate every streamed table in its own thread, up to N chunks "
+        "ahead of its writer (default: 0, the writer generates the chunks "
+        "itself).",
+    )
+    parser.add_argument(
+        "--preview",
+        action="store_true",
+        help="Print the first and last rows and the row count of every "
+        "written table.",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Also print per-column statistics of every written table "
+        "(implies --preview).",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Run the stages one at a time and print the time, rows/sec and "
+        "peak RSS of every stage.",
+    )
+    parser.add_argument(
+        "--count-faker",
+        action="store_true",
+        help="Also count the Faker provider calls of every stage "
+        "(implies --profile).",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="JSON",
+        help="Write the stage profile to this JSON file (implies --profile).",
+    )
+    args = parser.parse_args(argv)
+
+    if args.scale <= 0:
+        parser.error(f"--scale must be positive, got {args.scale}.")
+    for table, flag in COUNT_FLAGS.items():
+        if getattr(args, table) is not None and getattr(args, table) < 0:
+            parser.error(f"{flag} must be 0 or more, got {getattr(args, table)}.")
+    if args.text_pool < 0:
+        parser.error(f"--text-pool must be 0 or more, got {args.text_pool}.")
+
+    # Appended rows may refer to existing rows, which are checked later
+    if not args.append:
+        counts = table_counts(args)
+        needed, _ = required_tables(args.tables)
+        if "ads" in needed and counts["ads"] and not counts["user"] * counts["cars"]:
+            parser.error(
+                f"{counts['ads']} ads need at least 1 user and 1 car, but there "
+                f"are {counts['user']} users and {counts['cars']} cars; raise "
+                "--scale, --users or --cars."
+            )
+        if "bid" in needed and counts["bid"] and counts["user"] < 2:
+            parser.error(
+                f"{counts['bid']} bids need at least 2 users, so that every ad "
+                f"has a bidder besides its owner, but there are {counts['user']}; "
+                "raise --scale or --users."
+            )
+    return args
+
+
+def table_counts(args: argparse.Namespace) -> dict:
+    """
+    Resolve the row count of every fact table.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+
+    Returns:
+        dict: Table name -> number of rows.
+    """
+    counts = {}
+    for table, base in BASE_COUNTS.items():
+        count = getattr(args, table)
+        if count is None:
+            count = max(1, round(base * args.scale))
+        counts[table] = count
+    return counts
+
+
+def required_tables(tables: list) -> tuple:
+    """
+    Find the tables needed to generate the given ones.
+
+    Args:
+        tables (list): The tables to export.
+
+    Returns:
+        tuple: (needed, parents) sets, where `needed` holds the tables and
+               all their ancestors, and `parents` the needed tables that
+               other needed tables refer to.
+    """
+    needed = set()
+    pending = list(tables)
+    while pending:
+        table = pending.pop()
+        if table not in needed:
+            needed.add(table)
+            pending.extend(TABLE_DEPENDENCIES.get(table, []))
+    parents = {
+        parent for table in needed for parent in TABLE_DEPENDENCIES.get(table, [])
+    }
+    return needed, parents
+
+
+def appended_tables(tables: list) -> tuple:
+    """
+    Find the fact tables to append to and the tables their rows refer to.
+
+    Args:
+        tables (list): The selected tables.
+
+    Returns:
+        tuple: (needed, referenced) sets. `needed` holds the selected fact
+               tables and `referenced` the fact tables they refer to.
+    """
+    needed = {table for table in tables if table in BASE_COUNTS}
+    referenced = {
+        parent
+        for table in needed
+        for parent in TABLE_DEPENDENCIES.get(table, [])
+        if parent in BASE_COUNTS
+    }
+    return needed, referenced
+
+
+def prime_chunks(chunks):
+    """
+    Generate the first chunk of a generator right away.
+
+    Generators draw their seeds when the first chunk is generated, so
+    priming them in order keeps a seeded run reproducible even when the
+    rest of the chunks are generated by concurrent writers.
+
+    Args:
+        chunks (generator): An `iter_*` generator.
+
+    Returns:
+        iterable: The same chunks.
+    """
+    first = next(chunks, None)
+    return chunks if first is None else itertools.chain([first], chunks)
+
+
+# Serializes the start of concurrent stages, which seed the global `random`
+_seed_lock = threading.Lock()
+
+
+def seeded(seed: int, function):
+    """
+    Call a function with the global `random` module seeded.
+
+    Stages run concurrently and share `random`, so the call holds a lock.
+    Generators draw all their seeds when their first chunk is generated,
+    which is why their start is primed here with `prime_chunks`.
+
+    Args:
+        seed (int): The seed of the stage.
+        function (function): Called without arguments.
+
+    Returns:
+        The result of the function.
+    """
+    with _seed_lock:
+        random.seed(seed)
+        return function()
+
+
+def pipeline_stages(
+    args: argparse.Namespace,
+    counts: dict,
+    trace: dict = None,
+    existing: dict = None,
+    name_key: int = None,
+    previews: dict = None,
+):
+    """
+    Declare the generation and export stages of a run for `run_pipeline`.
+
+    Parent tables are generated in memory, as a ColumnTable with
+    --columnar. The remaining fact tables are chunk generators that their
+    export stage consumes, or merged CSV files when they are written by
+    worker processes. Every selected table gets a "write <table>" stage
+    that starts as soon as the table is ready.
+
+    With --out-of-core, parent tables are chunk generators as well. Their
+    write stage, or a "sidecar <table>" stage when they are not written,
+    records their sidecar on the way, and a "<table> view" stage opens it
+    for the child tables once it is complete.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+        counts (dict): Table name -> number of rows.
+        trace (dict, optional): A `profiling.new_trace` trace to record
+                                every stage into.
+        existing (dict, optional): The `incremental.existing_state` of the
+                                   output folder. Only the selected fact
+                                   tables are then generated, continuing
+                                   their IDs, and appended to their files.
+                                   Existing rows stand in for parents that
+                                   are not appended to.
+        name_key (int, optional): The `generate_name` key of the users.
+        previews (dict, optional): Filled with table name -> preview from
+                                   `new_preview` of every written table,
+                                   recorded while it is written, or None
+                                   for tables that worker processes write
+                                   themselves.
+
+    Returns:
+        tuple: (stages, writes), the stage dictionary and the names of the
+               write stages, in table order.
+    """
+    appending = existing is not None
+    if appending:
+        needed, referenced = appended_tables(args.tables)
+        parents = needed & referenced
+    else:
+        needed, parents = required_tables(args.tables)
+    csv_output = args.format.startswith("csv")
+    # Parents that are streamed to disk instead of kept in memory
+    sidecar_parents = parents & set(SIDECAR_COLUMNS) if args.out_of_core else set()
+    sidecar_folder = os.path.join(args.output, SIDECAR_FOLDER)
+    start_ids = {
+        table: existing[table]["max_id"] + 1 if appending else 1 for table in needed
+    }
+
+    # Draw every seed up front, so a seeded run does not depend on timing
+    seeds = {name: random.getrandbits(64) for name in ["text_pool", *BASE_COUNTS]}
+
+    def traced(name, function, rows=len):
+        def run(*inputs):
+            with stage(trace, name) as record:
+                result = function(*inputs)
+                record["rows"] = rows(result)
+            return result
+
+        return run
+
+    stages = {}
+    if args.catalog:
+
+        def workbook():
+            loaded = load_catalog(args.catalog)
+            if loaded is None:
+                raise SystemExit(f"Could not load the car catalog '{args.catalog}'.")
+            return loaded
+
+        stages["workbook"] = (
+            traced("workbook", workbook, rows=lambda w: len(w["car_models"])),
+            [],
+        )
+        for name in ["manufactures", "body_types", "car_models", "catalog"]:
+            stages[name] = (operator.itemgetter(name), ["workbook"])
+    else:
+        stages["manufactures"] = (
+            traced(
+                "manufactures",
+                lambda: generate_manufactures(data=car_data, is_printed=False),
+            ),
+            [],
+        )
+        stages["body_types"] = (
+            traced(
+                "body_types",
+                lambda: generate_body_types(data=car_data, is_printed=False),
+            ),
+            [],
+        )
+        stages["car_models"] = (
+            traced(
+                "car_models",
+                lambda manufactures: generate_car_models(
+                    data=car_data, manufactures_table=manufactures, is_printed=False
+                ),
+            ),
+            ["manufactures"],
+        )
+        stages["catalog"] = (
+            traced(
+                "catalog",
+                lambda manufactures, body_types, car_models: build_catalog(
+                    car_data, manufactures, body_types, car_models
+                ),
+                rows=lambda catalog: len(catalog["models"]),
+            ),
+            ["manufactures", "body_types", "car_models"],
+        )
+
+    stages["locations"] = (
+        traced(
+            "locations",
+            lambda: generate_locations(
+                data=xlsx_to_dict(args.locations, sheet_name="city"),
+                is_printed=False,
+            ),
+        ),
+        [],
+    )
+
+    if needed & {"cars", "ads"} and args.text_pool:
+        stages["text_pool"] = (
+            traced(
+                "text_pool",
+                lambda: seeded(
+                    seeds["text_pool"],
+                    lambda: build_text_pool(args.text_pool, args.text_pool),
+                ),
+                rows=lambda pool: len(pool["paragraphs"]) + len(pool["titles"]),
+            ),
+            [],
+        )
+
+    # Context names of the inputs, as `shard_chunks` and the workers read it
+    contexts = {
+        "catalog": "catalog",
+        "text_pool": "text_pool",
+        "locations": "location_table",
+        "user": "customer_table",
+        "cars": "cars_table",
+        "ad_view": "ad_view",
+    }
+    fact_inputs = {
+        "cars": ["catalog", "text_pool"],
+        "user": ["locations"],
+        "ads": ["catalog", "text_pool", "user", "cars"],
+        "bid": ["user", "ad_view"],
+    }
+    if not args.text_pool:
+        # Faker writes every text field instead
+        fact_inputs = {
+            table: [name for name in inputs if name != "text_pool"]
+            for table, inputs in fact_inputs.items()
+        }
+
+    if appending:
+        # Refer to existing rows plus the new ones of the same run
+        def references(table):
+            def run(*new_rows):
+                rows = existing[table]["rows"]
+                if new_rows and isinstance(new_rows[0], ColumnTable):
+                    old_rows = ColumnTable.from_rows(rows, table_headers(table))
+                    rows = ColumnTable.concat([old_rows, new_rows[0]])
+                elif new_rows:
+                    rows = rows + new_rows[0]
+                if not len(rows):
+                    raise SystemExit(
+                        f"Cannot append: there are no '{table}' rows to refer to."
+                    )
+                return rows
+
+            return run
+
+        for table in referenced:
+            stages[f"{table} refs"] = (
+                references(table),
+                [table] if table in needed else [],
+            )
+        fact_inputs = {
+            table: [f"{name} refs" if name in referenced else name for name in inputs]
+            for table, inputs in fact_inputs.items()
+        }
+        contexts.update({f"{name} refs": contexts.get(name) for name in referenced})
+
+    if sidecar_parents:
+        # Refer to the sidecars of the parents instead of their rows
+        views = {name: f"{name} view" for name in sidecar_parents}
+        if "ads" in sidecar_parents:
+            views["ad_view"] = "ads view"
+        fact_inputs = {
+            table: [views.get(name, name) for name in inputs]
+            for table, inputs in fact_inputs.items()
+        }
+        contexts.update(
+            {
+                "user view": "customer_table",
+                "cars view": "cars_table",
+                "ads view": "ad_view",
+            }
+        )
+
+    def fact_stage(table):
+        inputs = fact_inputs[table]
+
+        def run(*values):
+            shared = {contexts[name]: value for name, value in zip(inputs, values)}
+            shared["chunk_size"] = args.chunk_size
+            shared["name_key"] = name_key
+            start_id = start_ids[table]
+            columnar = args.columnar and table in COLUMNAR_TABLES
+
+            if args.workers > 1 and table not in sidecar_parents:
+                with stage(trace, table) as record:
+                    if table in parents or not csv_output or appending:
+                        rows = generate_sharded(
+                            table,
+                            counts[table],
+                            shared,
+                            workers=args.workers,
+                            seed=seeds[table],
+                            start_id=start_id,
+                            columnar=columnar,
+                        )
+                        record["rows"] = len(rows)
+                        return rows
+
+                    # Let every worker write its own part of the file
+                    start = time.perf_counter()
+                    filename = f"{table}.{args.format}"
+                    generate_sharded(
+                        table,
+                        counts[table],
+                        shared,
+                        workers=args.workers,
+                        seed=seeds[table],
+                        folder_path=args.output,
+                        filename=filename,
+                        headers=table_headers(table),
+                    )
+                    record["rows"] = counts[table]
+                    return {
+                        "rows": counts[table],
+                        "bytes": os.path.getsize(os.path.join(args.output, filename)),
+                        "seconds": time.perf_counter() - start,
+                    }
+
+            def shards(columns=False):
+                # Seeded shard by shard like the workers, so -w 1 matches -w N
+                return prime_chunks(
+                    iter_shards(
+                        table,
+                        counts[table],
+                        shared,
+                        seeds[table],
+                        start_id,
+                        columns=columns,
+                        lock=_seed_lock,
+                    )
+                )
+
+            if table not in parents or table in sidecar_parents:
+                # Generated while the write stage consumes it
+                return timed_chunks(trace, table, shards())
+
+            with stage(trace, table) as record:
+                chunks = shards(columns=columnar)
+                if columnar:
+                    rows = ColumnTable.from_column_chunks(chunks, table_headers(table))
+                else:
+                    rows = [row for chunk in chunks for row in chunk]
+                record["rows"] = len(rows)
+            return rows
+
+        return run
+
+    for table in BASE_COUNTS:
+        if table in needed:
+            stages[table] = (fact_stage(table), fact_inputs[table])
+    if "bid" in needed and "ads" not in sidecar_parents:
+        stages["ad_view"] = (build_ad_view, ["ads refs" if appending else "ads"])
+
+    def observed(table, data):
+        # Record the rows into the preview of the table on their way out
+        if previews is None:
+            return data
+        if isinstance(data, dict):
+            previews[table] = None  # Written by the workers
+            return data
+        if isinstance(data, (list, ColumnTable)):
+            preview_rows(previews[table], data)
+            return data
+        return previewed_chunks(previews[table], data)
+
+    def export(write, chunks, *params, **kwargs):
+        # Generate streamed tables ahead of their writer with --queue-depth
+        if args.queue_depth > 0 and not isinstance(chunks, (list, ColumnTable)):
+            return stream(chunks, write, *params, depth=args.queue_depth, **kwargs)
+        return write(chunks, *params, **kwargs)
+
+    def write_stage(table):
+        def write(data):
+            data = observed(table, data)
+            if table in sidecar_parents:
+                data = sidecar_chunks(
+                    data, sidecar_folder, table, start_id=start_ids[table]
+                )
+            with stage(trace, f"write {table}") as record:
+                start = time.perf_counter()
+                chunks = [data] if isinstance(data, list) else data
+                if csv_output:
+                    filename = f"{table}.{args.format}"
+                    file_path = os.path.join(args.output, filename)
+                    if isinstance(data, dict):
+                        result = data  # Already written by the workers
+                    else:
+                        # Appended runs only report the bytes they add
+                        size_before = 0
+                        if appending and os.path.exists(file_path):
+                            size_before = os.path.getsize(file_path)
+                        result = {
+                            "rows": export(
+                                chunks_to_csv,
+                                chunks,
+                                args.output,
+                                filename,
+                                table_headers(table),
+                                append=appending,
+                            ),
+                            "bytes": os.path.getsize(file_path) - size_before,
+                            "seconds": time.perf_counter() - start,
+                        }
+                    record["rows"] = result["rows"]
+                    return result
+                if args.format == "postgres":
+                    n_rows = export(
+                        chunks_to_pg_copy, chunks, args.output, f"{table}.copy"
+                    )
+                elif args.format == "parquet":
+                    n_rows = export(
+                        chunks_to_parquet,
+                        chunks,
+                        args.output,
+                        f"{table}.parquet",
+                        table,
+                    )
+                else:
+                    n_rows = export(
+                        chunks_to_arrow, chunks, args.output, f"{table}.arrow", table
+                    )
+                record["rows"] = n_rows
+                return n_rows
+
+        return write
+
+    tables = [
+        table
+        for table in TABLE_ORDER
+        if table in args.tables and (table in needed or not appending)
+    ]
+    if previews is not None:
+        for table in tables:
+            previews[table] = new_preview(table_headers(table), stats=args.stats)
+
+    if args.format == "sqlite":
+        # SQLite has a single writer, so all tables go through one stage
+        db_path = os.path.join(args.output, SQLITE_FILENAME)
+
+        def load(*data):
+            table_chunks = {table: observed(table, d) for table, d in zip(tables, data)}
+            if args.queue_depth > 0:
+                return stream_tables(
+                    table_chunks, export_to_sqlite, db_path, depth=args.queue_depth
+                )
+            return export_to_sqlite(table_chunks, db_path)
+
+        stages[f"write {SQLITE_FILENAME}"] = (
+            traced(
+                f"write {SQLITE_FILENAME}",
+                load,
+                rows=lambda counts: sum(counts.values()),
+            ),
+            tables,
+        )
+        return stages, [f"write {SQLITE_FILENAME}"]
+
+    writes = []
+    for table in tables:
+        stages[f"write {table}"] = (write_stage(table), [table])
+        writes.append(f"write {table}")
+
+    def sidecar_stage(table):
+        def write(chunks):
+            return write_sidecar(chunks, sidecar_folder, table, start_ids[table])
+
+        return traced(f"sidecar {table}", write, rows=int)
+
+    def view_stage(table):
+        def view(_):
+            return open_sidecar(sidecar_folder, table)
+
+        return view
+
+    for table in sorted(sidecar_parents):
+        if table in tables:
+            # The write stage records the sidecar while writing the table
+            source = f"write {table}"
+        else:
+            source = f"sidecar {table}"
+            stages[source] = (sidecar_stage(table), [table])
+        stages[f"{table} view"] = (view_stage(table), [source])
+
+    if args.format == "postgres":
+
+        def load_script(*_):
+            with open(
+                os.path.join(args.output, "load.sql"), mode="w", encoding="utf-8"
+            ) as file:
+                file.write(pg_load_script({table: f"{table}.copy" for table in tables}))
+
+        stages["write load.sql"] = (load_script, list(writes))
+
+    return stages, writes
+
+
+def show_results(results: dict, writes: list, file_format: str, seconds: float):
+    """
+    Print the report of the write stages.
+
+    Args:
+        results (dict): The results of `run_pipeline`.
+        writes (list): The names of the write stages.
+        file_format (str): One of OUTPUT_FORMATS.
+        seconds (float): The wall time of the whole pipeline.
+    """
+    if file_format.startswith("csv"):
+        report = {
+            f"{name[len('write '):]}.{file_format}": results[name] for name in writes
+        }
+        report["total"] = {
+            "rows": sum(stats["rows"] for stats in report.values()),
+            "bytes": sum(stats["bytes"] for stats in report.values()),
+            "seconds": seconds,
+        }
+        show_export_report(report)
+        return
+
+    if file_format == "sqlite":
+        counts = results[writes[0]]
+    else:
+        counts = {name[len("write ") :]: results[name] for name in writes}
+    show_table(
+        [(table, n_rows) for table, n_rows in counts.items()]
+        + [("total", sum(counts.values()))],
+        ["table", "rows"],
+    )
+    print(f"Written in {seconds:.3f} seconds.")
+
+
+def main(argv: list = None):
+    """
+    Generate the dummy data and export it.
+
+    Args:
+        argv (list, optional): The command-line arguments.
+                               Defaults to `sys.argv[1:]`.
+    """
+    args = parse_args(argv)
+
+    if args.seed is not None:
+        random.seed(args.seed)
+        create_dummy.seed_fake(args.seed)
+
+    trace = None
+    if args.profile or args.trace or args.count_faker:
+        faker_calls = None
+        if args.count_faker:
+            faker_calls = count_faker_calls(create_dummy.get_fake())
+        trace = new_trace(faker_calls)
+
+    csv_output = args.format.startswith("csv")
+    previous = read_manifest(args.output) if csv_output else None
+    counts = table_counts(args)
+
+    if args.out_of_core and args.format == "sqlite":
+        raise SystemExit("--out-of-core does not work with SQLite output.")
+    if args.out_of_core and args.append:
+        raise SystemExit("--out-of-core does not work with --append.")
+
+    existing = None
+    name_key = random.getrandbits(64)
+    if args.append:
+        if not csv_output:
+            raise SystemExit("--append only works with CSV output.")
+        needed, referenced = appended_tables(args.tables)
+        existing = existing_state(
+            args.output, args.format, needed, referenced, args.reference_rows
+        )
+        if previous is not None:
+            name_key = previous["name_key"]
+        elif "user" in needed and existing["user"]["max_id"]:
+            print(
+                f"No {MANIFEST_FILENAME} in '{args.output}'; appended user "
+                "names may repeat existing ones."
+            )
+
+    previews = {} if args.preview or args.stats else None
+    stages, writes = pipeline_stages(args, counts, trace, existing, name_key, previews)
+    start = time.perf_counter()
+    # One stage at a time while profiling, so that the peak RSS and the
+    # Faker calls of a stage are its own
+    results = run_pipeline(stages, workers=1 if trace is not None else None)
+    show_results(results, writes, args.format, time.perf_counter() - start)
+
+    for table, preview in (previews or {}).items():
+        print(f"\n{table}")
+        if preview is None:
+            print("Written by the worker processes; not previewed.")
+        else:
+            show_preview(preview)
+
+    if csv_output:
+        # Record the name key and last IDs for later appends
+        max_ids = dict(previous["max_ids"]) if previous else {}
+        for name in writes:
+            table = name[len("write ") :]
+            if table in ID_TABLES:
+                start_id = existing[table]["max_id"] + 1 if existing else 1
+                max_ids[table] = start_id + results[name]["rows"] - 1
+        if previous and not (existing is None and "write user" in writes):
+            name_key = previous["name_key"]  # The users were not rewritten
+        write_manifest(args.output, name_key, max_ids)
+
+    if trace is not None:
+        show_trace(trace)
+        if args.trace:
+            write_trace(trace, args.trace)
 
-# Call the generate_bids function with the required parameters
-bid_data = generate_bids(
-    advertisement_table=advertisement_data,
-    customer_table=customer_data,
-    n_data=1000,
-    is_printed=False,
-)
 
-# Define headers for CSV files
-manufactures_headers = ["manufacture_id", "manufacture_name"]
-car_models_headers = ["model_id", "manufacture_id", "model_name"]
-body_types_headers = ["body_type_id", "body_type_name"]
-cars_header = [
-    "car_id",
-    "manufacture_id",
-    "model_id",
-    "body_type_id",
-    "year_manufactured",
-    "engine_capacity",
-    "passenger_capacity",
-    "transmission_type",
-    "fuel_type",
-    "drive_system",
-    "odometer",
-    "additional_details",
-]
-location_headers = ["location_id", "city_name", "location"]
-customer_headers = [
-    "user_id",
-    "first_name",
-    "last_name",
-    "email",
-    "contact",
-    "location_id",
-]
-advertisement_headers = [
-    "ad_id",
-    "user_id",
-    "title",
-    "price",
-    "description",
-    "car_id",
-    "date_posted",
-]
-bid_headers = ["ad_id", "user_id", "bid_price", "bid_status", "datetime_bid"]
-
-
-# Export data to CSV files in the "outputs" folder
-list_to_csv(manufactures_data, "outputs", "manufactures.csv", manufactures_headers)
-list_to_csv(car_models_data, "outputs", "car_models.csv", car_models_headers)
-list_to_csv(body_type_data, "outputs", "body_types.csv", body_types_headers)
-list_to_csv(cars_table_data, "outputs", "cars.csv", cars_header)
-list_to_csv(location_data, "outputs", "locations.csv", location_headers)
-list_to_csv(customer_data, "outputs", "user.csv", customer_headers)
-list_to_csv(advertisement_data, "outputs", "ads.csv", advertisement_headers)
-list_to_csv(bid_data, "outputs", "bid.csv", bid_headers)
+if __name__ == "__main__":
+    main()
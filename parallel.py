@@ -0,0 +1,414 @@
+import contextlib
+import multiprocessing
+import os
+import random
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import create_dummy
+from columnar import ColumnTable
+from create_dummy import (
+    COMPRESSION_EXTENSIONS,
+    DEFAULT_CHUNK_SIZE,
+    chunks_to_csv,
+    iter_advertisement,
+    iter_advertisement_columns,
+    iter_bid_columns,
+    iter_bids,
+    iter_car_columns,
+    iter_cars,
+    iter_customer,
+)
+from sidecars import open_sidecar
+
+# Fact tables that can be generated in shards
+SHARDED_TABLES = ("cars", "user", "ads", "bid")
+
+# Fact tables that can be generated as a ColumnTable
+COLUMNAR_TABLES = ("cars", "ads", "bid")
+
+# Default number of rows per shard; independent of the worker count so
+# that a seed gives the same output on any machine
+DEFAULT_SHARD_SIZE = 100_000
+
+# Workers start from a clean server process where the platform has one,
+# since the pipeline threads may hold locks at fork time
+POOL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Read-only context of the current worker process, set by _init_worker
+_shared = {}
+
+
+def _init_worker(shared: dict):
+    """
+    Store the read-only context shared by every shard of a worker process.
+
+    Sidecar views arrive as their location only and are opened here, so
+    every worker memory-maps the sidecar files itself.
+
+    Args:
+        shared (dict): The shared context passed to `generate_sharded`,
+                       after `_sidecar_locations`.
+    """
+    global _shared
+    _shared = {
+        name: open_sidecar(*value["sidecar"]) if _is_view(value) else value
+        for name, value in shared.items()
+    }
+
+
+def _is_view(value) -> bool:
+    """
+    Check whether a shared context value is a sidecar view.
+
+    Args:
+        value: A value of the shared context.
+
+    Returns:
+        bool: True for views from `open_sidecar`.
+    """
+    return isinstance(value, dict) and "sidecar" in value
+
+
+def _sidecar_locations(shared: dict) -> dict:
+    """
+    Replace the sidecar views of a shared context by their location.
+
+    Pickling a view would copy its memory-mapped columns into every
+    worker process.
+
+    Args:
+        shared (dict): The shared context passed to `generate_sharded`.
+
+    Returns:
+        dict: The context to send to the workers.
+    """
+    return {
+        name: {"sidecar": value["sidecar"]} if _is_view(value) else value
+        for name, value in shared.items()
+    }
+
+
+def shard_chunks(
+    table: str, n_rows: int, start_id: int, shared: dict, columns: bool = False
+):
+    """
+    Create the chunk generator of one shard, or of a whole table.
+
+    Args:
+        table (str): One of SHARDED_TABLES.
+        n_rows (int): The number of rows in the shard.
+        start_id (int): The ID of the first row in the shard.
+        shared (dict): The shared context, see `generate_sharded`.
+        columns (bool, optional): Whether to yield chunks of columns
+                                  instead of rows, for COLUMNAR_TABLES.
+                                  Defaults to False.
+
+    Returns:
+        generator: The `iter_*` generator for the shard.
+    """
+    chunk_size = shared.get("chunk_size", DEFAULT_CHUNK_SIZE)
+    if columns and table not in COLUMNAR_TABLES:
+        raise ValueError(f"Table '{table}' cannot be generated as columns.")
+
+    if table == "cars":
+        return (iter_car_columns if columns else iter_cars)(
+            shared.get("data"),
+            None,
+            None,
+            None,
+            n_rows,
+            chunk_size=chunk_size,
+            catalog=shared["catalog"],
+            text_pool=shared.get("text_pool"),
+            start_id=start_id,
+        )
+    if table == "user":
+        return iter_customer(
+            shared["location_table"],
+            n_rows,
+            chunk_size=chunk_size,
+            start_id=start_id,
+            name_key=shared.get("name_key"),
+        )
+    if table == "ads":
+        return (iter_advertisement_columns if columns else iter_advertisement)(
+            shared.get("data"),
+            shared["customer_table"],
+            shared["cars_table"],
+            None,
+            n_rows,
+            chunk_size=chunk_size,
+            catalog=shared["catalog"],
+            text_pool=shared.get("text_pool"),
+            start_id=start_id,
+        )
+    if table == "bid":
+        return (iter_bid_columns if columns else iter_bids)(
+            shared.get("advertisement_table"),
+            shared["customer_table"],
+            n_rows,
+            chunk_size=chunk_size,
+            ad_view=shared.get("ad_view"),
+        )
+    raise ValueError(f"Table '{table}' cannot be generated in shards.")
+
+
+def _run_shard(task: tuple):
+    """
+    Generate one shard with its own seeded `random` and Faker state.
+
+    Args:
+        task (tuple): (table, n_rows, start_id, seed, part_path, headers,
+                      columnar). Rows are returned when part_path is None,
+                      as a ColumnTable when columnar is True.
+
+    Returns:
+        list, ColumnTable or str: The generated rows, or the path of the
+                                  part file.
+    """
+    table, n_rows, start_id, seed, part_path, headers, columnar = task
+
+    random.seed(seed)
+    create_dummy.seed_fake(seed)
+
+    if part_path is None and columnar:
+        return ColumnTable.from_column_chunks(
+            shard_chunks(table, n_rows, start_id, _shared, columns=True)
+        )
+
+    chunks = shard_chunks(table, n_rows, start_id, _shared)
+    if part_path is None:
+        return [row for chunk in chunks for row in chunk]
+
+    folder_path, filename = os.path.split(part_path)
+    chunks_to_csv(chunks, folder_path, filename, headers)
+    return part_path
+
+
+def shard_seeds(seed: int, n_shards: int) -> list:
+    """
+    Derive independent, reproducible seeds for each shard.
+
+    Args:
+        seed (int): The seed of the whole run.
+        n_shards (int): The number of shards.
+
+    Returns:
+        list: One integer seed per shard.
+    """
+    return [
+        int(child.generate_state(1)[0])
+        for child in np.random.SeedSequence(seed).spawn(n_shards)
+    ]
+
+
+def shard_plan(n_data: int, seed: int, n_shards: int = None, start_id: int = 1) -> list:
+    """
+    Split a table into shards with their own ID ranges and seeds.
+
+    Args:
+        n_data (int): The number of rows.
+        seed (int): The seed of the table.
+        n_shards (int, optional): The number of shards. Defaults to one
+                                  per DEFAULT_SHARD_SIZE rows.
+        start_id (int, optional): The ID of the first row. Defaults to 1.
+
+    Returns:
+        list: One (n_rows, start_id, seed) tuple per shard, in ID order.
+    """
+    if n_shards is None:
+        n_shards = -(-n_data // DEFAULT_SHARD_SIZE)
+    n_shards = max(1, min(n_shards, n_data))
+
+    # Split the rows evenly, the first shards take one extra row
+    base, extra = divmod(n_data, n_shards)
+    plan = []
+    for index, shard_seed in enumerate(shard_seeds(seed, n_shards)):
+        size = base + (1 if index < extra else 0)
+        plan.append((size, start_id, shard_seed))
+        start_id += size
+    return plan
+
+
+def iter_shards(
+    table: str,
+    n_data: int,
+    shared: dict,
+    seed: int,
+    start_id: int = 1,
+    columns: bool = False,
+    lock=None,
+):
+    """
+    Generate the shards of `generate_sharded` one after the other, lazily.
+
+    Every shard is seeded exactly as a worker process seeds it, so a
+    table generated in one process is identical to the same table
+    generated by any number of workers with the same seed.
+
+    Args:
+        table (str): One of SHARDED_TABLES.
+        n_data (int): The number of rows.
+        shared (dict): The shared context, see `generate_sharded`.
+        seed (int): The seed of the table.
+        start_id (int, optional): The ID of the first row. Defaults to 1.
+        columns (bool, optional): Whether to yield chunks of columns, see
+                                  `shard_chunks`. Defaults to False.
+        lock (threading.Lock, optional): Held while a shard seeds the
+                                         global `random` and Faker state
+                                         and draws its own seeds from
+                                         them, for callers that generate
+                                         other tables concurrently.
+
+    Yields:
+        list or dict: The chunks of every shard, in ID order.
+    """
+    if table == "user":
+        shared = dict(shared)
+        shared.setdefault("name_key", random.Random(seed).getrandbits(64))
+
+    for n_rows, shard_start, shard_seed in shard_plan(n_data, seed, None, start_id):
+        # Generators draw their seeds when their first chunk is generated
+        with lock or contextlib.nullcontext():
+            random.seed(shard_seed)
+            create_dummy.seed_fake(shard_seed)
+            chunks = shard_chunks(table, n_rows, shard_start, shared, columns)
+            first = next(chunks, None)
+        if first is not None:
+            yield first
+            yield from chunks
+
+
+def merge_parts(part_paths: list, file_path: str):
+    """
+    Concatenate part files in order and remove them.
+
+    Only the first part carries the header. Plain, gzip and zstd parts
+    can all be concatenated byte for byte, since both compressed formats
+    allow several members or frames in one file.
+
+    Args:
+        part_paths (list): The part files, in shard order.
+        file_path (str): The merged file.
+    """
+    with open(file_path, mode="wb") as merged:
+        for part_path in part_paths:
+            with open(part_path, mode="rb") as part:
+                shutil.copyfileobj(part, merged, 1024 * 1024)
+            os.remove(part_path)
+
+
+def generate_sharded(
+    table: str,
+    n_data: int,
+    shared: dict,
+    workers: int = None,
+    seed: int = None,
+    n_shards: int = None,
+    start_id: int = 1,
+    folder_path: str = None,
+    filename: str = None,
+    headers: list = None,
+    merge: bool = True,
+    columnar: bool = False,
+):
+    """
+    Generate a fact table in parallel over a process pool.
+
+    Every shard covers a disjoint ID range, seeds its own `random` and
+    Faker state from `seed`, and reads the same shared context, so the
+    output only depends on `seed`, `n_data` and `n_shards`.
+
+    Args:
+        table (str): One of SHARDED_TABLES: "cars", "user", "ads" or "bid".
+        n_data (int): The number of rows to generate.
+        shared (dict): The read-only context of the workers:
+                       - "data" and "catalog" for cars and ads,
+                       - "text_pool" (optional) for cars and ads,
+                       - "location_table" and "name_key" for user,
+                       - "customer_table" and "cars_table" for ads,
+                       - "customer_table" and "ad_view" or
+                         "advertisement_table" for bid,
+                       - "chunk_size" (optional).
+                       Parent tables may be sidecar views, which the
+                       workers open again from their location.
+        workers (int, optional): The number of worker processes.
+                                 Defaults to the number of CPUs.
+        seed (int, optional): The seed of the run. Drawn from the
+                              `random` module when not given.
+        n_shards (int, optional): The number of shards. Defaults to one
+                                  per DEFAULT_SHARD_SIZE rows.
+        start_id (int, optional): The ID of the first row. Defaults to 1.
+        folder_path (str, optional): Write CSV part files into this
+                                     folder instead of returning rows.
+        filename (str, optional): The CSV file name, e.g. "cars.csv" or
+                                  "cars.csv.gz" for compressed parts.
+        headers (list, optional): A list of header names for the CSV file.
+        merge (bool, optional): Whether to merge the part files into
+                                `filename`. Defaults to True.
+        columnar (bool, optional): Whether to return the rows as a
+                                   ColumnTable, for COLUMNAR_TABLES.
+                                   Defaults to False.
+
+    Returns:
+        list: The generated rows in ID order when `folder_path` is None,
+              otherwise the paths of the written CSV files.
+    """
+    if table not in SHARDED_TABLES:
+        raise ValueError(f"Table '{table}' cannot be generated in shards.")
+
+    workers = workers or os.cpu_count() or 1
+    if seed is None:
+        seed = random.getrandbits(64)
+
+    if table == "user":
+        shared = dict(shared)
+        shared.setdefault("name_key", random.Random(seed).getrandbits(64))
+
+    if folder_path is not None and not os.path.exists(folder_path):
+        os.makedirs(folder_path, exist_ok=True)
+    # Keep compression suffixes such as ".csv.gz" at the end of part names
+    filename = filename or f"{table}.csv"
+    stem, ext = os.path.splitext(filename)
+    if ext.lower() in COMPRESSION_EXTENSIONS:
+        stem, inner_ext = os.path.splitext(stem)
+        ext = inner_ext + ext
+
+    tasks = []
+    plan = shard_plan(n_data, seed, n_shards, start_id)
+    for index, (size, shard_start, shard_seed) in enumerate(plan):
+        part_path = None
+        if folder_path is not None:
+            part_path = os.path.join(folder_path, f"{stem}.part-{index:04}{ext}")
+        # Merged parts are concatenated, so only the first one has headers
+        part_headers = headers if index == 0 or not merge else None
+        tasks.append(
+            (table, size, shard_start, shard_seed, part_path, part_headers, columnar)
+        )
+
+    # The pipeline calls this from a thread, and forking a process with other
+    # threads running may copy a lock one of them holds into the worker
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context(POOL_START_METHOD),
+        initializer=_init_worker,
+        initargs=(_sidecar_locations(shared),),
+    ) as executor:
+        results = list(executor.map(_run_shard, tasks))
+
+    if folder_path is None:
+        if columnar:
+            return ColumnTable.concat(results)
+        return [row for rows in results for row in rows]
+
+    if not merge:
+        return results
+
+    file_path = os.path.join(folder_path, f"{stem}{ext}")
+    merge_parts(results, file_path)
+    return [file_path]
@@ -0,0 +1,46 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+def run_pipeline(stages: dict, workers: int = None) -> dict:
+    """
+    Run stages concurrently, each one as soon as its inputs are ready.
+
+    Stages run on a thread pool, so independent branches of the graph
+    overlap and the wall time approaches the critical path. Generation
+    that releases the GIL (NumPy, compression, file and database I/O)
+    overlaps best.
+
+    Args:
+        stages (dict): Stage name -> (function, inputs), where inputs is a
+                       list of stage names and the function is called with
+                       their results as positional arguments, in order.
+        workers (int, optional): The number of threads. Defaults to one
+                                 per stage.
+
+    Returns:
+        dict: Stage name -> result of its function.
+    """
+    for name, (_, inputs) in stages.items():
+        unknown = [input for input in inputs if input not in stages]
+        if unknown:
+            raise ValueError(f"Stage '{name}' has unknown inputs {unknown}.")
+
+    results = {}
+    pending = dict(stages)
+    running = {}
+    with ThreadPoolExecutor(max_workers=workers or len(stages) or 1) as executor:
+        while pending or running:
+            for name, (function, inputs) in list(pending.items()):
+                if all(input in results for input in inputs):
+                    args = [results[input] for input in inputs]
+                    running[executor.submit(function, *args)] = name
+                    del pending[name]
+
+            if not running:
+                raise ValueError(f"Stages {sorted(pending)} have circular inputs.")
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[running.pop(future)] = future.result()
+
+    return results
@@ -0,0 +1,251 @@
+import functools
+import json
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+
+def peak_rss() -> int:
+    """
+    Return the peak resident set size of this process in bytes.
+
+    Returns:
+        int: The peak RSS.
+    """
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def reset_peak_rss() -> bool:
+    """
+    Reset the peak RSS to the current RSS, where the OS allows it.
+
+    Returns:
+        bool: Whether the peak was reset (Linux only).
+    """
+    try:
+        with open("/proc/self/clear_refs", mode="w") as clear_refs:
+            clear_refs.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def count_faker_calls(fake) -> Counter:
+    """
+    Count every call of a Faker provider method from now on.
+
+    The provider methods of each locale generator are replaced by
+    wrappers that count their calls by method name. Calls that providers
+    make to each other internally are not counted.
+
+    Args:
+        fake (faker.Faker): The Faker instance, e.g. `get_fake()`.
+
+    Returns:
+        collections.Counter: Method name -> number of calls, kept up to date.
+    """
+    counts = Counter()
+
+    def counted(name, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            counts[name] += 1
+            return method(*args, **kwargs)
+
+        return wrapper
+
+    for generator in fake.factories:
+        providers = generator.providers
+        for name, value in list(vars(generator).items()):
+            if (
+                not name.startswith("_")
+                and callable(value)
+                and getattr(value, "__self__", None) in providers
+            ):
+                setattr(generator, name, counted(name, value))
+    return counts
+
+
+def new_trace(faker_calls: Counter = None, concurrent: bool = False) -> dict:
+    """
+    Create an empty trace for `stage` and `timed_chunks` to record into.
+
+    Args:
+        faker_calls (collections.Counter, optional): The counter returned
+                                                     by `count_faker_calls`.
+        concurrent (bool, optional): Whether stages may run at the same
+                                     time, e.g. under `run_pipeline`. The
+                                     peak RSS and the Faker calls are then
+                                     shared by the stages running at once,
+                                     so stages record neither and only the
+                                     run totals are kept. Defaults to
+                                     False.
+
+    Returns:
+        dict: The trace.
+    """
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "start": time.perf_counter(),
+        "faker_calls": faker_calls,
+        "concurrent": concurrent,
+        "stages": [],
+    }
+
+
+def _finish(trace: dict, record: dict, seconds: float, calls_before: Counter):
+    """
+    Complete a stage record and add it to the trace.
+
+    Args:
+        trace (dict): The trace.
+        record (dict): The stage record holding "stage" and "rows".
+        seconds (float): The time spent in the stage.
+        calls_before (collections.Counter): Faker calls when the stage began.
+    """
+    record["seconds"] = seconds
+    record["rows_per_sec"] = record["rows"] / seconds if seconds else None
+    if not trace["concurrent"]:
+        record["peak_rss_mb"] = peak_rss() / 2**20
+        if trace["faker_calls"] is not None:
+            record["faker_calls"] = dict(trace["faker_calls"] - calls_before)
+    trace["stages"].append(record)
+
+
+@contextmanager
+def stage(trace: dict, name: str):
+    """
+    Record the wall time, rows/sec and peak RSS of a pipeline stage.
+
+    Set "rows" on the yielded record to the number of rows the stage
+    produced. Without a trace nothing is recorded, so stages can be
+    wrapped unconditionally. The peak RSS and the Faker calls are only
+    recorded when stages run one at a time, see `new_trace`.
+
+    Args:
+        trace (dict): A trace from `new_trace`, or None.
+        name (str): The stage name.
+
+    Yields:
+        dict: The stage record.
+    """
+    record = {"stage": name, "rows": 0}
+    if trace is None:
+        yield record
+        return
+
+    calls_before = Counter(trace["faker_calls"] or {})
+    if not trace["concurrent"]:
+        reset_peak_rss()
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        _finish(trace, record, time.perf_counter() - start, calls_before)
+
+
+def timed_chunks(trace: dict, name: str, chunks):
+    """
+    Record a stage that is generated lazily, one chunk at a time.
+
+    Only the time spent generating chunks is counted, not the time the
+    consumer spends on them. The peak RSS is the peak of the process when
+    the last chunk is generated, which includes the consumer.
+
+    Args:
+        trace (dict): A trace from `new_trace`, or None.
+        name (str): The stage name.
+        chunks (iterable): The chunks, e.g. an `iter_*` generator.
+
+    Yields:
+        list: The chunks, unchanged.
+    """
+    if trace is None:
+        yield from chunks
+        return
+
+    record = {"stage": name, "rows": 0}
+    calls_before = Counter(trace["faker_calls"] or {})
+    chunks = iter(chunks)
+    seconds = 0.0
+    while True:
+        start = time.perf_counter()
+        chunk = next(chunks, None)
+        seconds += time.perf_counter() - start
+        if chunk is None:
+            break
+        record["rows"] += len(chunk)
+        yield chunk
+    _finish(trace, record, seconds, calls_before)
+
+
+def show_trace(trace: dict):
+    """
+    Display the stages of a trace as a table.
+
+    Args:
+        trace (dict): A trace from `new_trace`.
+    """
+    from create_dummy import show_table
+
+    # Concurrent stages share the peak and the calls, see `new_trace`
+    serial = not trace["concurrent"]
+    counting = serial and trace["faker_calls"] is not None
+    rows = []
+    for record in trace["stages"]:
+        row = [
+            record["stage"],
+            record["rows"],
+            f"{record['seconds']:.3f}",
+            f"{record['rows_per_sec']:,.0f}" if record["rows_per_sec"] else "",
+        ]
+        if serial:
+            row.append(f"{record['peak_rss_mb']:.1f}")
+        if counting:
+            row.append(sum(record["faker_calls"].values()))
+        rows.append(row)
+
+    headers = ["stage", "rows", "seconds", "rows/sec"]
+    if serial:
+        headers.append("peak RSS MiB")
+    if counting:
+        headers.append("faker calls")
+    show_table(rows, headers)
+    print(f"Total: {time.perf_counter() - trace['start']:.3f} seconds.")
+    if trace["concurrent"]:
+        print(f"Process peak RSS: {peak_rss() / 2**20:.1f} MiB.")
+    if trace["faker_calls"] is not None:
+        print(f"Faker calls: {sum(trace['faker_calls'].values())}.")
+
+
+def write_trace(trace: dict, file_path: str):
+    """
+    Write a trace as JSON.
+
+    Args:
+        trace (dict): A trace from `new_trace`.
+        file_path (str): The JSON file.
+    """
+    document = {
+        "created": trace["created"],
+        "total_seconds": time.perf_counter() - trace["start"],
+        # Concurrent stages have no "peak_rss_mb" and "faker_calls"
+        "concurrent": trace["concurrent"],
+        "stages": trace["stages"],
+    }
+    if trace["faker_calls"] is not None:
+        document["faker_calls"] = dict(trace["faker_calls"])
+    with open(file_path, mode="w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2)
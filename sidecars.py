@@ -0,0 +1,204 @@
+import json
+import os
+import shutil
+
+import numpy as np
+
+from sinks import table_headers
+
+# Subfolder of the output folder that holds the sidecars
+SIDECAR_FOLDER = "sidecars"
+
+# Columns of each parent table that child tables need, and their dtypes.
+# "category" columns are stored as int32 codes into a list of values.
+SIDECAR_COLUMNS = {
+    "cars": {"model_id": "category"},
+    "user": {"location_id": "int64"},
+    "ads": {"user_id": "int64", "price": "int64", "date_posted": "datetime64[us]"},
+}
+
+
+def _sidecar_path(folder_path: str, table: str, suffix: str) -> str:
+    """
+    Get the path of a sidecar file.
+
+    Args:
+        folder_path (str): The sidecar folder.
+        table (str): The parent table, one of SIDECAR_COLUMNS.
+        suffix (str): A column name plus extension, or "json".
+
+    Returns:
+        str: The file path.
+    """
+    return os.path.join(folder_path, f"{table}.{suffix}")
+
+
+def _write_npy(file_path: str, raw_path: str, dtype: np.dtype, n_rows: int):
+    """
+    Turn a file of raw values into a `.npy` file that NumPy can memory-map.
+
+    Args:
+        file_path (str): The `.npy` file.
+        raw_path (str): The raw values, written with `ndarray.tofile`.
+        dtype (numpy.dtype): The dtype of the values.
+        n_rows (int): The number of values.
+    """
+    header = {
+        "descr": np.lib.format.dtype_to_descr(dtype),
+        "fortran_order": False,
+        "shape": (n_rows,),
+    }
+    with open(file_path, mode="wb") as file, open(raw_path, mode="rb") as raw:
+        np.lib.format.write_array_header_1_0(file, header)
+        shutil.copyfileobj(raw, file)
+    os.remove(raw_path)
+
+
+def sidecar_chunks(chunks, folder_path: str, table: str, start_id: int = 1):
+    """
+    Write the sidecar of a parent table while passing its chunks on.
+
+    The sidecar holds only the columns of SIDECAR_COLUMNS, one `.npy`
+    file per column in row order, plus a JSON file with the ID range and
+    the values of "category" columns. The IDs are only kept as well when
+    they are not dense. The values are appended to disk chunk by chunk,
+    so the rows of the table are never held in memory.
+    The sidecar is complete once the chunks are exhausted.
+
+    Args:
+        chunks (iterable): Chunks of row tuples, e.g. an `iter_*` generator,
+                           in increasing ID order.
+        folder_path (str): The sidecar folder.
+        table (str): The parent table, one of SIDECAR_COLUMNS.
+        start_id (int, optional): The ID of the first row if the IDs are
+                                  dense, so that the row at position i has
+                                  the ID `start_id + i`. Defaults to 1.
+
+    Yields:
+        list: The chunks, unchanged.
+    """
+    os.makedirs(folder_path, exist_ok=True)
+    headers = table_headers(table)
+    id_column = headers[0]
+    columns = {id_column: "int64", **SIDECAR_COLUMNS[table]}
+    positions = {column: headers.index(column) for column in columns}
+    dtypes = {
+        column: np.dtype(np.int32 if dtype == "category" else dtype)
+        for column, dtype in columns.items()
+    }
+    encoders = {column: {} for column, dtype in columns.items() if dtype == "category"}
+
+    raw_paths = {
+        column: _sidecar_path(folder_path, table, f"{column}.raw") for column in columns
+    }
+    files = {column: open(path, mode="wb") for column, path in raw_paths.items()}
+    n_rows = 0
+    dense = True
+    try:
+        for chunk in chunks:
+            # IDs increase, so a chunk is dense when its ends are
+            first_id = start_id + n_rows
+            dense = dense and (
+                not chunk
+                or (
+                    chunk[0][0] == first_id
+                    and chunk[-1][0] == first_id + len(chunk) - 1
+                )
+            )
+            for column, position in positions.items():
+                values = [row[position] for row in chunk]
+                if column in encoders:
+                    index = encoders[column]
+                    values = [index.setdefault(value, len(index)) for value in values]
+                np.array(values, dtype=dtypes[column]).tofile(files[column])
+            n_rows += len(chunk)
+            yield chunk
+    finally:
+        for file in files.values():
+            file.close()
+
+    if dense:
+        # The IDs follow from start_id, no need to keep them
+        os.remove(raw_paths.pop(id_column))
+    for column, raw_path in raw_paths.items():
+        npy_path = _sidecar_path(folder_path, table, f"{column}.npy")
+        _write_npy(npy_path, raw_path, dtypes[column], n_rows)
+
+    with open(
+        _sidecar_path(folder_path, table, "json"), mode="w", encoding="utf-8"
+    ) as file:
+        json.dump(
+            {
+                "start_id": start_id,
+                "n_rows": n_rows,
+                "dense": dense,
+                "categories": {
+                    column: list(index) for column, index in encoders.items()
+                },
+            },
+            file,
+        )
+
+
+def write_sidecar(chunks, folder_path: str, table: str, start_id: int = 1) -> int:
+    """
+    Write the sidecar of a parent table that is not written anywhere else.
+
+    Args:
+        chunks (iterable): Chunks of row tuples, e.g. an `iter_*` generator.
+        folder_path (str): The sidecar folder.
+        table (str): The parent table, one of SIDECAR_COLUMNS.
+        start_id (int, optional): The ID of the first row. Defaults to 1.
+
+    Returns:
+        int: The number of rows.
+    """
+    return sum(map(len, sidecar_chunks(chunks, folder_path, table, start_id)))
+
+
+def open_sidecar(folder_path: str, table: str) -> dict:
+    """
+    Open the sidecar of a parent table as a view for its child tables.
+
+    The view stands in for the parent table in the generators of the
+    child tables: advertisements take a view of "user" and "cars", and
+    bids take a view of "user" and, as `ad_view`, of "ads". Its columns
+    are memory-mapped, so only the pages the children sample are read,
+    and the operating system may drop them again under memory pressure.
+
+    Args:
+        folder_path (str): The sidecar folder.
+        table (str): The parent table, one of SIDECAR_COLUMNS.
+
+    Returns:
+        dict: A dictionary with the ID column of the table as a `range` of
+              IDs (or a memory-mapped array if they are not dense), the
+              sidecar columns as read-only memory-mapped arrays (codes
+              for "category" columns), and "categories": column
+              name -> object array of the values the codes refer to.
+              "sidecar" holds `(folder_path, table)`, so that worker
+              processes can open the view again instead of receiving
+              a copy of its columns.
+    """
+    with open(_sidecar_path(folder_path, table, "json"), encoding="utf-8") as file:
+        meta = json.load(file)
+
+    id_column = table_headers(table)[0]
+    start_id = meta["start_id"]
+    view = {
+        id_column: range(start_id, start_id + meta["n_rows"]),
+        "categories": {},
+        "sidecar": (folder_path, table),
+    }
+    columns = list(SIDECAR_COLUMNS[table])
+    if not meta["dense"]:
+        columns.append(id_column)
+    for column in columns:
+        view[column] = np.load(
+            _sidecar_path(folder_path, table, f"{column}.npy"), mmap_mode="r"
+        )
+    for column, values in meta["categories"].items():
+        categories = np.empty(len(values), dtype=object)
+        categories[:] = values
+        view["categories"][column] = categories
+    return view
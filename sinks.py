@@ -0,0 +1,839 @@
+import os
+import sqlite3
+
+import numpy as np
+
+from columnar import ROW_CHUNK_SIZE, ColumnTable
+
+# Tables in foreign key order, parents before children
+TABLE_ORDER = [
+    "manufactures",
+    "body_types",
+    "car_models",
+    "cars",
+    "locations",
+    "user",
+    "ads",
+    "bid",
+]
+
+# Column names and types, keys and indexes of every generated table.
+# Types are generic: "text", "integer", "real", "timestamp" and "point".
+# Categorical columns hold few distinct values and are dictionary-encoded
+# by the columnar writers.
+TABLE_SCHEMAS = {
+    "manufactures": {
+        "columns": [
+            ("manufacture_id", "text"),
+            ("manufacture_name", "text"),
+        ],
+        "primary_key": ["manufacture_id"],
+        "foreign_keys": [],
+        "indexes": [],
+        "categorical": [],
+    },
+    "body_types": {
+        "columns": [
+            ("body_type_id", "text"),
+            ("body_type_name", "text"),
+        ],
+        "primary_key": ["body_type_id"],
+        "foreign_keys": [],
+        "indexes": [],
+        "categorical": [],
+    },
+    "car_models": {
+        "columns": [
+            ("model_id", "text"),
+            ("manufacture_id", "text"),
+            ("model_name", "text"),
+        ],
+        "primary_key": ["model_id"],
+        "foreign_keys": [("manufacture_id", "manufactures", "manufacture_id")],
+        "indexes": [["manufacture_id"]],
+        "categorical": ["manufacture_id"],
+    },
+    "cars": {
+        "columns": [
+            ("car_id", "integer"),
+            ("manufacture_id", "text"),
+            ("model_id", "text"),
+            ("body_type_id", "text"),
+            ("year_manufactured", "integer"),
+            ("engine_capacity", "real"),
+            ("passenger_capacity", "integer"),
+            ("transmission_type", "text"),
+            ("fuel_type", "text"),
+            ("drive_system", "text"),
+            ("odometer", "integer"),
+            ("additional_details", "text"),
+        ],
+        "primary_key": ["car_id"],
+        "foreign_keys": [
+            ("manufacture_id", "manufactures", "manufacture_id"),
+            ("model_id", "car_models", "model_id"),
+            ("body_type_id", "body_types", "body_type_id"),
+        ],
+        "indexes": [["manufacture_id"], ["model_id"], ["body_type_id"]],
+        "categorical": [
+            "manufacture_id",
+            "model_id",
+            "body_type_id",
+            "transmission_type",
+            "fuel_type",
+            "drive_system",
+        ],
+    },
+    "locations": {
+        "columns": [
+            ("location_id", "integer"),
+            ("city_name", "text"),
+            ("location", "point"),
+        ],
+        "primary_key": ["location_id"],
+        "foreign_keys": [],
+        "indexes": [],
+        "categorical": [],
+    },
+    "user": {
+        "columns": [
+            ("user_id", "integer"),
+            ("first_name", "text"),
+            ("last_name", "text"),
+            ("email", "text"),
+            ("contact", "text"),
+            ("location_id", "integer"),
+        ],
+        "primary_key": ["user_id"],
+        "foreign_keys": [("location_id", "locations", "location_id")],
+        "indexes": [["location_id"]],
+        "categorical": [],
+    },
+    "ads": {
+        "columns": [
+            ("ad_id", "integer"),
+            ("user_id", "integer"),
+            ("title", "text"),
+            ("price", "integer"),
+            ("description", "text"),
+            ("car_id", "integer"),
+            ("date_posted", "timestamp"),
+        ],
+        "primary_key": ["ad_id"],
+        "foreign_keys": [
+            ("user_id", "user", "user_id"),
+            ("car_id", "cars", "car_id"),
+        ],
+        "indexes": [["user_id"], ["car_id"]],
+        "categorical": [],
+    },
+    "bid": {
+        "columns": [
+            ("ad_id", "integer"),
+            ("user_id", "integer"),
+            ("bid_price", "integer"),
+            ("bid_status", "text"),
+            ("datetime_bid", "timestamp"),
+        ],
+        "primary_key": [],
+        "foreign_keys": [
+            ("ad_id", "ads", "ad_id"),
+            ("user_id", "user", "user_id"),
+        ],
+        "indexes": [["ad_id"], ["user_id"]],
+        "categorical": ["bid_status"],
+    },
+}
+
+# Generic column types mapped to SQLite column types
+SQLITE_TYPES = {
+    "text": "TEXT",
+    "integer": "INTEGER",
+    "real": "REAL",
+    "timestamp": "TEXT",
+    "point": "TEXT",
+}
+
+# PRAGMAs for bulk loading; durability is traded for speed since the
+# database can always be generated again
+SQLITE_BULK_PRAGMAS = {
+    "journal_mode": "OFF",
+    "synchronous": "OFF",
+    "temp_store": "MEMORY",
+    "cache_size": -262_144,  # In KiB, i.e. 256 MiB
+    "locking_mode": "EXCLUSIVE",
+}
+
+# Rows per transaction while loading into SQLite
+SQLITE_TRANSACTION_SIZE = 500_000
+
+
+def table_headers(table: str) -> list:
+    """
+    Get the column names of a generated table.
+
+    Args:
+        table (str): The table name, e.g. "cars".
+
+    Returns:
+        list: The column names in row order.
+    """
+    return [column for column, _ in TABLE_SCHEMAS[table]["columns"]]
+
+
+def format_point(value) -> str:
+    """
+    Format a (latitude, longitude) tuple as "(latitude,longitude)".
+
+    Args:
+        value (tuple): The coordinates, or None.
+
+    Returns:
+        str: The formatted point, or None.
+    """
+    if value is None:
+        return None
+    latitude, longitude = value
+    return f"({latitude},{longitude})"
+
+
+def format_timestamp(value) -> str:
+    """
+    Format a datetime as "YYYY-MM-DD HH:MM:SS[.ffffff]".
+
+    Args:
+        value (datetime): The datetime, or None.
+
+    Returns:
+        str: The formatted timestamp, or None.
+    """
+    return None if value is None else str(value)
+
+
+def row_converter(table: str, converters: dict):
+    """
+    Build a function that converts the rows of a table for a sink.
+
+    Args:
+        table (str): The table name, e.g. "ads".
+        converters (dict): Generic column type -> conversion function.
+
+    Returns:
+        function or None: A function mapping a chunk of rows to a list of
+                          converted rows, or None when no column of the
+                          table needs converting.
+    """
+    columns = TABLE_SCHEMAS[table]["columns"]
+    convert = [converters.get(column_type) for _, column_type in columns]
+    if not any(convert):
+        return None
+
+    positions = [(i, fn) for i, fn in enumerate(convert) if fn is not None]
+
+    def convert_chunk(chunk):
+        converted = []
+        for row in chunk:
+            row = list(row)
+            for i, fn in positions:
+                row[i] = fn(row[i])
+            converted.append(row)
+        return converted
+
+    return convert_chunk
+
+
+def _quote(name: str) -> str:
+    """Quote an SQL identifier, since tables like "user" are reserved."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def create_sqlite_database(db_path: str, tables: list = None):
+    """
+    Create a SQLite database file tuned for bulk loading.
+
+    Existing tables with the same names are dropped. Tables are created
+    with their primary keys only; secondary indexes are left to
+    `create_sqlite_indexes` once the data is loaded.
+
+    Args:
+        db_path (str): The path of the SQLite database file.
+        tables (list, optional): The tables to create. Defaults to
+                                 TABLE_ORDER.
+
+    Returns:
+        sqlite3.Connection: An open connection to the database.
+    """
+    folder_path = os.path.dirname(db_path)
+    if folder_path and not os.path.exists(folder_path):
+        os.makedirs(folder_path, exist_ok=True)
+
+    connection = sqlite3.connect(db_path, isolation_level=None)
+    for pragma, value in SQLITE_BULK_PRAGMAS.items():
+        connection.execute(f"PRAGMA {pragma} = {value}")
+
+    for table in tables or TABLE_ORDER:
+        schema = TABLE_SCHEMAS[table]
+        definitions = [
+            f"{_quote(column)} {SQLITE_TYPES[column_type]}"
+            for column, column_type in schema["columns"]
+        ]
+        if schema["primary_key"]:
+            key = ", ".join(_quote(column) for column in schema["primary_key"])
+            definitions.append(f"PRIMARY KEY ({key})")
+        for column, parent, parent_column in schema["foreign_keys"]:
+            definitions.append(
+                f"FOREIGN KEY ({_quote(column)}) "
+                f"REFERENCES {_quote(parent)} ({_quote(parent_column)})"
+            )
+        connection.execute(f"DROP TABLE IF EXISTS {_quote(table)}")
+        connection.execute(f"CREATE TABLE {_quote(table)} ({', '.join(definitions)})")
+
+    return connection
+
+
+def chunks_to_sqlite(
+    chunks,
+    connection,
+    table: str,
+    transaction_size: int = SQLITE_TRANSACTION_SIZE,
+) -> int:
+    """
+    Load chunks of rows into a SQLite table with batched transactions.
+
+    Args:
+        chunks (iterable): An iterable of lists of rows, or a ColumnTable.
+        connection (sqlite3.Connection): A connection from
+                                         `create_sqlite_database`.
+        table (str): The table name, e.g. "cars".
+        transaction_size (int, optional): The number of rows per
+                                          transaction. Defaults to
+                                          SQLITE_TRANSACTION_SIZE.
+
+    Returns:
+        int: The number of rows loaded.
+    """
+    n_columns = len(TABLE_SCHEMAS[table]["columns"])
+    insert = f"INSERT INTO {_quote(table)} VALUES ({', '.join('?' * n_columns)})"
+    convert = row_converter(
+        table, {"timestamp": format_timestamp, "point": format_point}
+    )
+
+    if isinstance(chunks, ColumnTable):
+        chunks = chunks.chunks()
+
+    n_rows = 0
+    in_transaction = 0
+    connection.execute("BEGIN")
+    try:
+        for chunk in chunks:
+            connection.executemany(insert, convert(chunk) if convert else chunk)
+            n_rows += len(chunk)
+            in_transaction += len(chunk)
+            if in_transaction >= transaction_size:
+                connection.execute("COMMIT")
+                connection.execute("BEGIN")
+                in_transaction = 0
+        connection.execute("COMMIT")
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+
+    return n_rows
+
+
+def create_sqlite_indexes(connection, tables: list = None):
+    """
+    Create the secondary indexes of the loaded tables and analyze them.
+
+    Args:
+        connection (sqlite3.Connection): A connection to the database.
+        tables (list, optional): The tables to index. Defaults to
+                                 TABLE_ORDER.
+    """
+    for table in tables or TABLE_ORDER:
+        for columns in TABLE_SCHEMAS[table]["indexes"]:
+            name = _quote(f"idx_{table}_{'_'.join(columns)}")
+            key = ", ".join(_quote(column) for column in columns)
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {name} ON {_quote(table)} ({key})"
+            )
+    connection.execute("ANALYZE")
+
+
+def export_to_sqlite(table_chunks: dict, db_path: str) -> dict:
+    """
+    Load several tables into a SQLite file and index them afterwards.
+
+    Args:
+        table_chunks (dict): Table name -> list of rows, ColumnTable or
+                             iterable of chunks. Tables are loaded in
+                             TABLE_ORDER.
+        db_path (str): The path of the SQLite database file.
+
+    Returns:
+        dict: Table name -> number of rows loaded.
+    """
+    tables = [table for table in TABLE_ORDER if table in table_chunks]
+    connection = create_sqlite_database(db_path, tables)
+    try:
+        counts = {}
+        for table in tables:
+            chunks = table_chunks[table]
+            if isinstance(chunks, list):
+                chunks = [chunks]  # A whole table is a single chunk
+            counts[table] = chunks_to_sqlite(chunks, connection, table)
+        create_sqlite_indexes(connection, tables)
+    finally:
+        connection.close()
+    return counts
+
+
+# Generic column types mapped to PostgreSQL column types
+POSTGRES_TYPES = {
+    "text": "TEXT",
+    "integer": "BIGINT",
+    "real": "DOUBLE PRECISION",
+    "timestamp": "TIMESTAMP",
+    "point": "POINT",
+}
+
+# Characters that must be escaped in the COPY text format
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def format_copy_value(value) -> str:
+    """
+    Format one value for the PostgreSQL COPY text format.
+
+    Args:
+        value: The value to format. Tuples are treated as points.
+
+    Returns:
+        str: The escaped value, or "\\N" for None.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, str):
+        return value.translate(_COPY_ESCAPES)
+    if isinstance(value, tuple):
+        return format_point(value)
+    return str(value)
+
+
+def chunks_to_pg_copy(chunks, folder_path: str, filename: str) -> int:
+    """
+    Export chunks of rows to a file in the PostgreSQL COPY text format.
+
+    Args:
+        chunks (iterable): An iterable of lists of rows, or a ColumnTable.
+        folder_path (str): The path to the folder where the file will
+                           be saved.
+        filename (str): The name of the file, e.g. "cars.copy".
+
+    Returns:
+        int: The number of rows written.
+    """
+    if not os.path.exists(folder_path):
+        os.makedirs(folder_path, exist_ok=True)
+    if isinstance(chunks, ColumnTable):
+        chunks = chunks.chunks()
+
+    n_rows = 0
+    with open(
+        os.path.join(folder_path, filename), mode="w", encoding="utf-8", newline=""
+    ) as file:
+        for chunk in chunks:
+            file.write(
+                "".join(
+                    "\t".join([format_copy_value(value) for value in row]) + "\n"
+                    for row in chunk
+                )
+            )
+            n_rows += len(chunk)
+
+    return n_rows
+
+
+def pg_load_script(data_files: dict) -> str:
+    """
+    Build a psql script that loads COPY files as fast as PostgreSQL allows.
+
+    The tables are created without constraints and filled with COPY
+    FREEZE in the same transaction, in foreign key order. Primary keys,
+    foreign keys and indexes are only added once all data is in.
+
+    Args:
+        data_files (dict): Table name -> COPY file name, relative to the
+                           directory psql is started from.
+
+    Returns:
+        str: The content of the script.
+    """
+    tables = [table for table in TABLE_ORDER if table in data_files]
+
+    lines = [
+        "-- Run from the output folder: psql -v ON_ERROR_STOP=1 -f load.sql",
+        "SET synchronous_commit = off;",
+        "SET maintenance_work_mem = '1GB';",
+        "",
+        "BEGIN;",
+    ]
+    for table in reversed(tables):
+        lines.append(f"DROP TABLE IF EXISTS {_quote(table)} CASCADE;")
+    for table in tables:
+        definitions = ",\n    ".join(
+            f"{_quote(column)} {POSTGRES_TYPES[column_type]}"
+            for column, column_type in TABLE_SCHEMAS[table]["columns"]
+        )
+        lines.append(f"CREATE TABLE {_quote(table)} (\n    {definitions}\n);")
+    for table in tables:
+        path = data_files[table].replace("'", "''")
+        lines.append(
+            f"\\copy {_quote(table)} FROM '{path}' WITH (FORMAT text, FREEZE true)"
+        )
+    lines.append("COMMIT;")
+    lines.append("")
+
+    # Constraints and indexes are built once, over the loaded data
+    for table in tables:
+        primary_key = TABLE_SCHEMAS[table]["primary_key"]
+        if primary_key:
+            key = ", ".join(_quote(column) for column in primary_key)
+            lines.append(f"ALTER TABLE {_quote(table)} ADD PRIMARY KEY ({key});")
+    for table in tables:
+        for column, parent, parent_column in TABLE_SCHEMAS[table]["foreign_keys"]:
+            if parent not in data_files:
+                continue
+            name = _quote(f"fk_{table}_{column}")
+            lines.append(
+                f"ALTER TABLE {_quote(table)} ADD CONSTRAINT {name} "
+                f"FOREIGN KEY ({_quote(column)}) "
+                f"REFERENCES {_quote(parent)} ({_quote(parent_column)});"
+            )
+    for table in tables:
+        for columns in TABLE_SCHEMAS[table]["indexes"]:
+            name = _quote(f"idx_{table}_{'_'.join(columns)}")
+            key = ", ".join(_quote(column) for column in columns)
+            lines.append(f"CREATE INDEX {name} ON {_quote(table)} ({key});")
+    lines.append("ANALYZE;")
+
+    return "\n".join(lines) + "\n"
+
+
+def export_to_pg_copy(
+    table_chunks: dict, folder_path: str, script_name: str = "load.sql"
+) -> dict:
+    """
+    Write COPY files for several tables plus the psql script loading them.
+
+    Args:
+        table_chunks (dict): Table name -> list of rows or iterable of
+                             chunks.
+        folder_path (str): The folder for the COPY files and the script.
+        script_name (str, optional): The name of the load script.
+                                     Defaults to "load.sql".
+
+    Returns:
+        dict: Table name -> number of rows written.
+    """
+    counts = {}
+    data_files = {}
+    for table in [table for table in TABLE_ORDER if table in table_chunks]:
+        chunks = table_chunks[table]
+        if isinstance(chunks, list):
+            chunks = [chunks]  # A whole table is a single chunk
+        data_files[table] = f"{table}.copy"
+        counts[table] = chunks_to_pg_copy(chunks, folder_path, data_files[table])
+
+    with open(
+        os.path.join(folder_path, script_name), mode="w", encoding="utf-8"
+    ) as file:
+        file.write(pg_load_script(data_files))
+
+    return counts
+
+
+# Rows buffered per Parquet row group
+DEFAULT_ROW_GROUP_SIZE = 500_000
+
+
+def _import_pyarrow():
+    """
+    Import pyarrow, which is only needed by the columnar writers.
+
+    Returns:
+        tuple: The `pyarrow` and `pyarrow.parquet` modules.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as error:
+        raise ImportError(
+            "The Parquet and Arrow writers need pyarrow: pip install pyarrow"
+        ) from error
+    return pa, pq
+
+
+def arrow_schema(table: str):
+    """
+    Build the Arrow schema of a generated table.
+
+    Categorical columns are dictionary-encoded strings, timestamps have
+    microsecond precision and points are latitude/longitude structs.
+
+    Args:
+        table (str): The table name, e.g. "cars".
+
+    Returns:
+        pyarrow.Schema: The schema of the table.
+    """
+    pa, _ = _import_pyarrow()
+    types = {
+        "text": pa.string(),
+        "integer": pa.int64(),
+        "real": pa.float64(),
+        "timestamp": pa.timestamp("us"),
+        "point": pa.struct([("latitude", pa.float64()), ("longitude", pa.float64())]),
+    }
+    categorical = set(TABLE_SCHEMAS[table]["categorical"])
+    return pa.schema(
+        [
+            (
+                column,
+                (
+                    pa.dictionary(pa.int32(), pa.string())
+                    if column in categorical
+                    else types[column_type]
+                ),
+            )
+            for column, column_type in TABLE_SCHEMAS[table]["columns"]
+        ]
+    )
+
+
+def _column_table_batches(column_table: ColumnTable, table: str):
+    """
+    Convert a ColumnTable into Arrow record batches without building rows.
+
+    NumPy columns are handed to Arrow as they are. The distinct values of
+    every dictionary-encoded column are converted once, and each batch
+    only takes from them by code.
+
+    Args:
+        column_table (ColumnTable): The table data.
+        table (str): The table name, e.g. "cars".
+
+    Yields:
+        pyarrow.RecordBatch: One batch per ROW_CHUNK_SIZE rows.
+    """
+    pa, _ = _import_pyarrow()
+    schema = arrow_schema(table)
+    column_types = [column_type for _, column_type in TABLE_SCHEMAS[table]["columns"]]
+
+    dictionaries = {}
+    for name, column_type, field in zip(column_table.names, column_types, schema):
+        if name not in column_table.categories:
+            continue
+        values = column_table.categories[name].tolist()
+        if column_type == "point":
+            values = [
+                None if v is None else {"latitude": v[0], "longitude": v[1]}
+                for v in values
+            ]
+        if pa.types.is_dictionary(field.type):
+            dictionaries[name] = pa.array(values, field.type.value_type)
+        else:
+            dictionaries[name] = pa.array(values, field.type)
+
+    for start in range(0, len(column_table), ROW_CHUNK_SIZE):
+        window = slice(start, start + ROW_CHUNK_SIZE)
+        arrays = []
+        for name, field in zip(column_table.names, schema):
+            values = column_table.columns[name][window]
+            if name not in dictionaries:
+                arrays.append(pa.array(values, field.type))
+            elif pa.types.is_dictionary(field.type):
+                arrays.append(
+                    pa.DictionaryArray.from_arrays(
+                        pa.array(values.astype(np.int32)), dictionaries[name]
+                    )
+                )
+            else:
+                arrays.append(dictionaries[name].take(pa.array(values)))
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _record_batches(chunks, table: str):
+    """
+    Convert chunks of rows into Arrow record batches of a table.
+
+    Categorical columns share one growing dictionary across all batches,
+    so later batches only ever extend the dictionary of earlier ones.
+
+    Args:
+        chunks (iterable): An iterable of lists of rows, or a ColumnTable.
+        table (str): The table name, e.g. "cars".
+
+    Yields:
+        pyarrow.RecordBatch: One batch per non-empty chunk.
+    """
+    if isinstance(chunks, ColumnTable):
+        yield from _column_table_batches(chunks, table)
+        return
+
+    pa, _ = _import_pyarrow()
+    schema = arrow_schema(table)
+    column_types = [column_type for _, column_type in TABLE_SCHEMAS[table]["columns"]]
+    dictionaries = {
+        field.name: {} for field in schema if pa.types.is_dictionary(field.type)
+    }
+
+    for chunk in chunks:
+        if not len(chunk):
+            continue
+        arrays = []
+        for values, column_type, field in zip(zip(*chunk), column_types, schema):
+            if field.name in dictionaries:
+                codes = dictionaries[field.name]
+                indices = [
+                    None if v is None else codes.setdefault(v, len(codes))
+                    for v in values
+                ]
+                arrays.append(
+                    pa.DictionaryArray.from_arrays(
+                        pa.array(indices, pa.int32()),
+                        pa.array(list(codes), pa.string()),
+                    )
+                )
+                continue
+            if column_type == "point":
+                values = [
+                    None if v is None else {"latitude": v[0], "longitude": v[1]}
+                    for v in values
+                ]
+            arrays.append(pa.array(values, field.type))
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def chunks_to_parquet(
+    chunks,
+    folder_path: str,
+    filename: str,
+    table: str,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    compression: str = "zstd",
+) -> int:
+    """
+    Export chunks of rows to a typed Parquet file, one row group at a time.
+
+    Args:
+        chunks (iterable): An iterable of lists of rows, or a ColumnTable.
+        folder_path (str): The path to the folder where the file will
+                           be saved.
+        filename (str): The name of the file, e.g. "cars.parquet".
+        table (str): The table name, e.g. "cars".
+        row_group_size (int, optional): The number of rows per row group.
+                                        Defaults to DEFAULT_ROW_GROUP_SIZE.
+        compression (str, optional): The Parquet compression codec.
+                                     Defaults to "zstd".
+
+    Returns:
+        int: The number of rows written.
+    """
+    pa, pq = _import_pyarrow()
+
+    if not os.path.exists(folder_path):
+        os.makedirs(folder_path, exist_ok=True)
+
+    schema = arrow_schema(table)
+    n_rows = 0
+    buffered = []
+    n_buffered = 0
+    with pq.ParquetWriter(
+        os.path.join(folder_path, filename),
+        schema,
+        compression=compression,
+        use_dictionary=TABLE_SCHEMAS[table]["categorical"],
+    ) as writer:
+        for batch in _record_batches(chunks, table):
+            buffered.append(batch)
+            n_buffered += batch.num_rows
+            if n_buffered >= row_group_size:
+                writer.write_table(
+                    pa.Table.from_batches(buffered, schema),
+                    row_group_size=row_group_size,
+                )
+                n_rows += n_buffered
+                buffered = []
+                n_buffered = 0
+        if buffered:
+            writer.write_table(
+                pa.Table.from_batches(buffered, schema),
+                row_group_size=row_group_size,
+            )
+            n_rows += n_buffered
+
+    return n_rows
+
+
+def chunks_to_arrow(chunks, folder_path: str, filename: str, table: str) -> int:
+    """
+    Export chunks of rows to an Arrow IPC file, one record batch per chunk.
+
+    Args:
+        chunks (iterable): An iterable of lists of rows, or a ColumnTable.
+        folder_path (str): The path to the folder where the file will
+                           be saved.
+        filename (str): The name of the file, e.g. "cars.arrow".
+        table (str): The table name, e.g. "cars".
+
+    Returns:
+        int: The number of rows written.
+    """
+    pa, _ = _import_pyarrow()
+
+    if not os.path.exists(folder_path):
+        os.makedirs(folder_path, exist_ok=True)
+
+    n_rows = 0
+    with pa.ipc.new_file(
+        os.path.join(folder_path, filename),
+        arrow_schema(table),
+        options=pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True),
+    ) as writer:
+        for batch in _record_batches(chunks, table):
+            writer.write_batch(batch)
+            n_rows += batch.num_rows
+
+    return n_rows
+
+
+def export_to_parquet(
+    table_chunks: dict, folder_path: str, file_format: str = "parquet"
+) -> dict:
+    """
+    Write several tables as Parquet or Arrow IPC files.
+
+    Args:
+        table_chunks (dict): Table name -> list of rows, ColumnTable or
+                             iterable of chunks.
+        folder_path (str): The folder for the files.
+        file_format (str, optional): "parquet" or "arrow".
+                                     Defaults to "parquet".
+
+    Returns:
+        dict: Table name -> number of rows written.
+    """
+    writers = {"parquet": chunks_to_parquet, "arrow": chunks_to_arrow}
+    if file_format not in writers:
+        raise ValueError(f"Unknown columnar format '{file_format}'.")
+
+    counts = {}
+    for table in [table for table in TABLE_ORDER if table in table_chunks]:
+        chunks = table_chunks[table]
+        if isinstance(chunks, list):
+            chunks = [chunks]  # A whole table is a single chunk
+        counts[table] = writers[file_format](
+            chunks, folder_path, f"{table}.{file_format}", table
+        )
+    return counts
@@ -0,0 +1,134 @@
+import asyncio
+
+from columnar import ColumnTable
+
+# Chunks buffered between a generator and its writer
+DEFAULT_QUEUE_DEPTH = 4
+
+# Put into a queue after the last chunk
+_END = object()
+
+
+async def produce(chunks, queue: asyncio.Queue):
+    """
+    Push the chunks of a blocking iterable into a bounded queue.
+
+    Every chunk is generated in a worker thread, so the event loop keeps
+    serving the sinks meanwhile. When the queue is full, the producer
+    waits until its sink has taken a chunk, so a slow sink holds back
+    generation instead of letting chunks pile up in memory.
+
+    Args:
+        chunks (iterable): The chunks, e.g. an `iter_*` generator.
+        queue (asyncio.Queue): The queue, followed by an end marker once
+                               the chunks are exhausted or fail.
+    """
+    iterator = iter(chunks)
+    try:
+        while True:
+            chunk = await asyncio.to_thread(next, iterator, _END)
+            if chunk is _END:
+                break
+            await queue.put(chunk)
+    except Exception:
+        await queue.put(_END)  # Let the sink finish, then report the error
+        raise
+    await queue.put(_END)
+
+
+def queue_chunks(queue: asyncio.Queue, loop: asyncio.AbstractEventLoop):
+    """
+    Iterate over the chunks of a queue from a thread outside the event loop.
+
+    Args:
+        queue (asyncio.Queue): A queue filled by `produce`.
+        loop (asyncio.AbstractEventLoop): The event loop of the queue.
+
+    Yields:
+        list: The chunks, in order.
+    """
+    while True:
+        chunk = asyncio.run_coroutine_threadsafe(queue.get(), loop).result()
+        if chunk is _END:
+            return
+        yield chunk
+
+
+def stream(chunks, write, *args, depth: int = DEFAULT_QUEUE_DEPTH, **kwargs):
+    """
+    Generate and write a table concurrently, through a bounded queue.
+
+    The generator and the writer run in separate threads, driven by one
+    event loop, so generation overlaps with the formatting, compression,
+    file and database I/O of the writer. At most `depth` chunks wait
+    between them.
+
+    Args:
+        chunks (iterable): The chunks, e.g. an `iter_*` generator.
+        write (function): A blocking writer that takes the chunks as its
+                          first argument, e.g. `chunks_to_csv`.
+        *args: More positional arguments of `write`.
+        depth (int, optional): The queue size, in chunks. Defaults to
+                               DEFAULT_QUEUE_DEPTH.
+        **kwargs: Keyword arguments of `write`.
+
+    Returns:
+        The result of `write`.
+    """
+
+    async def run():
+        queue = asyncio.Queue(maxsize=depth)
+        loop = asyncio.get_running_loop()
+        _, result = await asyncio.gather(
+            produce(chunks, queue),
+            asyncio.to_thread(write, queue_chunks(queue, loop), *args, **kwargs),
+        )
+        return result
+
+    return asyncio.run(run())
+
+
+def stream_tables(
+    table_chunks: dict, write, *args, depth: int = DEFAULT_QUEUE_DEPTH, **kwargs
+):
+    """
+    Generate several tables concurrently into a writer that takes them all.
+
+    Every table given as chunks gets its own producer and bounded queue,
+    and tables that are already in memory are passed on as they are.
+    A writer that loads the tables one after the other, such as
+    `export_to_sqlite`, then finds the first chunks of the next table
+    ready, while the producers of the tables further down wait on their
+    full queues.
+
+    Args:
+        table_chunks (dict): Table name -> list of rows, ColumnTable or
+                             iterable of chunks.
+        write (function): A blocking writer that takes the tables as its
+                          first argument, e.g. `export_to_sqlite`.
+        *args: More positional arguments of `write`.
+        depth (int, optional): The size of every queue, in chunks.
+                               Defaults to DEFAULT_QUEUE_DEPTH.
+        **kwargs: Keyword arguments of `write`.
+
+    Returns:
+        The result of `write`.
+    """
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        producers = []
+        tables = {}
+        for table, chunks in table_chunks.items():
+            if isinstance(chunks, (list, ColumnTable)):
+                tables[table] = chunks
+                continue
+            queue = asyncio.Queue(maxsize=depth)
+            producers.append(produce(chunks, queue))
+            tables[table] = queue_chunks(queue, loop)
+        *_, result = await asyncio.gather(
+            *producers, asyncio.to_thread(write, tables, *args, **kwargs)
+        )
+        return result
+
+    return asyncio.run(run())
@@ -0,0 +1,91 @@
+import numpy as np
+
+from columnar import ColumnTable, table_codes, table_column, take
+
+NAMES = ["car_id", "model_id", "odometer", "details"]
+ROWS = [
+    (1, "CM-001", 12_000, "Mulus"),
+    (2, "CM-002", 0, None),
+    (3, "CM-001", 45_500, "Mulus"),
+    (4, "CM-003", 7, "Jarang pakai"),
+]
+
+
+def test_from_rows_round_trip():
+    table = ColumnTable.from_rows(ROWS, NAMES)
+
+    assert len(table) == len(ROWS)
+    assert table.names == NAMES
+    assert list(table) == ROWS
+    assert table[0] == ROWS[0]
+    assert table[-1] == ROWS[-1]
+
+
+def test_object_columns_are_dictionary_encoded():
+    table = ColumnTable.from_rows(ROWS, NAMES)
+
+    assert "model_id" in table.categories
+    assert len(table.categories["model_id"]) == 3
+    assert table.columns["model_id"].dtype.itemsize == 1
+    assert table.column("model_id").tolist() == [row[1] for row in ROWS]
+
+
+def test_chunks_match_rows():
+    table = ColumnTable.from_rows(ROWS, NAMES)
+
+    chunks = list(table.chunks(chunk_size=3))
+
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+    assert [row for chunk in chunks for row in chunk] == ROWS
+
+
+def test_from_column_chunks_without_chunks_keeps_columns():
+    table = ColumnTable.from_column_chunks([], NAMES)
+
+    assert len(table) == 0
+    assert table.names == NAMES
+
+
+def test_concat_merges_dictionaries():
+    first = ColumnTable.from_rows(ROWS[:2], NAMES)
+    second = ColumnTable.from_rows(ROWS[2:], NAMES)
+
+    table = ColumnTable.concat([first, second])
+
+    assert list(table) == ROWS
+    assert sorted(table.categories["model_id"]) == ["CM-001", "CM-002", "CM-003"]
+
+
+def test_concat_skips_empty_tables():
+    empty = ColumnTable.from_column_chunks([], NAMES)
+    table = ColumnTable.from_rows(ROWS, NAMES)
+
+    assert list(ColumnTable.concat([empty, table, empty])) == ROWS
+    assert len(ColumnTable.concat([])) == 0
+
+
+def test_concat_decodes_mixed_columns():
+    # Numbers arrive as objects in one shard and as integers in the other
+    encoded = ColumnTable.from_column_chunks([{"price": [10, 20]}])
+    plain = ColumnTable({"price": np.array([30, 40])})
+
+    table = ColumnTable.concat([encoded, plain])
+
+    assert table.column("price").tolist() == [10, 20, 30, 40]
+
+
+def test_table_column_and_codes_agree_for_rows_and_tables():
+    table = ColumnTable.from_rows(ROWS, NAMES)
+
+    for source in (ROWS, table):
+        assert table_column(source, 0).tolist() == [1, 2, 3, 4]
+        codes, values = table_codes(source, 1)
+        assert values[codes].tolist() == [row[1] for row in ROWS]
+
+
+def test_take_from_array_and_range():
+    positions = np.array([0, 2, 3])
+
+    assert take(np.array([5, 6, 7, 8]), positions).tolist() == [5, 7, 8]
+    assert take(range(10, 20), positions).tolist() == [10, 12, 13]
+    assert take(range(10, 20, 5), positions).tolist() == [10, 20, 25]
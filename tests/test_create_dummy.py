@@ -0,0 +1,83 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import create_dummy as cd
+import main
+from conftest import ROOT
+
+FIRST_NAMES = ["Adi", "Budi", "Citra"]
+LAST_NAMES = ["Putra", "Sari"]
+
+
+@pytest.fixture
+def small_pools(monkeypatch):
+    monkeypatch.setattr(cd, "name_pools", lambda: (FIRST_NAMES, LAST_NAMES))
+    return len(FIRST_NAMES) * len(LAST_NAMES)
+
+
+def test_names_are_unique_past_capacity(small_pools):
+    names = cd.generate_name(4 * small_pools, key=7)
+
+    assert len(set(names)) == len(names)
+    combinations = {f"{first} {last}" for first in FIRST_NAMES for last in LAST_NAMES}
+    assert set(names[:small_pools]) == combinations
+    assert all(name.endswith("2") for name in names[small_pools : 2 * small_pools])
+
+
+def test_names_continue_one_sequence(small_pools):
+    names = cd.generate_name(15, key=7)
+
+    assert cd.generate_name(9, key=7) + cd.generate_name(6, 9, key=7) == names
+    assert cd.generate_name(15, key=8) != names
+
+
+def test_capacity_is_reported_once(tmp_path, small_pools, capsys):
+    main.main(
+        [
+            "-t",
+            "user",
+            "--users",
+            "20",
+            "--chunk-size",
+            "4",
+            "-o",
+            str(tmp_path),
+            "--locations",
+            os.path.join(ROOT, "city.xlsx"),
+        ]
+    )
+
+    assert capsys.readouterr().out.count("first/last name combinations") == 1
+
+
+def test_capacity_is_reported_by_the_generator(small_pools, capsys):
+    cd.generate_name(small_pools, key=7)
+    assert "first/last name combinations" not in capsys.readouterr().out
+
+    for start in range(0, 4 * small_pools, 4):
+        cd.generate_name(4, start, key=7)
+    assert capsys.readouterr().out.count("first/last name combinations") == 1
+
+
+@pytest.mark.parametrize("extension", ["csv", "csv.gz", "csv.zst"])
+def test_text_output_is_utf8_whatever_the_locale(tmp_path, extension):
+    if extension.endswith(".zst"):
+        pytest.importorskip("zstandard")
+    file_path = str(tmp_path / f"text.{extension}")
+    # Fails on any text file opened with the locale's default encoding
+    script = (
+        "import create_dummy as cd\n"
+        f"with cd.open_text_output({file_path!r}) as file:\n"
+        "    file.write('Kota Bekasi \u2013 \u00e9\\n')\n"
+    )
+    subprocess.run(
+        [sys.executable, "-X", "warn_default_encoding", "-W", "error", "-c", script],
+        cwd=ROOT,
+        check=True,
+    )
+
+    with cd.open_text_input(file_path) as file:
+        assert file.read() == "Kota Bekasi \u2013 \u00e9\n"
@@ -0,0 +1,94 @@
+import csv
+import os
+
+import pytest
+
+import main
+from conftest import ROOT
+from create_dummy import chunks_to_csv, open_text_input
+from incremental import existing_state, read_csv_tail
+
+FORMATS = ["csv", "csv.gz", "csv.zst"]
+
+
+def needs_compression(extension):
+    if extension.endswith(".zst"):
+        pytest.importorskip("zstandard")
+
+
+def write_users(folder, extension, n_rows):
+    needs_compression(extension)
+    rows = [
+        (user_id, f"First {user_id}", "Last", "a@b.c", "0812", 1)
+        for user_id in range(1, n_rows + 1)
+    ]
+    headers = ["user_id", "first_name", "last_name", "email", "contact", "location_id"]
+    chunks_to_csv([rows], folder, f"user.{extension}", headers)
+    return [[str(value) for value in row] for row in rows]
+
+
+def read_csv(file_path):
+    with open_text_input(file_path) as file:
+        return list(csv.reader(file))
+
+
+@pytest.mark.parametrize("extension", FORMATS)
+def test_read_csv_tail(tmp_path, extension):
+    rows = write_users(str(tmp_path), extension, 50)
+    file_path = str(tmp_path / f"user.{extension}")
+
+    assert read_csv_tail(file_path, 3) == rows[-3:]
+    assert read_csv_tail(file_path, 500) == rows
+    assert read_csv_tail(file_path, 0) == []
+
+
+def test_read_csv_tail_across_blocks(tmp_path):
+    # Larger than the 1 MiB blocks read from the end of plain files
+    rows = write_users(str(tmp_path), "csv", 40_000)
+
+    assert read_csv_tail(str(tmp_path / "user.csv"), 25_000) == rows[-25_000:]
+
+
+@pytest.mark.parametrize("extension", FORMATS)
+def test_existing_state(tmp_path, extension):
+    write_users(str(tmp_path), extension, 30)
+
+    state = existing_state(str(tmp_path), extension, ["ads"], ["user"], 10)
+
+    assert state["ads"] == {"max_id": 0, "rows": []}
+    assert state["user"]["max_id"] == 30
+    user_ids = [row[0] for row in state["user"]["rows"]]
+    assert len(user_ids) == 10
+    assert user_ids == sorted(user_ids)
+    assert set(user_ids) <= set(range(1, 31))
+
+
+@pytest.mark.parametrize("extension", FORMATS)
+def test_append_continues_ids(tmp_path, capsys, extension):
+    needs_compression(extension)
+    output = str(tmp_path)
+    common = ["-o", output, "-f", extension, "--seed", "3"]
+    common += ["--locations", os.path.join(ROOT, "city.xlsx")]
+
+    counts = ["--cars", "10", "--users", "40", "--ads", "30"]
+    main.main(["-t", "cars", "user", "ads", *counts, *common])
+    ads_path = os.path.join(output, f"ads.{extension}")
+    size_before = os.path.getsize(ads_path)
+    capsys.readouterr()
+    counts = ["--users", "5", "--ads", "20"]
+    main.main(["-t", "user", "ads", *counts, "-a", *common])
+
+    # The report counts the appended rows and bytes only
+    report = capsys.readouterr().out
+    line = next(line for line in report.splitlines() if f" ads.{extension} " in line)
+    _, _, rows, n_bytes, *_ = (field.strip() for field in line.split("|"))
+    assert (int(rows), int(n_bytes)) == (20, os.path.getsize(ads_path) - size_before)
+
+    users = read_csv(os.path.join(output, f"user.{extension}"))
+    ads = read_csv(os.path.join(output, f"ads.{extension}"))
+    assert users[0][0] == "user_id" and ads[0][0] == "ad_id"
+    assert [int(row[0]) for row in users[1:]] == list(range(1, 46))
+    assert [int(row[0]) for row in ads[1:]] == list(range(1, 51))
+    assert {int(row[1]) for row in ads[1:]} <= set(range(1, 46))
+    assert {int(row[5]) for row in ads[1:]} <= set(range(1, 11))
+    assert len({(row[1], row[2]) for row in users[1:]}) == 45
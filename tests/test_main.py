@@ -0,0 +1,46 @@
+import csv
+import os
+
+import pytest
+
+from conftest import ROOT
+from main import main, parse_args
+
+
+def distinct_texts(folder):
+    with open(os.path.join(folder, "ads.csv"), encoding="utf-8") as file:
+        ads = list(csv.reader(file))[1:]
+    return len({ad[2] for ad in ads}), len({ad[4] for ad in ads})
+
+
+@pytest.mark.parametrize("size", [0, 5])
+def test_text_pool_caps_distinct_texts(tmp_path, size):
+    main(
+        [
+            "-t",
+            "ads",
+            "--cars",
+            "20",
+            "--users",
+            "20",
+            "--ads",
+            "200",
+            "--text-pool",
+            str(size),
+            "-o",
+            str(tmp_path),
+            "--locations",
+            os.path.join(ROOT, "city.xlsx"),
+        ]
+    )
+
+    titles, descriptions = distinct_texts(tmp_path)
+    if size:
+        assert titles <= size and descriptions <= size
+    else:
+        assert descriptions == 200
+
+
+def test_negative_text_pool_is_a_usage_error():
+    with pytest.raises(SystemExit):
+        parse_args(["--text-pool", "-1"])
@@ -0,0 +1,130 @@
+import csv
+import os
+import random
+
+import pytest
+
+import create_dummy as cd
+import parallel
+from conftest import ROOT
+from main import car_data, main
+
+# Columns that depend on the time of the run
+DATE_COLUMNS = {"ads": 6, "bid": 4}
+
+
+@pytest.fixture
+def small_shards(monkeypatch):
+    monkeypatch.setattr(parallel, "DEFAULT_SHARD_SIZE", 25)
+
+
+def test_shard_plan_covers_the_ids():
+    plan = parallel.shard_plan(103, seed=1, n_shards=4, start_id=11)
+
+    assert [size for size, _, _ in plan] == [26, 26, 26, 25]
+    assert [start for _, start, _ in plan] == [11, 37, 63, 89]
+    assert len({seed for _, _, seed in plan}) == 4
+    assert plan == parallel.shard_plan(103, seed=1, n_shards=4, start_id=11)
+    assert plan != parallel.shard_plan(103, seed=2, n_shards=4, start_id=11)
+
+
+@pytest.fixture
+def ad_context():
+    body_types = cd.generate_body_types(car_data, is_printed=False)
+    manufactures = cd.generate_manufactures(car_data, is_printed=False)
+    car_models = cd.generate_car_models(car_data, manufactures, is_printed=False)
+    catalog = cd.build_catalog(car_data, manufactures, body_types, car_models)
+    random.seed(4)
+    cars = cd.generate_cars(
+        car_data, manufactures, body_types, car_models, 40, False, catalog=catalog
+    )
+    users = [(user_id,) for user_id in range(1, 11)]
+    return {
+        "data": car_data,
+        "catalog": catalog,
+        "customer_table": users,
+        "cars_table": cars,
+        "chunk_size": 10,
+    }
+
+
+def test_ads_stay_dense_when_cars_cannot_be_advertised(ad_context, small_shards):
+    # Cars of a model outside the catalog have no price to advertise
+    ad_context["cars_table"] = [
+        car[:2] + ("CM-999",) + car[3:] if car[0] % 3 == 0 else car
+        for car in ad_context["cars_table"]
+    ]
+
+    chunks = parallel.iter_shards("ads", 80, ad_context, seed=9, start_id=5)
+    ads = [row for chunk in chunks for row in chunk]
+
+    assert [ad[0] for ad in ads] == list(range(5, 85))
+    assert all(ad[5] % 3 for ad in ads)
+
+
+def test_ads_need_a_car_with_a_price(ad_context):
+    ad_context["cars_table"] = [
+        car[:2] + ("CM-999",) + car[3:] for car in ad_context["cars_table"]
+    ]
+
+    with pytest.raises(ValueError, match="at least one car"):
+        next(parallel.shard_chunks("ads", 10, 1, ad_context))
+
+
+def read_tables(folder):
+    tables = {}
+    for table in ("cars", "user", "ads", "bid"):
+        with open(os.path.join(folder, f"{table}.csv"), encoding="utf-8") as file:
+            rows = list(csv.reader(file))
+        skip = DATE_COLUMNS.get(table)
+        if skip is not None:
+            rows = [row[:skip] + row[skip + 1 :] for row in rows]
+        tables[table] = rows
+    return tables
+
+
+def generate(folder, seed, *options):
+    main(
+        [
+            "-t",
+            "cars",
+            "user",
+            "ads",
+            "bid",
+            "--cars",
+            "60",
+            "--users",
+            "70",
+            "--ads",
+            "80",
+            "--bids",
+            "90",
+            "--chunk-size",
+            "10",
+            "--seed",
+            str(seed),
+            "-o",
+            str(folder),
+            "--locations",
+            os.path.join(ROOT, "city.xlsx"),
+            *options,
+        ]
+    )
+    return read_tables(folder)
+
+
+def test_seeded_runs_repeat(tmp_path, small_shards):
+    first = generate(tmp_path / "first", 5)
+
+    assert generate(tmp_path / "again", 5) == first
+    assert generate(tmp_path / "other", 6)["cars"] != first["cars"]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [["-w", "2"], ["--columnar"], ["--out-of-core"], ["-w", "2", "--out-of-core"]],
+)
+def test_seeded_output_does_not_depend_on_the_options(tmp_path, small_shards, options):
+    expected = generate(tmp_path / "expected", 5)
+
+    assert generate(tmp_path / "actual", 5, *options) == expected
@@ -0,0 +1,33 @@
+from collections import Counter
+
+from profiling import new_trace, stage, timed_chunks
+
+
+def test_serial_stages_record_their_own_faker_calls():
+    calls = Counter()
+    trace = new_trace(calls)
+
+    with stage(trace, "text_pool") as record:
+        calls["paragraph"] += 3
+        record["rows"] = 3
+    chunks = list(timed_chunks(trace, "user", iter([[1, 2], [3]])))
+
+    assert chunks == [[1, 2], [3]]
+    first, second = trace["stages"]
+    assert first["faker_calls"] == {"paragraph": 3}
+    assert second["rows"] == 3 and second["faker_calls"] == {}
+    assert "peak_rss_mb" in first
+
+
+def test_concurrent_stages_leave_shared_numbers_out():
+    calls = Counter()
+    trace = new_trace(calls, concurrent=True)
+
+    with stage(trace, "locations") as record:
+        calls["city"] += 1
+        record["rows"] = 1
+
+    (record,) = trace["stages"]
+    assert "faker_calls" not in record
+    assert "peak_rss_mb" not in record
+    assert record["rows"] == 1
@@ -0,0 +1,105 @@
+import os
+import pickle
+import random
+
+import numpy as np
+
+import create_dummy as cd
+import main
+import parallel
+from sidecars import open_sidecar, sidecar_chunks, write_sidecar
+
+CARS = [
+    (1, "MF-001", "CM-001", "BT-001", 2018, 1.5, 5, "manual", "bensin", "FWD", 1, ""),
+    (2, "MF-001", "CM-002", "BT-001", 2019, 1.5, 5, "manual", "bensin", "FWD", 2, ""),
+    (3, "MF-002", "CM-001", "BT-002", 2020, 2.0, 7, "manual", "diesel", "RWD", 3, ""),
+]
+
+
+def test_view_of_dense_ids(tmp_path):
+    folder = str(tmp_path)
+
+    assert write_sidecar([CARS[:2], CARS[2:]], folder, "cars") == 3
+    view = open_sidecar(folder, "cars")
+
+    assert view["car_id"] == range(1, 4)
+    assert isinstance(view["model_id"], np.memmap)
+    assert not view["model_id"].flags.writeable
+    models = view["categories"]["model_id"][view["model_id"]]
+    assert models.tolist() == ["CM-001", "CM-002", "CM-001"]
+    assert not os.path.exists(os.path.join(folder, "cars.car_id.npy"))
+
+
+def test_view_keeps_ids_with_gaps(tmp_path):
+    folder = str(tmp_path)
+    rows = [(5, 10, "a"), (6, 11, "b"), (9, 12, "c")]
+    users = [(user_id, "", "", "", "", location) for user_id, location, _ in rows]
+
+    write_sidecar([users], folder, "user", start_id=5)
+    view = open_sidecar(folder, "user")
+
+    assert isinstance(view["user_id"], np.memmap)
+    assert view["user_id"].tolist() == [5, 6, 9]
+    assert view["location_id"].tolist() == [10, 11, 12]
+
+
+def test_sidecar_chunks_pass_chunks_on(tmp_path):
+    chunks = [CARS[:1], CARS[1:]]
+
+    assert list(sidecar_chunks(iter(chunks), str(tmp_path), "cars")) == chunks
+
+
+def test_ads_from_views_match_ads_from_rows(tmp_path):
+    folder = str(tmp_path)
+    data = main.car_data
+    body_types = cd.generate_body_types(data, is_printed=False)
+    manufactures = cd.generate_manufactures(data, is_printed=False)
+    car_models = cd.generate_car_models(data, manufactures, is_printed=False)
+    catalog = cd.build_catalog(data, manufactures, body_types, car_models)
+    locations = cd.generate_locations(
+        {1: {"nama_kota": "Kota", "latitude": -6.2, "longitude": 106.8}},
+        is_printed=False,
+    )
+    random.seed(1)
+    text_pool = cd.build_text_pool(n_paragraphs=20, n_titles=20)
+    cars = cd.generate_cars(
+        data, manufactures, body_types, car_models, 50, False, catalog=catalog
+    )
+    users = cd.generate_customer(locations, 20, is_printed=False)
+    write_sidecar([cars], folder, "cars")
+    write_sidecar([users], folder, "user")
+
+    def ads(customer_table, cars_table):
+        random.seed(2)
+        chunks = cd.iter_advertisement(
+            data,
+            customer_table,
+            cars_table,
+            car_models,
+            200,
+            catalog=catalog,
+            text_pool=text_pool,
+        )
+        return [row for chunk in chunks for row in chunk]
+
+    from_rows = ads(users, cars)
+    from_views = ads(open_sidecar(folder, "user"), open_sidecar(folder, "cars"))
+
+    # Dates depend on the time of the run
+    assert [row[:6] for row in from_views] == [row[:6] for row in from_rows]
+
+
+def test_workers_receive_locations_only(tmp_path):
+    folder = str(tmp_path)
+    write_sidecar([CARS], folder, "cars")
+    shared = {"cars_table": open_sidecar(folder, "cars"), "chunk_size": 10}
+
+    locations = parallel._sidecar_locations(shared)
+    assert locations["cars_table"] == {"sidecar": (folder, "cars")}
+    assert len(pickle.dumps(locations)) < 200
+
+    parallel._init_worker(locations)
+    view = parallel._shared["cars_table"]
+    assert view["car_id"] == range(1, 4)
+    assert isinstance(view["model_id"], np.memmap)
+    assert parallel._shared["chunk_size"] == 10
@@ -0,0 +1,131 @@
+from datetime import datetime
+
+import pytest
+
+from columnar import ColumnTable
+from sinks import (
+    chunks_to_arrow,
+    chunks_to_parquet,
+    chunks_to_pg_copy,
+    chunks_to_sqlite,
+    create_sqlite_database,
+    table_headers,
+)
+
+LOCATIONS = [
+    (1, "Kota Jakarta", (-6.2, 106.8)),
+    (2, "Kota Bandung", None),
+]
+BIDS = [
+    (1, 2, 150_000_000, "approved", datetime(2024, 5, 1, 8, 30, 0, 250_000)),
+    (1, 3, 155_000_000, "rejected", datetime(2024, 5, 2, 9, 0)),
+    (2, 2, 90_000_000, "approved", None),
+]
+
+
+def test_sqlite_reads_back(tmp_path):
+    connection = create_sqlite_database(str(tmp_path / "cars.db"), ["locations", "bid"])
+
+    assert (
+        chunks_to_sqlite([LOCATIONS[:1], LOCATIONS[1:]], connection, "locations") == 2
+    )
+    table = ColumnTable.from_rows(BIDS, table_headers("bid"))
+    assert chunks_to_sqlite(table, connection, "bid", transaction_size=2) == 3
+
+    assert connection.execute('SELECT * FROM "locations"').fetchall() == [
+        (1, "Kota Jakarta", "(-6.2,106.8)"),
+        (2, "Kota Bandung", None),
+    ]
+    assert connection.execute('SELECT * FROM "bid"').fetchall() == [
+        (1, 2, 150_000_000, "approved", "2024-05-01 08:30:00.250000"),
+        (1, 3, 155_000_000, "rejected", "2024-05-02 09:00:00"),
+        (2, 2, 90_000_000, "approved", None),
+    ]
+    connection.close()
+
+
+def test_sqlite_rolls_back_failed_chunks(tmp_path):
+    connection = create_sqlite_database(str(tmp_path / "cars.db"), ["locations"])
+
+    def chunks():
+        yield LOCATIONS
+        raise RuntimeError("generator failed")
+
+    with pytest.raises(RuntimeError):
+        chunks_to_sqlite(chunks(), connection, "locations")
+    assert connection.execute('SELECT COUNT(*) FROM "locations"').fetchone() == (0,)
+    connection.close()
+
+
+def read_copy(file_path):
+    """Parse a COPY text file the way PostgreSQL reads it."""
+    unescape = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+    rows = []
+    with open(file_path, encoding="utf-8", newline="") as file:
+        for line in file.read().split("\n")[:-1]:
+            row = []
+            for field in line.split("\t"):
+                if field == "\\N":
+                    row.append(None)
+                    continue
+                value, escaped = "", False
+                for char in field:
+                    if escaped:
+                        value += unescape[char]
+                        escaped = False
+                    elif char == "\\":
+                        escaped = True
+                    else:
+                        value += char
+                row.append(value)
+            rows.append(row)
+    return rows
+
+
+def test_pg_copy_reads_back(tmp_path):
+    ads = [
+        (1, 2, "Dijual\tcepat", 100, "Baris satu\nbaris dua\\", 3, None),
+        (2, 2, "Mulus", 200, "", 4, datetime(2024, 5, 1, 8, 30)),
+    ]
+
+    assert chunks_to_pg_copy([ads[:1], ads[1:]], str(tmp_path), "ads.copy") == 2
+    assert chunks_to_pg_copy([LOCATIONS], str(tmp_path), "locations.copy") == 2
+
+    assert read_copy(tmp_path / "ads.copy") == [
+        ["1", "2", "Dijual\tcepat", "100", "Baris satu\nbaris dua\\", "3", None],
+        ["2", "2", "Mulus", "200", "", "4", "2024-05-01 08:30:00"],
+    ]
+    assert read_copy(tmp_path / "locations.copy") == [
+        ["1", "Kota Jakarta", "(-6.2,106.8)"],
+        ["2", "Kota Bandung", None],
+    ]
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+@pytest.mark.parametrize("columnar", [False, True])
+def test_columnar_formats_read_back(tmp_path, file_format, columnar):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    folder = str(tmp_path)
+    bids = ColumnTable.from_rows(BIDS, table_headers("bid")) if columnar else [BIDS]
+    filename = f"bid.{file_format}"
+
+    if file_format == "parquet":
+        assert chunks_to_parquet(bids, folder, filename, "bid", row_group_size=2) == 3
+        chunks_to_parquet([LOCATIONS], folder, "locations.parquet", "locations")
+        bid = pq.read_table(tmp_path / filename)
+        locations = pq.read_table(tmp_path / "locations.parquet")
+    else:
+        assert chunks_to_arrow(bids, folder, filename, "bid") == 3
+        chunks_to_arrow([LOCATIONS], folder, "locations.arrow", "locations")
+        bid = pa.ipc.open_file(str(tmp_path / filename)).read_all()
+        locations = pa.ipc.open_file(str(tmp_path / "locations.arrow")).read_all()
+
+    assert bid.column_names == table_headers("bid")
+    assert pa.types.is_dictionary(bid.schema.field("bid_status").type)
+    assert pa.types.is_timestamp(bid.schema.field("datetime_bid").type)
+    assert [tuple(row.values()) for row in bid.to_pylist()] == BIDS
+    assert locations.column("location").to_pylist() == [
+        {"latitude": -6.2, "longitude": 106.8},
+        None,
+    ]
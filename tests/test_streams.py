@@ -0,0 +1,73 @@
+import itertools
+
+import pytest
+
+from columnar import ColumnTable
+from streams import stream, stream_tables
+
+CHUNKS = [[(i, f"row {i}")] for i in range(10)]
+
+
+def collect(chunks, label=None):
+    rows = [row for chunk in chunks for row in chunk]
+    return rows if label is None else (label, rows)
+
+
+def test_stream_returns_the_writer_result():
+    assert stream(iter(CHUNKS), collect, "bid", depth=2) == (
+        "bid",
+        [row for chunk in CHUNKS for row in chunk],
+    )
+
+
+def test_generator_errors_reach_the_caller():
+    def chunks():
+        yield from CHUNKS[:3]
+        raise ValueError("generator failed")
+
+    with pytest.raises(ValueError, match="generator failed"):
+        stream(chunks(), collect, depth=1)
+
+
+def test_writer_errors_stop_an_endless_generator():
+    def write(chunks):
+        for index, _ in enumerate(chunks):
+            if index == 2:
+                raise OSError("disk full")
+
+    with pytest.raises(OSError, match="disk full"):
+        stream(([i] for i in itertools.count()), write, depth=2)
+
+
+def test_generation_waits_for_the_writer():
+    generated = []
+    leads = []
+
+    def chunks():
+        for chunk in CHUNKS:
+            generated.append(chunk)
+            yield chunk
+
+    def write(chunks):
+        for index, _ in enumerate(chunks):
+            leads.append(len(generated) - (index + 1))
+
+    stream(chunks(), write, depth=2)
+
+    # The queue, plus one chunk waiting to be put into it
+    assert max(leads) <= 3
+
+
+def test_stream_tables_passes_tables_in_memory_on():
+    rows = [(1, "a"), (2, "b")]
+    cars = ColumnTable.from_rows(rows, ["car_id", "name"])
+    tables = {"user": rows, "cars": cars, "ads": iter(CHUNKS)}
+
+    def write(tables):
+        return {**tables, "ads": collect(tables["ads"])}
+
+    written = stream_tables(tables, write, depth=1)
+
+    assert written["user"] is rows
+    assert written["cars"] is cars
+    assert written["ads"] == [row for chunk in CHUNKS for row in chunk]